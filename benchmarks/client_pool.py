@@ -0,0 +1,136 @@
+"""
+Drives a ClientPool of many clients against a local stand-in server in the same process.
+
+Every client connects, receives a RoomInfo, logs in with a Connect answered by a Connected and then sends
+Say packets, which the server answers with a PrintJSON. Reports the time until all clients are connected,
+the throughput of the chat round trips and the event loop lag while the clients are busy.
+
+Usage: python benchmarks/client_pool.py [--clients N] [--messages N] [--max-handshakes N] [--stagger SECONDS]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import time
+
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client, enums, packets, structs
+from archipelagopy.pool import ClientPool
+
+ROOM_INFO: str = json.dumps([{
+    "cmd": "RoomInfo", "version": {"major": 0, "minor": 6, "build": 2, "class": "Version"},
+    "generator_version": {"major": 0, "minor": 6, "build": 2, "class": "Version"}, "tags": ["AP"],
+    "password": False, "permissions": {"release": 2, "collect": 2, "remaining": 2}, "hint_cost": 10,
+    "location_check_points": 1, "games": ["Clique"], "datapackage_checksums": {}, "seed_name": "1", "time": 0.0,
+}])
+
+CONNECTED: str = json.dumps([{
+    "cmd": "Connected", "team": 0, "slot": 1, "players": [], "missing_locations": [], "checked_locations": [],
+    "slot_data": {}, "slot_info": {}, "hint_points": 0,
+}])
+
+
+async def server_handler(ws: ServerConnection):
+    await ws.send(ROOM_INFO)
+
+    async for frame in ws:
+        for packet in json.loads(frame):
+            if packet["cmd"] == "Connect":
+                await ws.send(CONNECTED)
+            elif packet["cmd"] == "Say":
+                await ws.send(json.dumps([{"cmd": "PrintJSON", "data": [{"text": packet["text"]}]}]))
+
+
+class BenchmarkClient(Client):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connected: asyncio.Event = asyncio.Event()
+        self.replies: int = 0
+        self.all_replies: asyncio.Event = asyncio.Event()
+        self.expected_replies: int = 0
+
+    async def on_room_info(self, packet: packets.RoomInfo):
+        await self.send(packets.Connect(
+            version=structs.Version(major=0, minor=6, build=2), name="Player1",
+            items_handling=enums.ItemHandlingFlag.NONE,
+        ))
+
+    async def on_connected(self, packet: packets.Connected):
+        self.connected.set()
+
+    async def on_print_json(self, packet: packets.PrintJSON):
+        self.replies += 1
+        if self.replies >= self.expected_replies:
+            self.all_replies.set()
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    max_lag: float = 0.0
+
+    while not stop.is_set():
+        start: float = loop.time()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, loop.time() - start - interval)
+
+    return max_lag
+
+
+async def run(clients: int, messages: int, max_handshakes: int, stagger: float):
+    async with serve(server_handler, "localhost", 0, max_queue=None) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+
+        pool = ClientPool(max_handshakes=max_handshakes, handshake_stagger=stagger)
+        client_list: list[BenchmarkClient] = [
+            pool.create(BenchmarkClient, port, host="localhost", secure=False) for _ in range(clients)
+        ]
+
+        start: float = time.perf_counter()
+        async with pool:
+            await asyncio.gather(*(client.connected.wait() for client in client_list))
+            connect_time: float = time.perf_counter() - start
+            print(f"connected {clients} clients in {connect_time:.2f}s ({clients / connect_time:.0f} clients/s)")
+
+            stop_lag = asyncio.Event()
+            lag_task: asyncio.Task = asyncio.create_task(measure_lag(stop_lag))
+
+            start = time.perf_counter()
+            for client in client_list:
+                client.expected_replies = messages
+
+            for i in range(messages):
+                for client in client_list:
+                    await client.send(packets.Say(text=f"message {i}"))
+
+            await asyncio.gather(*(client.all_replies.wait() for client in client_list))
+            elapsed: float = time.perf_counter() - start
+
+            stop_lag.set()
+            max_lag: float = await lag_task
+
+            round_trips: int = clients * messages
+            print(f"{round_trips} round trips in {elapsed:.2f}s ({round_trips / elapsed:.0f}/s), "
+                  f"max event loop lag {max_lag * 1000:.1f}ms")
+            print(pool.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1000, help="Number of clients.")
+    parser.add_argument("--messages", type=int, default=10, help="Say packets sent per client.")
+    parser.add_argument("--max-handshakes", type=int, default=64, help="Maximum number of concurrent handshakes.")
+    parser.add_argument("--stagger", type=float, default=0.0, help="Seconds between the start of two handshakes.")
+    args = parser.parse_args()
+
+    # every client uses two sockets (client and server side) in this process
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.clients * 2 + 64:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, args.clients * 2 + 64), hard))
+
+    asyncio.run(run(args.clients, args.messages, args.max_handshakes, args.stagger))
+
+
+if __name__ == "__main__":
+    main()
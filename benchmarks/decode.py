@@ -0,0 +1,60 @@
+"""
+Measures the per-frame decode time of the server packet fixtures in tests/parsing/server.
+
+Compares the combined client and server packet adapter with the server only adapter
+and the precompiled per-command adapters.
+
+Usage: python benchmarks/decode.py [--number N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from archipelagopy import packets
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "parsing" / "server"
+
+
+def load_frames() -> list[tuple[str, str, str]]:
+    frames: list[tuple[str, str, str]] = []
+
+    for path in sorted(FIXTURES.rglob("*.json")):
+        data: str = path.read_text("utf-8")
+        cmd: str = packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(f"[{data}]")[0].cmd
+        frames.append((path.relative_to(FIXTURES).as_posix(), cmd, data))
+
+    return frames
+
+
+def measure(func, number: int) -> float:
+    # best of five runs, in microseconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200, help="Decodes per measurement.")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<45} {'combined':>10} {'server':>10} {'per-cmd':>10} {'speedup':>8}")
+
+    totals: list[float] = [0.0, 0.0, 0.0]
+    for name, cmd, data in load_frames():
+        frame: str = f"[{data}]"
+        adapter = packets.SERVER_PACKET_ADAPTERS[cmd]
+
+        results: list[float] = [
+            measure(lambda f=frame: packets.PACKET_TYPE_ADAPTER.validate_json(f), args.number),
+            measure(lambda f=frame: packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(f), args.number),
+            measure(lambda a=adapter, d=data: a.validate_json(d), args.number),
+        ]
+
+        totals = [t + r for t, r in zip(totals, results, strict=True)]
+        print(f"{name:<45} {results[0]:>8.1f}us {results[1]:>8.1f}us {results[2]:>8.1f}us {results[0] / results[2]:>7.2f}x")
+
+    print(f"{'total':<45} {totals[0]:>8.1f}us {totals[1]:>8.1f}us {totals[2]:>8.1f}us {totals[0] / totals[2]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
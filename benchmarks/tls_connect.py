@@ -0,0 +1,161 @@
+"""
+Connects many clients to a local TLS stand-in server, disconnects them and connects them again, which is what
+happens when the server restarts. Every mode runs in a fresh process, reporting the handshake latency of both
+rounds and the resident memory of the process.
+
+Modes:
+- per-client: every client creates its own default SSLContext, which loads the system CA store for every client
+- shared: all clients share a single default SSLContext
+- resumption: all clients share a SessionCachingSSLContext, so reconnects resume TLS sessions
+
+Requires the openssl command line tool to create a self-signed certificate.
+
+Usage: python benchmarks/tls_connect.py [--clients N] [--max-handshakes N] [--mode MODE]
+"""
+
+import argparse
+import asyncio
+import pathlib
+import resource
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client, packets
+from archipelagopy.pool import ClientPool
+from archipelagopy.tls import SessionCachingSSLContext, create_session_caching_context
+
+MODES: tuple[str, ...] = ("per-client", "shared", "resumption")
+
+
+def create_certificate(directory: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
+    cert: pathlib.Path = directory / "cert.pem"
+    key: pathlib.Path = directory / "key.pem"
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+        "-keyout", str(key), "-out", str(cert), "-days", "1", "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost",
+    ], check=True, capture_output=True)
+
+    return cert, key
+
+
+def create_client_context(mode: str, cert: pathlib.Path) -> ssl.SSLContext:
+    # the system CA store is loaded in every mode, as it would be when connecting to a public server
+    context: ssl.SSLContext = ssl.create_default_context() if mode != "resumption" else create_session_caching_context()
+    context.load_verify_locations(cert)
+    return context
+
+
+def get_rss() -> int:
+    """
+    Returns the current resident memory of the process in bytes.
+    """
+
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * resource.getpagesize()
+
+
+async def server_handler(ws: ServerConnection):
+    await ws.send('[{"cmd":"Bounced","slots":[1]}]')
+    await ws.wait_closed()
+
+
+class BenchmarkClient(Client):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bounced: asyncio.Event = asyncio.Event()
+        self.latencies: list[float] = []
+
+    def _create_websocket_connection(self):
+        connect = super()._create_websocket_connection()
+
+        async def timed_connect():
+            # only the TCP, TLS and websocket handshakes are timed, not the wait for the HandshakeLimiter
+            start: float = time.perf_counter()
+            ws = await connect
+            self.latencies.append(time.perf_counter() - start)
+            return ws
+
+        return timed_connect()
+
+    async def on_bounced(self, packet: packets.Bounced):
+        self.bounced.set()
+
+
+def format_latencies(latencies: list[float]) -> str:
+    quantiles: list[float] = statistics.quantiles(latencies, n=100)
+    return f"p50 {quantiles[49] * 1000:.1f}ms, p99 {quantiles[98] * 1000:.1f}ms"
+
+
+async def connect_all(pool: ClientPool):
+    clients: list[BenchmarkClient] = list(pool)
+    for client in clients:
+        client.bounced.clear()
+
+    start: float = time.perf_counter()
+    await pool.start()
+    await asyncio.gather(*(client.bounced.wait() for client in clients))
+    return time.perf_counter() - start
+
+
+async def run(mode: str, clients: int, max_handshakes: int, cert: pathlib.Path, key: pathlib.Path):
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert, key)
+
+    async with serve(server_handler, "localhost", 0, ssl=server_context) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        rss: int = get_rss()
+
+        shared_context: ssl.SSLContext = create_client_context(mode, cert)
+        pool = ClientPool(max_handshakes=max_handshakes, ssl_context=shared_context)
+        for _ in range(clients):
+            context: ssl.SSLContext = create_client_context(mode, cert) if mode == "per-client" else shared_context
+            pool.create(BenchmarkClient, port, host="localhost", ssl_context=context)
+
+        for round_name in ("connect", "reconnect"):
+            elapsed: float = await connect_all(pool)
+            latencies: list[float] = [client.latencies[-1] for client in pool]
+            print(f"{mode:>10} {round_name:>9}: {clients} clients in {elapsed:.2f}s, {format_latencies(latencies)}")
+            await pool.stop()
+
+        print(f"{mode:>10}    memory: {(get_rss() - rss) / (1 << 20):.1f} MiB")
+        if isinstance(shared_context, SessionCachingSSLContext):
+            print(f"{mode:>10}  sessions: {shared_context.resumed} of {shared_context.handshakes} handshakes resumed")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500, help="Number of clients.")
+    parser.add_argument("--max-handshakes", type=int, default=32, help="Maximum number of concurrent handshakes.")
+    parser.add_argument("--mode", choices=MODES, help="Only run a single mode in this process.")
+    parser.add_argument("--cert", type=pathlib.Path, help=argparse.SUPPRESS)
+    parser.add_argument("--key", type=pathlib.Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # every client uses two sockets (client and server side) in this process
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.clients * 2 + 64:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, args.clients * 2 + 64), hard))
+
+    if args.mode is not None and args.cert is not None:
+        asyncio.run(run(args.mode, args.clients, args.max_handshakes, args.cert, args.key))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = create_certificate(pathlib.Path(directory))
+        # every mode runs in a process of its own, so the memory of one mode does not affect the others
+        for mode in MODES if args.mode is None else (args.mode,):
+            subprocess.run([
+                sys.executable, __file__, "--mode", mode, "--clients", str(args.clients),
+                "--max-handshakes", str(args.max_handshakes), "--cert", str(cert), "--key", str(key),
+            ], check=True)
+
+
+if __name__ == "__main__":
+    main()
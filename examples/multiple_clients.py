@@ -4,61 +4,31 @@ import websockets
 
 from archipelagopy import Client, enums, packets, structs
 from archipelagopy.callback_interface import OnConnectExceptionUnion
+from archipelagopy.data_package import GameDataIndex, get_game_data_index
+from archipelagopy.pool import ClientPool
 from archipelagopy.structs import NetworkSlot, NetworkItem, GameData
 
 
 class ItemAnnouncerClient(Client):
 
     # shared across all clients
-    data_packages: dict[str, GameData] = {}
-    game_item_id_to_name: dict[str, dict[int, str]] = {}
-    game_location_id_to_name: dict[str, dict[int, str]] = {}
+    game_indexes: dict[str, GameDataIndex] = {}
 
-    def __init__(self, port: int, slot_name: str, password: str = ""):
-        super().__init__(port)
+    def __init__(self, port: int, slot_name: str, password: str = "", **kwargs):
+        # the pool passes its shared resources, e.g. the DataPackageStore, which requests every data package
+        # only once, no matter how many clients need it
+        super().__init__(port, **kwargs)
         self.port: int = port
         self.slot_name: str = slot_name
         self.password: str = password
         self.slot_info: dict[int, NetworkSlot] = {}
 
-    def data_package_is_outdated(self, game: str, checksum: str) -> bool:
-        if game not in self.data_packages:
-            return True
-        return self.data_packages[game].checksum != checksum
-
     async def on_room_info(self, packet: packets.RoomInfo):
+        await self.login()
 
-        # find all games that are outdated or not present in the data packages
-        data_package_requests = [
-            game
-            for game, checksum
-            in packet.datapackage_checksums.items()
-            if self.data_package_is_outdated(game, checksum)
-        ]
-
-        # update the data packages with the checksums to avoid requesting the
-        # same package multiple times from other clients
-        for game in data_package_requests:
-            self.data_packages[game] = GameData(
-                checksum=packet.datapackage_checksums[game]
-            )
-
-        # request data packages for games that are outdated
-        if data_package_requests:
-            await self.send(packets.GetDataPackage(games=data_package_requests))
-        else:
-            await self.login()
-
-    def create_id_to_name_mappings(self, game: str, data: GameData):
-        # create item id to name mappings
-        self.game_item_id_to_name[game] = {
-            v: k for k, v in data.item_name_to_id.items()
-        }
-
-        # create location id to name mappings
-        self.game_location_id_to_name[game] = {
-            v: k for k, v in data.location_name_to_id.items()
-        }
+    async def on_game_data(self, game: str, data: GameData):
+        # the index supports id to name lookups and is shared by all clients using the same checksum
+        self.game_indexes[game] = get_game_data_index(data)
 
     async def login(self):
         await self.send(
@@ -72,16 +42,6 @@ class ItemAnnouncerClient(Client):
             )
         )
 
-    async def on_data_package(self, packet: packets.DataPackage):
-        # update the data packages with the received data
-        self.data_packages.update(packet.data.games)
-
-        # create reverse mappings for item and location IDs to names
-        for game, data in packet.data.games.items():
-            self.create_id_to_name_mappings(game, data)
-
-        await self.login()
-
     def print(self, msg: str):
         print(f"[Lobby:{self.port}]: {msg}")
 
@@ -106,10 +66,14 @@ class ItemAnnouncerClient(Client):
         item: NetworkItem = packet.item
         receiving: int = packet.receiving
         receiver: NetworkSlot = self.slot_info[receiving]
-        item_name: str = self.game_item_id_to_name[receiver.game][item.item]
-
         sender: NetworkSlot = self.slot_info[item.player]
-        location_name: str = self.game_location_id_to_name[sender.game][item.location]
+
+        # the data packages may still be on their way
+        if receiver.game not in self.game_indexes or sender.game not in self.game_indexes:
+            return
+
+        item_name: str = self.game_indexes[receiver.game].get_item_name(item.item)
+        location_name: str = self.game_indexes[sender.game].get_location_name(item.location)
 
         item_importance: str = str.lower(item.flags.name)
 
@@ -123,14 +87,14 @@ async def main():
     # import logging
     # logging.basicConfig(level=logging.DEBUG)
 
-    clients: list[Client] = [
-        ItemAnnouncerClient(port=10001, slot_name="PlayerOne", password="123456"),
-        ItemAnnouncerClient(port=10002, slot_name="PlayerTwo"),
-        ItemAnnouncerClient(port=10003, slot_name="PlayerThree"),
-    ]
+    # the pool limits the number of concurrent handshakes and shares the SSL context, codec and data packages
+    pool = ClientPool(max_handshakes=8)
+    pool.create(ItemAnnouncerClient, port=10001, slot_name="PlayerOne", password="123456")
+    pool.create(ItemAnnouncerClient, port=10002, slot_name="PlayerTwo")
+    pool.create(ItemAnnouncerClient, port=10003, slot_name="PlayerThree")
 
     # Start all clients concurrently
-    await asyncio.gather(*[client.start() for client in clients])
+    await pool.start()
 
     try:
         # Wait indefinitely to keep the clients running
@@ -138,7 +102,7 @@ async def main():
         await asyncio.Event().wait()
     except asyncio.exceptions.CancelledError:
         print("Stopping clients...")
-        await asyncio.gather(*[client.stop() for client in clients])
+        await pool.stop()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,39 @@
 from archipelagopy.client import Client
 from archipelagopy.callback_interface import ClientCallbackInterface
+from archipelagopy import backoff
+from archipelagopy import codec
+from archipelagopy import columns
+from archipelagopy import data_package
+from archipelagopy import data_storage
+from archipelagopy import dispatcher
 from archipelagopy import enums
 from archipelagopy import packets
+from archipelagopy import pipeline
+from archipelagopy import pool
+from archipelagopy import scout_cache
+from archipelagopy import send_queue
+from archipelagopy import sharding
+from archipelagopy import stream
 from archipelagopy import structs
+from archipelagopy import tls
 
 __all__ = [
     "Client",
     "ClientCallbackInterface",
+    "backoff",
+    "codec",
+    "columns",
+    "data_package",
+    "data_storage",
+    "dispatcher",
     "enums",
     "packets",
-    "structs"
+    "pipeline",
+    "pool",
+    "scout_cache",
+    "send_queue",
+    "sharding",
+    "stream",
+    "structs",
+    "tls"
 ]
\ No newline at end of file
@@ -0,0 +1,124 @@
+import abc
+import asyncio
+import random
+
+
+class Backoff(abc.ABC):
+    """
+    Base class of the strategies which decide how long a client waits before reconnecting.
+    Subclasses have to implement get_wait().
+    """
+
+    def __init__(self, base: float = 1.0, max_wait: float = 60.0, rng: random.Random | None = None):
+        """
+        :param base: Wait time of the first attempt in seconds.
+        :param max_wait: Maximum wait time in seconds.
+        :param rng: The random number generator used for jitter, defaults to the one of the random module.
+        """
+
+        if base <= 0 or max_wait < base:
+            raise ValueError("base must be positive and max_wait must not be smaller than base.")
+
+        self.base: float = base
+        self.max_wait: float = max_wait
+        self.rng: random.Random = random.Random() if rng is None else rng
+
+    @abc.abstractmethod
+    def get_wait(self, attempt: int, previous: float) -> float:
+        """
+        Returns the seconds to wait before the next reconnect.
+        :param attempt: Number of reconnect attempts in the accumulation period of the client, starting at 1.
+        :param previous: The previous wait time of the client, 0 for the first attempt.
+        """
+
+    def _ceiling(self, attempt: int) -> float:
+        # the exponent is capped, so a long outage does not overflow the float
+        return min(self.base * 2 ** min(attempt, 64), self.max_wait)
+
+
+class ExponentialBackoff(Backoff):
+    """
+    Doubles the wait time with every attempt, without jitter. Clients which lose their connection at the same
+    time also reconnect at the same time.
+    """
+
+    def get_wait(self, attempt: int, previous: float) -> float:  # noqa: ARG002
+        return self._ceiling(attempt)
+
+
+class FullJitterBackoff(Backoff):
+    """
+    Waits a random time between 0 and the exponential wait time, which spreads the reconnects of clients
+    which lost their connection at the same time over the whole window.
+    """
+
+    def get_wait(self, attempt: int, previous: float) -> float:  # noqa: ARG002
+        return self.rng.uniform(0, self._ceiling(attempt))
+
+
+class DecorrelatedJitterBackoff(Backoff):
+    """
+    Waits a random time between base and three times the previous wait time, so the wait times of clients
+    drift apart from attempt to attempt.
+    """
+
+    def get_wait(self, attempt: int, previous: float) -> float:  # noqa: ARG002
+        return min(self.rng.uniform(self.base, max(previous, self.base) * 3), self.max_wait)
+
+
+class ReconnectLimiter:
+    """
+    A token bucket shared by clients, which limits the rate of their reconnects, e.g. after the server
+    they are connected to restarted. Every reconnect takes a token, tokens are refilled at a fixed rate.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10):
+        """
+        :param rate: Number of tokens refilled per second.
+        :param burst: Maximum number of tokens, which is the number of reconnects allowed without waiting.
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate and burst must be positive.")
+
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__tokens: float = burst
+        self.__updated: float | None = None
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of available tokens, negative if reconnects are waiting for tokens.
+        """
+
+        self._refill()
+        return self.__tokens
+
+    def _refill(self):
+        now: float = asyncio.get_running_loop().time()
+        if self.__updated is not None:
+            self.__tokens = min(self.__tokens + (now - self.__updated) * self.__rate, self.__burst)
+
+        self.__updated = now
+
+    async def acquire(self) -> float:
+        """
+        Takes a token, waiting for it if the bucket is empty.
+        :return: The seconds waited for the token.
+        """
+
+        self._refill()
+        # the token is reserved right away, so waiting reconnects are served in order
+        self.__tokens -= 1
+        if self.__tokens >= 0:
+            return 0.0
+
+        wait: float = -self.__tokens / self.__rate
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.__tokens += 1
+            raise
+
+        return wait
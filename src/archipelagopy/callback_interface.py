@@ -1,6 +1,8 @@
 import websockets.exceptions
 
 from archipelagopy import packets
+from archipelagopy.columns import LocationInfoColumns, ReceivedItemsColumns
+from archipelagopy.structs.game_data import GameData
 
 OnConnectExceptionUnion = (
     websockets.exceptions.InvalidURI |
@@ -36,6 +38,14 @@ class ClientCallbackInterface:
         websockets.CloseCode.GOING_AWAY indicates that the server is shutting down.
         """
 
+    def on_reconnect_attempt(self, attempt: int, wait: float):
+        """
+        Called when auto_reconnect is enabled, right before the client reconnects.
+        :param attempt: Number of failed connection attempts in the reconnect accumulation period, or the number
+         of times the server went into standby in the period.
+        :param wait: Seconds waited for the backoff and the reconnect limiter.
+        """
+
     async def on_received(self, packet: str):
         """
         Called when a raw packet is received from the server. This should be a json string.
@@ -71,6 +81,15 @@ class ClientCallbackInterface:
         This is used to send and receive data between the client and server.
         """
 
+    async def on_game_data(self, game: str, data: GameData):
+        """
+        Called for every game of a received DataPackage packet. Overriding this method makes the client decode
+        DataPackage packets one game at a time and fire this callback as soon as a game has been decoded,
+        before on_packet and on_data_package are called for the packet.
+        :param game: The name of the game.
+        :param data: The data package of the game.
+        """
+
     async def on_invalid_packet(self, packet: packets.InvalidPacket):
         """
         Called when an invalid packet is received.
@@ -82,6 +101,14 @@ class ClientCallbackInterface:
         This is used to update the client's location in the game.
         """
 
+    async def on_location_info_columns(self, packet: LocationInfoColumns):
+        """
+        Called when the client receives location information from the server, with the items in columnar form.
+        Overriding this method makes the client build the columns directly from the received JSON. The
+        LocationInfo packet with a NetworkItem per item is still built as well, unless lazy_decode is enabled and
+        neither on_location_info nor on_packet is overridden. Fires after on_location_info.
+        """
+
     async def on_print_json(self, packet: packets.PrintJSON):
         """
         Called when a PrintJSON packet is received.
@@ -94,6 +121,14 @@ class ClientCallbackInterface:
         This is used to update the client's inventory.
         """
 
+    async def on_received_items_columns(self, packet: ReceivedItemsColumns):
+        """
+        Called when the client receives items from the server, with the items in columnar form.
+        Overriding this method makes the client build the columns directly from the received JSON. The
+        ReceivedItems packet with a NetworkItem per item is still built as well, unless lazy_decode is enabled and
+        neither on_received_items nor on_packet is overridden. Fires after on_received_items.
+        """
+
     async def on_retrieved(self, packet: packets.Retrieved):
         """
         Called when the client retrieves items from the server.
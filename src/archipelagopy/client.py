@@ -1,25 +1,67 @@
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import functools
 import inspect
 import logging
-import ssl
+import re
 import time
 import traceback
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from ssl import SSLContext
 from types import MappingProxyType
-from typing import Final, cast
+from typing import Any, Final, NamedTuple, cast
 
 import websockets.exceptions
 from websockets.asyncio.client import ClientConnection
 
-from archipelagopy import packets
+from archipelagopy import enums, packets, structs
+from archipelagopy.backoff import Backoff, ReconnectLimiter
 from archipelagopy.callback_interface import ClientCallbackInterface as CCInterface
+from archipelagopy.codec import Codec, PydanticCodec
+from archipelagopy.columns import (
+    COLUMNAR_PACKET_TYPES,
+    LocationInfoColumns,
+    ReceivedItemsColumns,
+)
+from archipelagopy.data_package.cache import DataPackageCache
+from archipelagopy.data_package.store import DataPackageStore
+from archipelagopy.data_package.streaming import iter_frame
+from archipelagopy.dispatcher import PacketDispatcher
+from archipelagopy.pipeline import (
+    InboundQueue,
+    PipelineConfig,
+    PipelineStage,
+    StageMetrics,
+    create_pipeline_metrics,
+)
+from archipelagopy.pool import HandshakeLimiter
+from archipelagopy.scout_cache import ScoutCache, ScoutKey
+from archipelagopy.send_queue import (
+    LaneConfig,
+    OverflowPolicy,
+    SendLane,
+    SendQueue,
+    get_packet_lane,
+)
+from archipelagopy.stream import PacketStream
+from archipelagopy.tls import get_default_ssl_context
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
+_TRUSTED_GAME_DATA_BUILDER: Final[Callable[[dict], structs.GameData]] = packets.create_model_builder(structs.GameData)
+# matches the cmd of a DataPackage, but not the text of a chat message containing it, as quotes in strings are escaped
+_DATA_PACKAGE_CMD: Final[re.Pattern] = re.compile(r'"cmd"\s*:\s*"DataPackage"')
+# packet types whose checked locations are tracked for check_locations(), even if they are not handled
+_CHECKED_LOCATION_PACKETS: Final[tuple[type[packets.ServerPacket], ...]] = (packets.Connected, packets.RoomUpdate)
+
+PacketType = packets.ServerPacket | ReceivedItemsColumns | LocationInfoColumns
+
+PacketHook = Callable[[packets.ServerPacket], Awaitable[None]]
+
 PacketCallbackMapType = Final[
-    MappingProxyType[type[packets.ServerPacket], Callable[[CCInterface], Callable[..., Awaitable]]]
+    MappingProxyType[type[PacketType], Callable[[CCInterface], Callable[..., Awaitable]]]
 ]
 
 # Maps packets.ServerPacket types to their respective callback functions.
@@ -37,14 +79,28 @@ PACKET_CALLBACK_MAP: PacketCallbackMapType = MappingProxyType({
     packets.RoomInfo: lambda x: cast(CCInterface, x).on_room_info,
     packets.RoomUpdate: lambda x: cast(CCInterface, x).on_room_update,
     packets.SetReply: lambda x: cast(CCInterface, x).on_set_reply,
+    ReceivedItemsColumns: lambda x: cast(CCInterface, x).on_received_items_columns,
+    LocationInfoColumns: lambda x: cast(CCInterface, x).on_location_info_columns,
 })
 
-def packet_to_json(packet: packets.ClientPacket) -> str:
+def is_default_callback(callback: Callable) -> bool:
+    """
+    Checks whether a resolved callback is still the empty default implementation of the ClientCallbackInterface.
+    """
+
+    func: Callable | None = getattr(callback, "__func__", None)
+    return func is not None and getattr(CCInterface, func.__name__, None) is func
+
+
+def packet_to_json(packet: packets.ClientPacket, codec: Codec | None = None) -> str:
     """
     Converts a ClientPacket to a JSON string.
     """
 
-    json_data: str = f"[{packet.model_dump_json(by_alias=True)}]"
+    if codec is None:
+        codec = PydanticCodec()
+
+    json_data: str = codec.encode_frame((packet,))
     return json_data
 
 
@@ -53,6 +109,53 @@ class ConnectionClosedError(BaseException):
         self.close_code = close_code
 
 
+class InvalidPacketError(Exception):
+    """
+    Raised when the server answers a request with an InvalidPacket.
+    """
+
+    def __init__(self, packet: packets.InvalidPacket):
+        super().__init__(f"{packet.original_cmd}: {packet.type.name}: {packet.text}")
+        self.packet: packets.InvalidPacket = packet
+
+
+# Maps request packet types to the packet type the server answers with.
+REQUEST_RESPONSE_TYPES: Final[MappingProxyType[type[packets.ClientPacket], type[packets.ServerPacket]]] = (
+    MappingProxyType({
+        packets.Get: packets.Retrieved,
+        packets.LocationScouts: packets.LocationInfo,
+        packets.GetDataPackage: packets.DataPackage,
+    })
+)
+
+_REQUEST_CMD_RESPONSE_TYPES: Final[dict[str, type[packets.ServerPacket]]] = {
+    request_type.model_fields["cmd"].default: response_type
+    for request_type, response_type in REQUEST_RESPONSE_TYPES.items()
+}
+
+
+class _DispatchTable(NamedTuple):
+    # bound callback of every packet type, None if it is the empty default implementation
+    callbacks: dict[type[PacketType], Callable[..., Awaitable] | None]
+    on_packet: Callable[..., Awaitable] | None
+    on_game_data: Callable[..., Awaitable] | None
+
+
+def _get_encoded_size(data: str) -> int:
+    # encoded packets are almost always ASCII, which avoids encoding them twice
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
+class _QueuedPacket(NamedTuple):
+    data: str
+    # size of the data in bytes, once encoded as UTF-8 by the websocket
+    size: int
+    # the packet type the server answers with, if the packet is a request
+    response_type: type[packets.ServerPacket] | None = None
+    # resolved with the answer, None if nobody waits for it
+    future: asyncio.Future | None = None
+
+
 def task_wrapper(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
     """
     Wraps a coroutine function to add exception handling and logging.
@@ -79,9 +182,48 @@ def task_wrapper(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
 
     return wrapper
 
+def _build_packet(element: dict, cmd: str, trusted_server: bool) -> packets.ServerPacket:
+    if trusted_server:
+        return packets.TRUSTED_PACKET_BUILDERS[cmd](element)
+
+    return packets.SERVER_PACKET_ADAPTERS[cmd].validate_python(element)
+
+
+def decode_frame(js: str, codec: Codec, trusted_server: bool = False, decode_cmds: frozenset[str] | None = None,
+                 columnar_cmds: frozenset[str] = frozenset()) -> list[PacketType]:
+    """
+    Decodes a received frame independently of a client. Defined at module level, so it can be run
+    by any executor, including a ProcessPoolExecutor.
+    :param js: The received frame.
+    :param codec: The codec to decode the frame with.
+    :param trusted_server: Whether to build the packets without validating them.
+    :param decode_cmds: The cmd of every packet type to build, None builds all packets.
+    :param columnar_cmds: The cmd of every packet type whose columnar counterpart is built as well.
+    """
+
+    if decode_cmds is None and not trusted_server and not columnar_cmds:
+        return codec.decode(js, packets.SERVER_PACKET_TYPE_ADAPTER)
+
+    packet_list: list[PacketType] = []
+
+    element: dict
+    for element in codec.loads(js):
+        cmd: str | None = element.get("cmd")
+        if cmd not in packets.SERVER_PACKET_TYPES:
+            continue
+
+        if decode_cmds is None or cmd in decode_cmds:
+            packet_list.append(_build_packet(element, cmd, trusted_server))
+
+        if cmd in columnar_cmds:
+            packet_list.append(COLUMNAR_PACKET_TYPES[cmd].from_json(element))
+
+    return packet_list
+
+
 def get_ssl_context(secure: bool, ssl_context: SSLContext | None):
     if secure:
-        return ssl.create_default_context() if ssl_context is None else ssl_context
+        return get_default_ssl_context() if ssl_context is None else ssl_context
 
     return None
 
@@ -91,16 +233,61 @@ class Client(CCInterface):
     RECONNECT_ACCUMULATION_PERIOD: float = 60  # seconds
 
     def __init__(self, port: int, host: str = "archipelago.gg", ssl_context: SSLContext | None = None,
-                 secure: bool = True, auto_reconnect: bool = False, websocket_kwargs: dict | None = None ):
+                 secure: bool = True, auto_reconnect: bool = False, websocket_kwargs: dict | None = None, *,
+                 lazy_decode: bool = False, codec: Codec | None = None, trusted_server: bool = False,
+                 data_package_cache: DataPackageCache | None = None,
+                 data_package_store: DataPackageStore | None = None,
+                 coalesce_limit: int = 65536, coalesce_delay: float = 0,
+                 location_check_interval: float = 0.1, location_check_batch_size: int = 1000,
+                 send_lanes: Mapping[SendLane, LaneConfig] | None = None, scout_cache: ScoutCache | None = None,
+                 dispatcher: PacketDispatcher | None = None, pipeline: PipelineConfig | None = None,
+                 decode_executor: concurrent.futures.Executor | None = None, decode_offload_threshold: int = 1 << 20,
+                 handshake_limiter: HandshakeLimiter | None = None, backoff: Backoff | None = None,
+                 reconnect_limiter: ReconnectLimiter | None = None):
         """
         :param port: The port to connect to.
         :param host: The host to connect to. Defaults to "archipelago.gg".
-        :param ssl_context: An optional SSLContext to use for secure connections.
+        :param ssl_context: An optional SSLContext to use for secure connections. Defaults to a context shared by
+         all clients of the process, which resumes TLS sessions when reconnecting to a host.
         :param secure: Whether to use a secure connection (wss://) or not (ws://).
         :param auto_reconnect: Whether to automatically trying to reconnect.
         :param websocket_kwargs: Overwrites parameters of websockets.connect()
          This only applies to when the server is going into standby or
          the server is already in standby during the connecting phase.
+        :param lazy_decode: Whether to only read the cmd field of received packets and skip the validation of
+         packets which have neither a specific handler nor an on_packet handler.
+        :param codec: The JSON codec used to decode received and encode sent packets. Defaults to the PydanticCodec.
+        :param trusted_server: Whether to build received packets without validating them.
+         Should only be enabled for servers which are known to send well-formed packets.
+        :param data_package_cache: An optional on-disk cache for data packages. If set, the client fires on_game_data
+         for every cached game on RoomInfo and automatically requests the data packages of missing or stale games,
+         which are added to the cache when received.
+        :param data_package_store: An optional DataPackageStore shared with other clients. Behaves like
+         data_package_cache, but data packages which are already stored or requested by another client
+         are not requested again. Pass the cache to the store, if both are used.
+        :param coalesce_limit: Maximum size in bytes of a frame combining multiple queued packets, 0 disables
+         coalescing.
+         Packets larger than the limit are sent in a frame of their own.
+        :param coalesce_delay: Seconds to wait for further packets before sending a frame which is below
+         the coalesce_limit. Defaults to 0, which only combines packets which are already queued.
+        :param location_check_interval: Seconds to accumulate the locations passed to check_locations() for.
+        :param location_check_batch_size: Number of accumulated locations which are sent immediately.
+        :param send_lanes: Overwrites the maximum size and overflow policy of lanes of the send queue.
+        :param scout_cache: An optional ScoutCache, which may be shared with other clients. scout() only requests
+         locations which are not cached for the seed and slot, and every received LocationInfo is added to it.
+        :param dispatcher: An optional PacketDispatcher, which runs the callbacks of received packets concurrently
+         instead of one after another in the receive loop. Internal handlers still run in the receive loop.
+        :param pipeline: Reads, decodes and dispatches received frames in separate tasks connected by bounded queues,
+         so slow decoding or callbacks do not stop the client from reading frames. Disabled by default.
+        :param decode_executor: An optional executor (e.g. a ThreadPoolExecutor or ProcessPoolExecutor), which decodes
+         frames of at least decode_offload_threshold characters, so they do not block the event loop.
+        :param decode_offload_threshold: Length of the smallest frame decoded by the decode_executor.
+        :param handshake_limiter: An optional HandshakeLimiter shared with other clients, which limits the number of
+         concurrent websocket handshakes, e.g. the one of a ClientPool.
+        :param backoff: The strategy deciding how long to wait before reconnecting after a failed connection attempt,
+         e.g. a FullJitterBackoff. Defaults to an exponential backoff without jitter.
+        :param reconnect_limiter: An optional ReconnectLimiter shared with other clients, which limits the rate of
+         reconnects of all clients sharing it.
         """
 
         super().__init__()
@@ -109,17 +296,88 @@ class Client(CCInterface):
         self.__ssl_context: SSLContext | None = get_ssl_context(secure, ssl_context)
         self.__auto_reconnect: bool = auto_reconnect
         self.__websocket_kwargs: dict | None = websocket_kwargs
+        self.__lazy_decode: bool = lazy_decode
+        self.__codec: Codec = PydanticCodec() if codec is None else codec
+        self.__trusted_server: bool = trusted_server
+        self.__coalesce_limit: int = coalesce_limit
+        self.__coalesce_delay: float = coalesce_delay
+        self.__location_check_interval: float = location_check_interval
+        self.__location_check_batch_size: int = location_check_batch_size
+        self.__dispatcher: PacketDispatcher | None = dispatcher
+        self.__pipeline: PipelineConfig | None = pipeline
+        self.__decode_executor: concurrent.futures.Executor | None = decode_executor
+        self.__decode_offload_threshold: int = decode_offload_threshold
+        self.__handshake_limiter: HandshakeLimiter | None = handshake_limiter
+        self.__backoff: Backoff | None = backoff
+        self.__reconnect_limiter: ReconnectLimiter | None = reconnect_limiter
+        self.__frames_received: int = 0
+        self.__frames_sent: int = 0
+        self.__pipeline_metrics: MappingProxyType[PipelineStage, StageMetrics] | None = (
+            None if pipeline is None else create_pipeline_metrics()
+        )
 
         self.__socket: ClientConnection | None = None
         self.__run_task: asyncio.Task | None = None
         self.__stop_task: asyncio.Task | None = None
         self.__send_lock = asyncio.Lock()
-        self.__send_queue: asyncio.Queue[str] = asyncio.Queue()
+        self.__send_queue: SendQueue[_QueuedPacket] = SendQueue(send_lanes, self._drop_queued_packet)
+        # packet which did not fit into the previous frame
+        self.__send_carry: _QueuedPacket | None = None
+
+        # futures of sent requests per response type, in the order the requests were sent
+        self.__pending_requests: dict[type[packets.ServerPacket], collections.deque[asyncio.Future | None]] = {
+            response_type: collections.deque() for response_type in REQUEST_RESPONSE_TYPES.values()
+        }
         self.__stop_event: asyncio.Event = asyncio.Event()
         self.__stop_lock: asyncio.Lock = asyncio.Lock()
 
         # keep track of server connection close events
         self.__reconnect_timestamps: list[float] = []
+        # reconnects after the server went into standby, which are not failed connection attempts
+        self.__standby_timestamps: list[float] = []
+        # previous backoff wait time, used by jittered backoff strategies
+        self.__reconnect_wait: float = 0.0
+
+        # locations accumulated by check_locations() (ordered), and locations which are known to be checked
+        self.__location_checks: dict[int, None] = {}
+        self.__checked_locations: set[int] = set()
+        self.__location_check_task: asyncio.Task | None = None
+
+        # bound callbacks, built on first use and invalidated whenever a callback is monkey patched
+        self.__dispatch_table: _DispatchTable | None = None
+
+        # internal handlers, which are called before any callbacks
+        self.__packet_hooks: dict[type[packets.ServerPacket], list[PacketHook]] = {}
+        # subscriptions created by stream(), which receive packets after the internal handlers
+        self.__streams: dict[type[PacketType], list[PacketStream]] = {}
+
+        self._init_data_package_store(data_package_store, data_package_cache)
+        self._init_scout_cache(scout_cache)
+
+
+    def _init_data_package_store(self, data_package_store: DataPackageStore | None,
+                                 data_package_cache: DataPackageCache | None):
+        if data_package_cache is not None and data_package_store is not None:
+            raise ValueError("Pass the data_package_cache to the data_package_store instead of the client.")
+
+        if data_package_cache is not None:
+            data_package_store = DataPackageStore(data_package_cache)
+
+        self.__data_package_store: DataPackageStore | None = data_package_store
+        self.__data_package_task: asyncio.Task | None = None
+        if data_package_store is not None:
+            self.add_packet_hook(packets.RoomInfo, self._fetch_data_packages)
+            self.add_packet_hook(packets.DataPackage, self._store_data_packages)
+
+    def _init_scout_cache(self, scout_cache: ScoutCache | None):
+        self.__scout_cache: ScoutCache | None = scout_cache
+        # seed name of the room and team and slot of the connection, once known
+        self.__seed_name: str | None = None
+        self.__scout_key: ScoutKey | None = None
+        if scout_cache is not None:
+            self.add_packet_hook(packets.RoomInfo, self._update_scout_key)
+            self.add_packet_hook(packets.Connected, self._update_scout_key)
+            self.add_packet_hook(packets.LocationInfo, self._cache_scouted_locations)
 
     async def start(self):
         if self.__run_task is not None and not self.__run_task.done():
@@ -148,6 +406,13 @@ class Client(CCInterface):
         self.__run_task = None
         self.__socket = None
 
+        if self.__location_check_task is not None:
+            self.__location_check_task.cancel()
+            self.__location_check_task = None
+
+        for stream in [stream for streams in self.__streams.values() for stream in streams]:
+            stream.close()
+
         self.__stop_event.set()
 
         _LOGGER.debug("[%s]: Client stopped.", self.__addr)
@@ -170,17 +435,161 @@ class Client(CCInterface):
 
         return min(2 ** attempt, max_wait)
 
-    def _resolve_packet_callback(self, packet: packets.ServerPacket) -> Callable[..., Awaitable] | None:
+    def _get_dispatch_table(self) -> _DispatchTable:
+        """
+        Returns the bound callbacks, which are resolved once instead of for every packet.
+        """
+
+        table: _DispatchTable | None = self.__dispatch_table
+        if table is None:
+            callbacks: dict[type[PacketType], Callable[..., Awaitable] | None] = {}
+            for packet_type, resolve in PACKET_CALLBACK_MAP.items():
+                callback: Callable[..., Awaitable] = resolve(self)
+                callbacks[packet_type] = None if is_default_callback(callback) else callback
+
+            table = self.__dispatch_table = _DispatchTable(
+                callbacks,
+                None if is_default_callback(self.on_packet) else self.on_packet,
+                None if is_default_callback(self.on_game_data) else self.on_game_data,
+            )
+
+        return table
+
+    def _resolve_packet_callback(self, packet: PacketType) -> Callable[..., Awaitable] | None:
+        """
+        Resolves the callback function for a given packet type, None if it is the empty default implementation.
+        """
+
+        return self._get_dispatch_table().callbacks.get(type(packet))
+
+    def _is_packet_handled(self, packet_type: type[PacketType]) -> bool:
+        """
+        Checks whether a packet type has a handler which is not the empty default implementation.
+        """
+
+        if packet_type in self.__packet_hooks or packet_type in self.__streams:
+            return True
+
+        # responses to sent requests are always decoded, including an InvalidPacket answering a request
+        pending: collections.deque | None = self.__pending_requests.get(packet_type)
+        if pending or (packet_type is packets.InvalidPacket and any(self.__pending_requests.values())):
+            return True
+
+        table: _DispatchTable = self._get_dispatch_table()
+        if table.on_packet is not None and issubclass(packet_type, packets.ServerPacket):
+            return True
+
+        return table.callbacks.get(packet_type) is not None
+
+    def _get_columnar_types(self) -> set[str]:
         """
-        Resolves the callback function for a given packet type.
+        Returns the cmd of every packet type whose columnar counterpart is handled.
         """
 
-        callback: Callable[..., Awaitable] | None = PACKET_CALLBACK_MAP.get(type(packet), None)
+        return {
+            cmd for cmd, packet_type in COLUMNAR_PACKET_TYPES.items() if self._is_packet_handled(packet_type)
+        }
+
+    def _decode_element(self, element: dict, columnar_types: set[str]) -> list[PacketType]:
+        """
+        Builds the packets of a decoded JSON packet. With lazy decoding, only handled packets are validated,
+        unhandled packets are dropped after reading their cmd field. In trusted server mode,
+        packets are built without validation. Columnar packets are built directly from the decoded JSON
+        and follow their regular counterpart.
+        """
+
+        packet_list: list[PacketType] = []
+
+        cmd: str | None = element.get("cmd")
+        packet_type: type[packets.ServerPacket] | None = packets.SERVER_PACKET_TYPES.get(cmd)
+
+        if packet_type is None:
+            _LOGGER.debug("[%s]: Skipping unknown packet type %s", self.__addr, cmd)
+            return packet_list
+
+        if not self.__lazy_decode or self._is_packet_handled(packet_type):
+            packet_list.append(_build_packet(element, cmd, self.__trusted_server))
+        elif packet_type in _CHECKED_LOCATION_PACKETS:
+            # the checked locations of skipped packets are read from the JSON, so they are tracked without
+            # validating the whole packet
+            self._update_checked_locations(packet_type is packets.Connected, element.get("checked_locations"))
+
+        if cmd in columnar_types:
+            packet_list.append(COLUMNAR_PACKET_TYPES[cmd].from_json(element))
+
+        return packet_list
+
+    def _decode_frame(self, js: str) -> list[PacketType]:
+        """
+        Decodes a received frame. Frames are only decoded to JSON first, if the packets have to be
+        built from it (lazy decoding, trusted server mode or columnar packets).
+        """
+
+        columnar_types: set[str] = self._get_columnar_types()
+
+        if not self.__lazy_decode and not self.__trusted_server and not columnar_types:
+            return self.__codec.decode(js, packets.SERVER_PACKET_TYPE_ADAPTER)
+
+        packet_list: list[PacketType] = []
+
+        element: dict
+        for element in self.__codec.loads(js):
+            packet_list.extend(self._decode_element(element, columnar_types))
+
+        return packet_list
+
+    def _build_game_data(self, data: dict) -> structs.GameData:
+        if self.__trusted_server:
+            return _TRUSTED_GAME_DATA_BUILDER(data)
 
-        if callback is None:
-            return None
+        return structs.GameData.model_validate(data)
 
-        return callback(self)
+    async def _decode_frame_streaming(self, js: str) -> list[PacketType]:
+        """
+        Decodes a received frame which contains a DataPackage one game at a time and fires on_game_data
+        for every game as soon as it has been decoded. Yields to the event loop between games.
+        """
+
+        columnar_types: set[str] = self._get_columnar_types()
+        keep_games: bool = not self.__lazy_decode or self._is_packet_handled(packets.DataPackage)
+        streamed_games: dict[str, structs.GameData] = {}
+        packet_list: list[PacketType] = []
+
+        game: str | None
+        element: dict
+        for game, element in iter_frame(js, self.__codec.loads):
+            if game is not None:
+                game_data: structs.GameData = self._build_game_data(element)
+                if keep_games:
+                    streamed_games[game] = game_data
+
+                await self.on_game_data(game, game_data)
+                await asyncio.sleep(0)
+                continue
+
+            if element.get("cmd") != "DataPackage":
+                packet_list.extend(self._decode_element(element, columnar_types))
+                continue
+
+            # games are only left if the DataPackage was not streamed, because its data came before its cmd,
+            # the games of a streamed DataPackage have been handled above
+            games: dict = element.get("data", {}).get("games", {})
+            for name in list(games):
+                game_data = self._build_game_data(games.pop(name))
+                if keep_games:
+                    streamed_games[name] = game_data
+
+                await self.on_game_data(name, game_data)
+
+            if keep_games:
+                packet: packets.DataPackage = cast(
+                    packets.DataPackage, self._decode_element(element, columnar_types)[0]
+                )
+                packet.data.games = streamed_games
+                packet_list.append(packet)
+                streamed_games = {}
+
+        return packet_list
 
     async def _loop_handler(self):
 
@@ -270,9 +679,16 @@ class Client(CCInterface):
 
         return websockets.connect(**kwargs)
 
+    async def _open_connection(self) -> ClientConnection:
+        if self.__handshake_limiter is None:
+            return await self._create_websocket_connection()
+
+        async with self.__handshake_limiter:
+            return await self._create_websocket_connection()
+
     async def _connect(self):
         ws: ClientConnection
-        async with self._create_websocket_connection() as ws:
+        async with await self._open_connection() as ws:
             self.__socket = ws
 
             _LOGGER.debug("[%s]: Connected", self.__addr)
@@ -280,19 +696,60 @@ class Client(CCInterface):
             # fire on_ready event
             await self.on_ready()
 
-            await self._loop_handler()
+            try:
+                await self._loop_handler()
+            finally:
+                self._fail_pending_requests()
+                self._release_data_packages()
 
             if ws.close_code is not None:
                 raise ConnectionClosedError(websockets.CloseCode(ws.close_code))
 
+    def _get_backoff(self, attempt: int) -> float:
+        if self.__backoff is None:
+            return self._exponential_backoff(attempt)
+
+        previous: float = self.__reconnect_wait if attempt > 1 else 0.0
+        return self.__backoff.get_wait(attempt, previous)
+
+    async def _acquire_reconnect_token(self) -> float:
+        if self.__reconnect_limiter is None:
+            return 0.0
+
+        return await self.__reconnect_limiter.acquire()
+
     async def _handle_reconnect_backoff(self):
         self._increase_reconnects()
-        backoff: int = self._exponential_backoff(
-            self._get_reconnect_frequency()
-        )
+        attempt: int = self._get_reconnect_frequency()
+        backoff: float = self._get_backoff(attempt)
+        self.__reconnect_wait = backoff
         _LOGGER.info("[%s]: Connect call failed, retrying in %s", self.__addr, backoff)
         await asyncio.sleep(backoff)
 
+        self.on_reconnect_attempt(attempt, backoff + await self._acquire_reconnect_token())
+
+    async def _handle_standby_reconnect(self):
+        """
+        Reconnects right away after the server went into standby, unless a backoff strategy is set, whose wait
+        spreads the reconnects of the clients which were disconnected by the same restart.
+        """
+
+        now: float = time.time()
+        self.__standby_timestamps = [
+            ts for ts in self.__standby_timestamps
+            if (now - ts) < self.RECONNECT_ACCUMULATION_PERIOD
+        ]
+        self.__standby_timestamps.append(now)
+
+        attempt: int = len(self.__standby_timestamps)
+        backoff: float = 0.0 if self.__backoff is None else self._get_backoff(attempt)
+        self.__reconnect_wait = backoff
+        if backoff > 0:
+            _LOGGER.info("[%s]: Server went into standby, reconnecting in %s", self.__addr, backoff)
+            await asyncio.sleep(backoff)
+
+        self.on_reconnect_attempt(attempt, backoff + await self._acquire_reconnect_token())
+
     async def _connect_wrapper(self):
         try:
             while True:
@@ -310,6 +767,7 @@ class Client(CCInterface):
                     _LOGGER.info("[%s]: ConnectionClosed: %s(%s)", self.__addr, close_code.name, close_code.value)
                     self.on_connection_closed(close_code)
                     if error.close_code == websockets.CloseCode.GOING_AWAY and self.__auto_reconnect:
+                        await self._handle_standby_reconnect()
                         continue
 
                 except (
@@ -332,39 +790,536 @@ class Client(CCInterface):
             # signal that the client has stopped
             self.__stop_event.set()
 
-    async def _process_packet(self, packet: packets.ServerPacket):
+    def stream(self, packet_type: type[PacketType], maxsize: int = 1024,
+               overflow: OverflowPolicy = OverflowPolicy.BLOCK) -> PacketStream:
+        """
+        Subscribes to received packets of a type, which are consumed with async for. Every stream has its own buffer,
+        and packet types only count as handled for lazy decoding while they are streamed.
+        Streams are closed when the client stops, or with close().
+        :param packet_type: The packet type to stream, e.g. packets.ReceivedItems or ReceivedItemsColumns.
+        :param maxsize: Maximum number of buffered packets, 0 means unbounded.
+        :param overflow: What happens when a packet is received while the buffer is full.
+        """
+
+        if packet_type not in PACKET_CALLBACK_MAP:
+            raise ValueError(f"{packet_type.__name__} is not a received packet type.")
+
+        stream: PacketStream = PacketStream(packet_type, maxsize, overflow, on_close=self._remove_stream)
+        self.__streams.setdefault(packet_type, []).append(stream)
+        return stream
+
+    def _remove_stream(self, stream: PacketStream):
+        streams: list[PacketStream] = self.__streams.get(stream.packet_type, [])
+        if stream in streams:
+            streams.remove(stream)
+
+        if not streams:
+            self.__streams.pop(stream.packet_type, None)
+
+    def add_packet_hook(self, packet_type: type[packets.ServerPacket], hook: PacketHook):
+        """
+        Registers a handler for a packet type, e.g. for helpers such as the DataStorageMirror which track the state
+        of the client. Packet hooks are called before any callbacks, in the order they were added, and make the
+        packet type count as handled for lazy decoding.
+        """
+
+        self.__packet_hooks.setdefault(packet_type, []).append(hook)
+
+    async def _fetch_data_packages(self, packet: packets.RoomInfo):
+        """
+        Starts fetching the data packages of the room in the background, as the requested data packages
+        are received by the receive loop.
+        """
+
+        self._release_data_packages()
+        self.__data_package_task = asyncio.create_task(
+            self._fetch_data_packages_task(packet.datapackage_checksums),
+            name=f"{__name__}.fetch_data_packages[{self.__addr}]"
+        )
+
+    async def _fetch_data_packages_task(self, checksums: dict[str, str]):
+        """
+        Fires on_game_data for every game of the room which is stored, cached or requested by another client.
+        Games requested by this client fire on_game_data when their DataPackage is received.
+        """
+
+        requested: set[str] = set()
 
-        # fire on_packet event
-        await self.on_packet(packet)
+        async def request(games: list[str]):
+            requested.update(games)
+            await self.send(packets.GetDataPackage(games=games))
+
+        try:
+            game: str
+            data: structs.GameData
+            async for game, data in self.__data_package_store.fetch(self, checksums, request):
+                if game not in requested:
+                    await self.on_game_data(game, data)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _LOGGER.exception("[%s]: %s", self.__addr, traceback.format_exc())
+
+    def _release_data_packages(self):
+        if self.__data_package_task is not None:
+            self.__data_package_task.cancel()
+            self.__data_package_task = None
+
+        if self.__data_package_store is not None:
+            self.__data_package_store.release(self)
+
+    async def _store_data_packages(self, packet: packets.DataPackage):
+        game: str
+        data: structs.GameData
+        for game, data in packet.data.games.items():
+            await self.__data_package_store.put(game, data)
+
+    def _resolve_request(self, packet: PacketType):
+        """
+        Resolves the future of the oldest request the packet answers.
+        """
+
+        result: packets.ServerPacket | Exception = packet
+        pending: collections.deque[asyncio.Future | None] | None = self.__pending_requests.get(type(packet))
+
+        if isinstance(packet, packets.InvalidPacket):
+            response_type: type[packets.ServerPacket] | None = _REQUEST_CMD_RESPONSE_TYPES.get(packet.original_cmd)
+            pending = None if response_type is None else self.__pending_requests[response_type]
+            result = InvalidPacketError(packet)
+
+        if not pending:
+            return
+
+        future: asyncio.Future | None = pending.popleft()
+
+        # the request was not sent by request(), or the caller stopped waiting
+        if future is None or future.done():
+            return
+
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    def _fail_pending_requests(self):
+        for pending in self.__pending_requests.values():
+            while pending:
+                future: asyncio.Future | None = pending.popleft()
+                if future is not None and not future.done():
+                    future.set_exception(ConnectionError("Connection closed before the response was received."))
+
+    async def _process_packet(self, packet: PacketType):
+
+        self._resolve_request(packet)
+
+        if isinstance(packet, _CHECKED_LOCATION_PACKETS):
+            self._update_checked_locations(isinstance(packet, packets.Connected), packet.checked_location)
+
+        hooks: list[PacketHook] | None = self.__packet_hooks.get(type(packet))
+        if hooks:
+            for hook in hooks:
+                await hook(packet)
+
+        streams: list[PacketStream] | None = self.__streams.get(type(packet))
+        if streams:
+            for stream in streams:
+                await stream.put(packet)
+
+        if self.__dispatcher is not None:
+            await self.__dispatcher.dispatch(packet, self._fire_callbacks)
+        else:
+            await self._fire_callbacks(packet)
+
+    async def _fire_callbacks(self, packet: PacketType):
+        table: _DispatchTable = self._get_dispatch_table()
+
+        # fire on_packet event, columnar packets are only passed to their specific handler
+        if table.on_packet is not None and isinstance(packet, packets.ServerPacket):
+            await table.on_packet(packet)
 
         # manage callback
-        callback: Callable[..., Awaitable] = self._resolve_packet_callback(packet)
+        callback: Callable[..., Awaitable] | None = table.callbacks.get(type(packet))
         if callback is not None:
             await callback(packet)
 
+    async def _decode_frame_offloaded(self, js: str) -> list[PacketType]:
+        """
+        Decodes a large frame in the decode_executor. DataPackages are decoded completely before
+        on_game_data is fired for their games.
+        """
+
+        fire_game_data: bool = (
+            self._get_dispatch_table().on_game_data is not None and _DATA_PACKAGE_CMD.search(js) is not None
+        )
+        keep_data_package: bool = not self.__lazy_decode or self._is_packet_handled(packets.DataPackage)
+
+        decode_cmds: frozenset[str] | None = None
+        if self.__lazy_decode:
+            # packets with checked locations are decoded as well, as the executor does not return the skipped JSON
+            decode_cmds = frozenset(
+                cmd for cmd, packet_type in packets.SERVER_PACKET_TYPES.items()
+                if self._is_packet_handled(packet_type) or (fire_game_data and packet_type is packets.DataPackage)
+                or packet_type in _CHECKED_LOCATION_PACKETS
+            )
+
+        packet_list: list[PacketType] = await asyncio.get_running_loop().run_in_executor(
+            self.__decode_executor, decode_frame, js, self.__codec, self.__trusted_server, decode_cmds,
+            frozenset(self._get_columnar_types())
+        )
+
+        if fire_game_data:
+            for packet in [packet for packet in packet_list if isinstance(packet, packets.DataPackage)]:
+                for game, game_data in packet.data.games.items():
+                    await self.on_game_data(game, game_data)
+
+                if not keep_data_package:
+                    packet_list.remove(packet)
+
+        return packet_list
+
+    async def _decode_received_frame(self, js: str) -> list[PacketType]:
+        self.__frames_received += 1
+
+        # fire on_received event
+        await self.on_received(js)
+
+        if self.__decode_executor is not None and len(js) >= self.__decode_offload_threshold:
+            return await self._decode_frame_offloaded(js)
+
+        if self._get_dispatch_table().on_game_data is not None and _DATA_PACKAGE_CMD.search(js) is not None:
+            return await self._decode_frame_streaming(js)
+
+        return self._decode_frame(js)
+
     @task_wrapper
     async def _receive_loop(self):
+        if self.__pipeline is not None:
+            await self._run_pipeline()
+            return
+
         js: str
         async for js in self.__socket:
-            # fire on_received event
-            await self.on_received(js)
-
-            packet_list: list[packets.ServerPacket] = packets.PACKET_TYPE_ADAPTER.validate_json(js)
+            packet_list: list[PacketType] = await self._decode_received_frame(js)
 
-            packet: packets.ServerPacket
+            packet: PacketType
             for packet in packet_list:
                 await self._process_packet(packet)
 
+    async def _run_pipeline(self):
+        """
+        Runs the read, parse and dispatch stages until the connection is closed and all read frames have been
+        processed. Every stage closes its output queue when it stops, so the following stages drain their input.
+        """
+
+        config: PipelineConfig = self.__pipeline
+        metrics: MappingProxyType[PipelineStage, StageMetrics] = self.__pipeline_metrics
+        droppable_types: frozenset[type] = config.droppable_packet_types
+
+        frames: InboundQueue[str] = InboundQueue(
+            config.frame_queue_size, config.frame_overflow, metrics=metrics[PipelineStage.PARSE]
+        )
+        packet_queue: InboundQueue[PacketType] = InboundQueue(
+            config.packet_queue_size, config.packet_overflow,
+            droppable=lambda packet: type(packet) in droppable_types, metrics=metrics[PipelineStage.DISPATCH]
+        )
+
+        read_task: asyncio.Task = asyncio.create_task(
+            self._read_stage(frames), name=f"{__name__}.read_stage[{self.__addr}]"
+        )
+        parse_task: asyncio.Task = asyncio.create_task(
+            self._parse_stage(frames, packet_queue), name=f"{__name__}.parse_stage[{self.__addr}]"
+        )
+
+        try:
+            await self._dispatch_stage(packet_queue)
+        finally:
+            for task in (read_task, parse_task):
+                task.cancel()
+
+            results: list = await asyncio.gather(read_task, parse_task, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    async def _read_stage(self, frames: InboundQueue[str]):
+        metrics: StageMetrics = self.__pipeline_metrics[PipelineStage.READ]
+
+        try:
+            js: str
+            async for js in self.__socket:
+                metrics.processed += 1
+
+                start: float = time.perf_counter()
+                await frames.put(js)
+                metrics.blocked_time += time.perf_counter() - start
+        finally:
+            frames.close()
+
+    async def _parse_stage(self, frames: InboundQueue[str], packet_queue: InboundQueue[PacketType]):
+        metrics: StageMetrics = self.__pipeline_metrics[PipelineStage.PARSE]
+
+        try:
+            while (js := await frames.get()) is not None:
+                start: float = time.perf_counter()
+                packet_list: list[PacketType] = await self._decode_received_frame(js)
+                metrics.busy_time += time.perf_counter() - start
+                metrics.processed += 1
+
+                start = time.perf_counter()
+                packet: PacketType
+                for packet in packet_list:
+                    await packet_queue.put(packet)
+                metrics.blocked_time += time.perf_counter() - start
+        finally:
+            packet_queue.close()
+
+    async def _dispatch_stage(self, packet_queue: InboundQueue[PacketType]):
+        metrics: StageMetrics = self.__pipeline_metrics[PipelineStage.DISPATCH]
+
+        while (packet := await packet_queue.get()) is not None:
+            start: float = time.perf_counter()
+            await self._process_packet(packet)
+            metrics.busy_time += time.perf_counter() - start
+            metrics.processed += 1
+
+    async def _next_frame(self) -> str:
+        """
+        Waits for the next packet and combines it with the following queued packets into a single frame,
+        as long as the encoded frame stays below the coalesce_limit.
+        """
+
+        if self.__send_carry is not None:
+            first: _QueuedPacket = self.__send_carry
+            self.__send_carry = None
+        else:
+            first = await self.__send_queue.get()
+
+        self._register_request(first)
+        parts: list[str] = [first.data]
+        size: int = first.size + 2
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + self.__coalesce_delay
+
+        while size < self.__coalesce_limit:
+            if not self.__send_queue.empty():
+                part: _QueuedPacket = self.__send_queue.get_nowait()
+            elif self.__coalesce_delay > 0 and (timeout := deadline - loop.time()) > 0:
+                try:
+                    part = await asyncio.wait_for(self.__send_queue.get(), timeout)
+                except TimeoutError:
+                    break
+            else:
+                break
+
+            if size + part.size + 1 > self.__coalesce_limit:
+                self.__send_carry = part
+                break
+
+            self._register_request(part)
+            parts.append(part.data)
+            size += part.size + 1
+
+        return f"[{','.join(parts)}]"
+
+    @staticmethod
+    def _drop_queued_packet(queued_packet: _QueuedPacket):
+        """
+        Fails the request of a packet dropped from a full lane, so it is not awaited forever.
+        """
+
+        if queued_packet.future is not None and not queued_packet.future.done():
+            queued_packet.future.set_exception(asyncio.QueueFull("The request was dropped from its full send lane."))
+
+    def _register_request(self, queued_packet: _QueuedPacket):
+        """
+        Registers a request when it is sent, so its answer can be matched.
+        """
+
+        if queued_packet.response_type is not None:
+            self.__pending_requests[queued_packet.response_type].append(queued_packet.future)
+
     @task_wrapper
     async def _send_loop(self):
         while True:
-            message: str = await self.__send_queue.get()
+            message: str = await self._next_frame()
             await self.__socket.send(message, text=True)
+            self.__frames_sent += 1
             _LOGGER.debug("[%s]: << %s", self.__addr, message)
 
-    async def send(self, packet: packets.ClientPacket):
-        json_data: str = packet_to_json(packet)
-        await self.__send_queue.put(json_data)
+    async def send(self, packet: packets.ClientPacket, lane: SendLane | None = None):
+        """
+        Queues a packet to be sent. Packets of higher priority lanes are sent first.
+        :param packet: The packet to send.
+        :param lane: The lane to queue the packet in, defaults to the lane of the packet type.
+        :raises asyncio.QueueFull: If the lane is full and its overflow policy is RAISE.
+        """
+
+        await self._queue_packet(packet, lane)
+
+    async def _queue_packet(self, packet: packets.ClientPacket, lane: SendLane | None,
+                            future: asyncio.Future | None = None):
+        data: str = self.__codec.encode_packet(packet)
+        queued_packet: _QueuedPacket = _QueuedPacket(
+            data, _get_encoded_size(data), REQUEST_RESPONSE_TYPES.get(type(packet)), future
+        )
+        await self.__send_queue.put(queued_packet, get_packet_lane(packet) if lane is None else lane)
+
+    async def request(self, packet: packets.Get | packets.LocationScouts | packets.GetDataPackage
+                      ) -> packets.Retrieved | packets.LocationInfo | packets.DataPackage:
+        """
+        Sends a request and waits for the packet answering it. Answers are matched to requests in the order the
+        requests of the same type were sent in, so any number of requests can be awaited at once.
+        Requests wait for their answer indefinitely, use asyncio.timeout() to limit the wait. The answer of a
+        cancelled request is discarded.
+        :param packet: The request to send.
+        :raises asyncio.QueueFull: If the lane of the request is full and its overflow policy is RAISE, or the
+         request was dropped from its lane because of the DROP_OLDEST policy.
+        :raises InvalidPacketError: If the server answered with an InvalidPacket.
+        :raises ConnectionError: If the connection was closed after sending the request.
+        """
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue_packet(packet, None, future)
+        return await future
+
+    async def get(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Retrieves the values of data storage keys.
+        """
+
+        packet: packets.Retrieved = await self.request(packets.Get(keys=list(keys)))
+        return packet.keys
+
+    async def scout(self, locations: Iterable[int],
+                    create_as_hint: enums.LocationScoutHint = 0) -> tuple[structs.NetworkItem, ...]:
+        """
+        Scouts the items of locations. With a scout_cache, only locations which are not cached are requested and
+        the items are returned in the order of the locations. Hints are always requested, as the server has to
+        create them.
+        """
+
+        locations = list(locations)
+        key: ScoutKey | None = self.__scout_key
+
+        if self.__scout_cache is None or key is None or create_as_hint:
+            packet: packets.LocationInfo = await self.request(
+                packets.LocationScouts(locations=locations, create_as_hint=create_as_hint)
+            )
+            return packet.locations
+
+        items: dict[int, structs.NetworkItem] = self.__scout_cache.get_many(*key, locations)
+        missing: list[int] = [location for location in locations if location not in items]
+        if missing:
+            packet = await self.request(packets.LocationScouts(locations=missing, create_as_hint=0))
+            items.update((item.location, item) for item in packet.locations)
+
+        return tuple(items[location] for location in locations if location in items)
+
+    async def fetch_data_package(self, games: Iterable[str]) -> dict[str, structs.GameData]:
+        """
+        Fetches the data packages of games.
+        """
+
+        packet: packets.DataPackage = await self.request(packets.GetDataPackage(games=list(games)))
+        return packet.data.games
+
+    async def check_locations(self, locations: Iterable[int]):
+        """
+        Accumulates checked locations, which are sent in a single LocationChecks packet after the
+        location_check_interval or once location_check_batch_size locations have been accumulated.
+        Locations which were already sent or reported as checked by Connected or RoomUpdate packets are dropped.
+        """
+
+        for location in locations:
+            if location not in self.__checked_locations:
+                self.__location_checks[location] = None
+
+        if len(self.__location_checks) >= self.__location_check_batch_size:
+            await self.flush()
+        elif self.__location_checks and self.__location_check_task is None:
+            self.__location_check_task = asyncio.create_task(
+                self._send_location_checks_later(),
+                name=f"{__name__}.send_location_checks[{self.__addr}]"
+            )
+
+    async def flush(self):
+        """
+        Sends the locations accumulated by check_locations() immediately, e.g. before stopping the client.
+        :raises asyncio.QueueFull: If the lane of LocationChecks is full and its overflow policy is RAISE.
+         The locations are kept and sent by the next flush().
+        """
+
+        task: asyncio.Task | None = self.__location_check_task
+        if task is not None:
+            self.__location_check_task = None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        await self._send_location_checks()
+
+    async def _send_location_checks_later(self):
+        await asyncio.sleep(self.__location_check_interval)
+        self.__location_check_task = None
+
+        try:
+            await self._send_location_checks()
+        except Exception:
+            _LOGGER.exception("[%s]: Cannot send location checks, they are kept for the next flush()", self.__addr)
+
+    async def _send_location_checks(self):
+        if not self.__location_checks:
+            return
+
+        locations: list[int] = list(self.__location_checks)
+        self.__location_checks.clear()
+        self.__checked_locations.update(locations)
+
+        try:
+            await self.send(packets.LocationChecks(locations=locations))
+        except BaseException:
+            # the locations were not queued, keep them in front of the locations accumulated in the meantime
+            self.__checked_locations.difference_update(locations)
+            self.__location_checks = dict.fromkeys(locations) | self.__location_checks
+            raise
+
+    def _update_checked_locations(self, connected: bool, checked_locations: Iterable[int] | None):
+        """
+        Tracks the locations checked by the server, from the start, so locations checked before check_locations()
+        is first called are dropped as well. Connected packets contain all checked locations.
+        """
+
+        if connected:
+            self.__checked_locations.clear()
+
+        if checked_locations is None:
+            return
+
+        self.__checked_locations.update(checked_locations)
+        for location in checked_locations:
+            self.__location_checks.pop(location, None)
+
+    async def _update_scout_key(self, packet: packets.RoomInfo | packets.Connected):
+        if isinstance(packet, packets.RoomInfo):
+            self.__seed_name = packet.seed_name
+            self.__scout_key = None
+            return
+
+        if self.__seed_name is None:
+            return
+
+        self.__scout_key = (self.__seed_name, packet.team, packet.slot)
+        await asyncio.to_thread(self.__scout_cache.load, *self.__scout_key)
+
+    async def _cache_scouted_locations(self, packet: packets.LocationInfo):
+        """
+        Adds the items of every LocationInfo, including those of hints and manually sent LocationScouts.
+        """
+
+        if self.__scout_key is not None and packet.locations:
+            await asyncio.to_thread(self.__scout_cache.put, *self.__scout_key, packet.locations)
 
     async def __aenter__(self):
         await self.start()
@@ -398,10 +1353,70 @@ class Client(CCInterface):
         if not func_is_co and patch_is_co:
             raise TypeError(f"Cannot monkey patch non-coroutine function {key} with coroutine function.")
 
+        # the patched callback is resolved again on the next packet
+        self.__dispatch_table = None
+
     def __setattr__(self, key: str, value: object):
         self._monkey_patch_handler(key, value)
         super().__setattr__(key, value)
 
+    def __delattr__(self, key: str):
+        super().__delattr__(key)
+        # a deleted monkey patched callback falls back to the one of the class on the next packet
+        self.__dispatch_table = None
+
     @property
     def address(self) -> str:
         return self.__addr
+
+    @property
+    def is_connected(self) -> bool:
+        return self.__socket is not None and self.__socket.state is websockets.State.OPEN
+
+    @property
+    def frames_received(self) -> int:
+        return self.__frames_received
+
+    @property
+    def frames_sent(self) -> int:
+        return self.__frames_sent
+
+    @property
+    def codec(self) -> Codec:
+        return self.__codec
+
+    @property
+    def send_queue(self) -> SendQueue[_QueuedPacket]:
+        return self.__send_queue
+
+    @property
+    def data_package_store(self) -> DataPackageStore | None:
+        return self.__data_package_store
+
+    @property
+    def ssl_context(self) -> SSLContext | None:
+        return self.__ssl_context
+
+    @property
+    def backoff(self) -> Backoff | None:
+        return self.__backoff
+
+    @property
+    def reconnect_limiter(self) -> ReconnectLimiter | None:
+        return self.__reconnect_limiter
+
+    @property
+    def scout_cache(self) -> ScoutCache | None:
+        return self.__scout_cache
+
+    @property
+    def dispatcher(self) -> PacketDispatcher | None:
+        return self.__dispatcher
+
+    @property
+    def pipeline_metrics(self) -> MappingProxyType[PipelineStage, StageMetrics] | None:
+        """
+        Metrics of every stage of the inbound pipeline, accumulated over all connections. None without a pipeline.
+        """
+
+        return self.__pipeline_metrics
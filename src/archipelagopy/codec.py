@@ -0,0 +1,111 @@
+import abc
+from collections.abc import Iterable
+from typing import Any
+
+import pydantic_core
+from pydantic import TypeAdapter
+
+from archipelagopy import packets
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class Codec(abc.ABC):
+    """
+    Base class for the JSON codecs used by the client to decode received frames and encode sent packets.
+    Subclasses have to implement loads(), which is used whenever a frame is needed as python objects
+    instead of validated packets (e.g. lazy decoding).
+
+    Validated decoding and encoding default to pydantic, which parses and validates in a single pass and
+    is faster than parsing with another backend first and validating the python objects afterward.
+    """
+
+    @abc.abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Parses a JSON document into python objects without any validation.
+        """
+
+    def decode(self, data: str | bytes, adapter: TypeAdapter) -> Any:
+        """
+        Parses and validates a JSON document with the given adapter.
+        """
+
+        return adapter.validate_json(data)
+
+    def encode_packet(self, packet: packets.ClientPacket) -> str:
+        """
+        Encodes a single packet as a JSON object.
+        """
+
+        return packet.model_dump_json(by_alias=True)
+
+    def encode_frame(self, packet_list: Iterable[packets.ClientPacket]) -> str:
+        """
+        Encodes packets as a JSON array, which is the frame format expected by the server.
+        """
+
+        return f"[{','.join(self.encode_packet(packet) for packet in packet_list)}]"
+
+    def __reduce__(self) -> tuple:
+        # codecs are stateless apart from their backend, so they are recreated when pickled (e.g. for a process pool)
+        return self.__class__, ()
+
+
+class PydanticCodec(Codec):
+    """
+    Default codec, which only depends on pydantic.
+    """
+
+    def loads(self, data: str | bytes) -> Any:
+        return pydantic_core.from_json(data)
+
+
+class OrjsonCodec(Codec):
+    """
+    Codec using orjson. Requires the optional orjson dependency.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the orjson package to be installed.")
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """
+    Codec using msgspec. Requires the optional msgspec dependency.
+    """
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecCodec requires the msgspec package to be installed.")
+
+        self.__decoder = msgspec.json.Decoder()
+
+    def loads(self, data: str | bytes) -> Any:
+        return self.__decoder.decode(data)
+
+
+def get_fastest_codec() -> Codec:
+    """
+    Returns a codec of the fastest installed JSON parser, falling back to the PydanticCodec.
+    """
+
+    if orjson is not None:
+        return OrjsonCodec()
+
+    if msgspec is not None:
+        return MsgspecCodec()
+
+    return PydanticCodec()
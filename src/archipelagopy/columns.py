@@ -0,0 +1,189 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Final, Literal, Self
+
+from archipelagopy.enums.network_item_flag import NetworkItemFlag
+from archipelagopy.structs.network_item import NetworkItem
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_ITEM_GETTER = itemgetter("item")
+_LOCATION_GETTER = itemgetter("location")
+_PLAYER_GETTER = itemgetter("player")
+_FLAGS_GETTER = itemgetter("flags")
+
+
+class NetworkItemColumns:
+    """
+    Columnar representation of a list of NetworkItems, stored as four parallel int64 arrays.
+    Can be built directly from decoded JSON without creating a NetworkItem per entry.
+
+    :ivar items: The item ids.
+    :ivar locations: The location ids.
+    :ivar players: The player slots.
+    :ivar flags: The NetworkItemFlag values.
+    """
+
+    __slots__ = ("flags", "items", "locations", "players")
+
+    def __init__(self, items: array | None = None, locations: array | None = None,
+                 players: array | None = None, flags: array | None = None):
+        self.items: array = array("q") if items is None else items
+        self.locations: array = array("q") if locations is None else locations
+        self.players: array = array("q") if players is None else players
+        self.flags: array = array("q") if flags is None else flags
+
+        if not len(self.items) == len(self.locations) == len(self.players) == len(self.flags):
+            raise ValueError("All columns must be of the same length.")
+
+    @classmethod
+    def from_json(cls, network_items: list[dict]) -> Self:
+        """
+        Builds the columns from decoded JSON network items.
+        """
+
+        return cls(
+            array("q", map(_ITEM_GETTER, network_items)),
+            array("q", map(_LOCATION_GETTER, network_items)),
+            array("q", map(_PLAYER_GETTER, network_items)),
+            array("q", map(_FLAGS_GETTER, network_items)),
+        )
+
+    @classmethod
+    def from_network_items(cls, network_items: Iterable[NetworkItem]) -> Self:
+        columns: Self = cls()
+
+        for network_item in network_items:
+            columns.items.append(network_item.item)
+            columns.locations.append(network_item.location)
+            columns.players.append(network_item.player)
+            columns.flags.append(network_item.flags)
+
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> NetworkItem:
+        return NetworkItem(
+            item=self.items[index],
+            location=self.locations[index],
+            player=self.players[index],
+            flags=NetworkItemFlag(self.flags[index])
+        )
+
+    def __iter__(self) -> Iterator[NetworkItem]:
+        for index in range(len(self)):
+            yield self[index]
+
+    # the columns are mutable, so they are not hashable
+    __hash__ = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NetworkItemColumns):
+            return NotImplemented
+
+        return (
+            self.items == other.items and
+            self.locations == other.locations and
+            self.players == other.players and
+            self.flags == other.flags
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)})"
+
+    def has_flag(self, flag: NetworkItemFlag) -> list[bool]:
+        """
+        Returns for every entry whether all bits of the flag are set, e.g. has_flag(NetworkItemFlag.MINOR)
+        returns which items are progression items. NetworkItemFlag.COMMON matches entries without any flags.
+        """
+
+        if flag == NetworkItemFlag.COMMON:
+            return [not f for f in self.flags]
+
+        return [f & flag == flag for f in self.flags]
+
+    def select(self, mask: Iterable[bool]) -> Self:
+        """
+        Returns new columns only containing the entries where the mask is true.
+        """
+
+        indices: list[int] = [index for index, selected in enumerate(mask) if selected]
+
+        return self.__class__(
+            array("q", [self.items[i] for i in indices]),
+            array("q", [self.locations[i] for i in indices]),
+            array("q", [self.players[i] for i in indices]),
+            array("q", [self.flags[i] for i in indices]),
+        )
+
+    def to_numpy(self) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns zero-copy int64 NumPy views of the item, location, player and flags columns.
+        :raises ImportError: If NumPy is not installed.
+        """
+
+        if numpy is None:
+            raise ImportError("NetworkItemColumns.to_numpy requires the numpy package to be installed.")
+
+        return (
+            numpy.frombuffer(self.items, dtype=numpy.int64),
+            numpy.frombuffer(self.locations, dtype=numpy.int64),
+            numpy.frombuffer(self.players, dtype=numpy.int64),
+            numpy.frombuffer(self.flags, dtype=numpy.int64),
+        )
+
+
+class ReceivedItemsColumns:
+    """
+    Columnar counterpart of the ReceivedItems packet.
+
+    :ivar items: The items which the client is receiving.
+    :ivar index: The next empty slot in the list of items for the receiving client.
+    """
+
+    __slots__ = ("index", "items")
+
+    cmd: Literal["ReceivedItems"] = "ReceivedItems"
+
+    def __init__(self, items: NetworkItemColumns, index: int):
+        self.items: NetworkItemColumns = items
+        self.index: int = index
+
+    @classmethod
+    def from_json(cls, data: dict) -> Self:
+        return cls(NetworkItemColumns.from_json(data["items"]), data["index"])
+
+
+class LocationInfoColumns:
+    """
+    Columnar counterpart of the LocationInfo packet.
+
+    :ivar locations: Contains the item(s) in the location(s) scouted.
+    """
+
+    __slots__ = ("locations",)
+
+    cmd: Literal["LocationInfo"] = "LocationInfo"
+
+    def __init__(self, locations: NetworkItemColumns):
+        self.locations: NetworkItemColumns = locations
+
+    @classmethod
+    def from_json(cls, data: dict) -> Self:
+        return cls(NetworkItemColumns.from_json(data["locations"]))
+
+
+# Maps the cmd field of server packets to their columnar counterpart.
+COLUMNAR_PACKET_TYPES: Final[MappingProxyType[str, type[ReceivedItemsColumns | LocationInfoColumns]]] = (
+    MappingProxyType({
+        ReceivedItemsColumns.cmd: ReceivedItemsColumns,
+        LocationInfoColumns.cmd: LocationInfoColumns,
+    })
+)
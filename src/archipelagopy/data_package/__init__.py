@@ -0,0 +1,22 @@
+from archipelagopy.data_package.cache import CachedGameData, DataPackageCache
+from archipelagopy.data_package.index import (
+    DataPackageIndex,
+    GameDataIndex,
+    IdNameIndex,
+    IdRangeIndex,
+    get_game_data_index,
+)
+from archipelagopy.data_package.store import DataPackageStore
+from archipelagopy.data_package.streaming import iter_frame
+
+__all__ = [
+    "CachedGameData",
+    "DataPackageCache",
+    "DataPackageIndex",
+    "DataPackageStore",
+    "GameDataIndex",
+    "IdNameIndex",
+    "IdRangeIndex",
+    "get_game_data_index",
+    "iter_frame"
+]
@@ -0,0 +1,245 @@
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Final, NamedTuple
+
+from archipelagopy.structs.game_data import GameData
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+_MAGIC: Final[bytes] = b"APDP"
+_VERSION: Final[int] = 1
+
+# magic, version, length of the game name, length of the checksum, number of items, number of locations
+_HEADER: Final[struct.Struct] = struct.Struct("<4sHHHII")
+
+# checksums are used as file names, so only allow what the server sends (hex encoded hashes)
+_CHECKSUM_PATTERN: Final[re.Pattern] = re.compile(r"[0-9A-Za-z]{1,128}")
+# characters of game names which are not kept in file names
+_UNSAFE_NAME_PATTERN: Final[re.Pattern] = re.compile(r"[^0-9A-Za-z_-]+")
+
+_NAME_SEPARATOR: Final[str] = "\0"
+
+
+class CachedGameData(NamedTuple):
+    """
+    Columns of a cached GameData file, ids are sorted in ascending order with the names in the same order.
+    """
+
+    game: str
+    checksum: str
+    item_ids: array
+    item_names: list[str]
+    location_ids: array
+    location_names: list[str]
+
+    def to_game_data(self) -> GameData:
+        return GameData(
+            checksum=self.checksum,
+            item_name_to_id=dict(zip(self.item_names, self.item_ids, strict=True)),
+            location_name_to_id=dict(zip(self.location_names, self.location_ids, strict=True)),
+        )
+
+
+def _sorted_columns(name_to_id: Mapping[str, int]) -> tuple[array, list[str]]:
+    entries: list[tuple[int, str]] = sorted((i, name) for name, i in name_to_id.items())
+    return array("q", (i for i, _ in entries)), [name for _, name in entries]
+
+
+def _ids_to_bytes(ids: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        ids = array("q", ids)
+        ids.byteswap()
+
+    return ids.tobytes()
+
+
+def _ids_from_buffer(buffer: bytes | memoryview) -> array:
+    ids: array = array("q")
+    ids.frombytes(buffer)
+
+    if sys.byteorder == "big":  # pragma: no cover
+        ids.byteswap()
+
+    return ids
+
+
+def _names_from_buffer(buffer: bytes | memoryview, count: int) -> list[str]:
+    if count == 0:
+        return []
+
+    return str(buffer, "utf-8").split(_NAME_SEPARATOR)
+
+
+class DataPackageCache:
+    """
+    Persistent on-disk cache of the data packages of games, keyed by game name and checksum.
+
+    Every game is stored in its own file named after the game and the checksum, in a compact binary format:
+    a header, the item and location ids as little-endian int64 columns sorted by id, followed by the null separated
+    names in the same order. Files are read with a single read and written atomically, so multiple processes
+    can share a cache directory.
+    """
+
+    SUFFIX: str = ".apdp"
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        :param path: Directory to store the cache files in. Is created if it does not exist.
+        """
+
+        self.__path: Path = Path(path)
+        self.__path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def _get_file(self, game: str, checksum: str) -> Path | None:
+        if _CHECKSUM_PATTERN.fullmatch(checksum) is None:
+            return None
+
+        # game names can contain any character, the digest keeps names which only differ in those apart
+        digest: str = hashlib.blake2b(game.encode("utf-8"), digest_size=8).hexdigest()
+        safe_name: str = _UNSAFE_NAME_PATTERN.sub("_", game)[:64]
+        return self.__path / f"{safe_name}-{digest}-{checksum}{self.SUFFIX}"
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        game, checksum = key
+
+        file: Path | None = self._get_file(game, checksum)
+        if file is None:
+            return False
+
+        expected: bytes = game.encode("utf-8") + checksum.encode("ascii")
+        try:
+            with open(file, "rb") as f:
+                header: bytes = f.read(_HEADER.size + len(expected))
+        except OSError:
+            return False
+
+        return (
+            len(header) == _HEADER.size + len(expected) and
+            _HEADER.unpack_from(header)[:4] == (_MAGIC, _VERSION, len(game.encode("utf-8")), len(checksum)) and
+            header[_HEADER.size:] == expected
+        )
+
+    def missing(self, checksums: Mapping[str, str]) -> list[str]:
+        """
+        Returns the games whose data package is missing or stale.
+        :param checksums: Maps game names to checksums, e.g. RoomInfo.datapackage_checksums.
+        """
+
+        return [game for game, checksum in checksums.items() if (game, checksum) not in self]
+
+    def load_columns(self, game: str, checksum: str) -> CachedGameData | None:
+        """
+        Loads the columns of a cached game, returns None if the game is not cached or the file is invalid.
+        """
+
+        file: Path | None = self._get_file(game, checksum)
+        if file is None:
+            return None
+
+        try:
+            with open(file, "rb") as f:
+                view: memoryview = memoryview(f.read())
+
+            return self._parse(view, game, checksum)
+        except (OSError, ValueError, struct.error) as error:
+            if not isinstance(error, FileNotFoundError):
+                _LOGGER.warning("Ignoring invalid data package cache file %s: %s", file, error)
+            return None
+
+    @staticmethod
+    def _parse(view: memoryview, game: str, checksum: str) -> CachedGameData | None:
+        magic, version, game_len, checksum_len, item_count, location_count = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("unknown file format")
+
+        offset: int = _HEADER.size
+        cached_game: str = str(view[offset:offset + game_len], "utf-8")
+        offset += game_len
+        cached_checksum: str = str(view[offset:offset + checksum_len], "ascii")
+        offset += checksum_len
+
+        if cached_game != game or cached_checksum != checksum:
+            return None
+
+        item_ids: array = _ids_from_buffer(view[offset:offset + item_count * 8])
+        offset += item_count * 8
+        location_ids: array = _ids_from_buffer(view[offset:offset + location_count * 8])
+        offset += location_count * 8
+
+        item_names_len, location_names_len = struct.unpack_from("<II", view, offset)
+        offset += 8
+        if offset + item_names_len + location_names_len != len(view):
+            raise ValueError("unexpected file size")
+
+        item_names: list[str] = _names_from_buffer(view[offset:offset + item_names_len], item_count)
+        offset += item_names_len
+        location_names: list[str] = _names_from_buffer(view[offset:offset + location_names_len], location_count)
+
+        if len(item_names) != item_count or len(location_names) != location_count:
+            raise ValueError("corrupted names")
+
+        return CachedGameData(game, checksum, item_ids, item_names, location_ids, location_names)
+
+    def get(self, game: str, checksum: str) -> GameData | None:
+        """
+        Returns the cached data package of a game, or None if it is missing or stale.
+        """
+
+        columns: CachedGameData | None = self.load_columns(game, checksum)
+        return None if columns is None else columns.to_game_data()
+
+    def put(self, game: str, data: GameData) -> bool:
+        """
+        Stores the data package of a game. Returns False if the data package cannot be cached,
+        because of an invalid checksum or names containing null characters.
+        """
+
+        file: Path | None = self._get_file(game, data.checksum)
+        if file is None:
+            return False
+
+        item_ids, item_names = _sorted_columns(data.item_name_to_id)
+        location_ids, location_names = _sorted_columns(data.location_name_to_id)
+
+        if any(_NAME_SEPARATOR in name for name in (*item_names, *location_names)):
+            return False
+
+        game_bytes: bytes = game.encode("utf-8")
+        checksum_bytes: bytes = data.checksum.encode("ascii")
+        item_names_bytes: bytes = _NAME_SEPARATOR.join(item_names).encode("utf-8")
+        location_names_bytes: bytes = _NAME_SEPARATOR.join(location_names).encode("utf-8")
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(
+                    _MAGIC, _VERSION, len(game_bytes), len(checksum_bytes), len(item_ids), len(location_ids)
+                ))
+                f.write(game_bytes)
+                f.write(checksum_bytes)
+                f.write(_ids_to_bytes(item_ids))
+                f.write(_ids_to_bytes(location_ids))
+                f.write(struct.pack("<II", len(item_names_bytes), len(location_names_bytes)))
+                f.write(item_names_bytes)
+                f.write(location_names_bytes)
+
+            os.replace(tmp_path, file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+        return True
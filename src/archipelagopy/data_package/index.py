@@ -0,0 +1,338 @@
+import sys
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Final, Self
+
+from archipelagopy.data_package.cache import CachedGameData
+from archipelagopy.structs.game_data import GameData
+
+
+class IdNameIndex:
+    """
+    Bidirectional index between ids and names, which is much more compact than a pair of dictionaries.
+    Ids are stored in a sorted int64 array with the interned names in the same order, and the name order
+    in a separate uint32 array. Both directions are looked up with a binary search.
+
+    :ivar ids: The ids in ascending order.
+    :ivar names: The names in the order of the ids.
+    """
+
+    __slots__ = ("_name_order", "ids", "names")
+
+    def __init__(self, ids: array, names: list[str]):
+        """
+        :param ids: The ids in ascending order.
+        :param names: The names in the order of the ids.
+        """
+
+        if len(ids) != len(names):
+            raise ValueError("ids and names must be of the same length.")
+
+        self.ids: array = ids
+        self.names: list[str] = [sys.intern(name) for name in names]
+        self._name_order: array = array("I", sorted(range(len(self.names)), key=self.names.__getitem__))
+
+    @classmethod
+    def from_mapping(cls, name_to_id: Mapping[str, int]) -> Self:
+        entries: list[tuple[int, str]] = sorted((i, name) for name, i in name_to_id.items())
+        return cls(array("q", (i for i, _ in entries)), [name for _, name in entries])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return zip(self.ids, self.names)
+
+    # compared by value like the arrays it wraps, which are not hashable either
+    __hash__ = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdNameIndex):
+            return NotImplemented
+
+        return self.ids == other.ids and self.names == other.names
+
+    def get_name(self, id_: int) -> str | None:
+        index: int = bisect_left(self.ids, id_)
+        if index < len(self.ids) and self.ids[index] == id_:
+            return self.names[index]
+
+        return None
+
+    def get_id(self, name: str) -> int | None:
+        index: int = bisect_left(self._name_order, name, key=self.names.__getitem__)
+        if index < len(self._name_order) and self.names[self._name_order[index]] == name:
+            return self.ids[self._name_order[index]]
+
+        return None
+
+    def to_dict(self) -> dict[str, int]:
+        return dict(zip(self.names, self.ids, strict=True))
+
+
+class GameDataIndex:
+    """
+    Bidirectional id/name index of the items and locations of a game.
+    Use get_game_data_index() to share the index of a checksum.
+
+    :ivar checksum: The checksum of the indexed GameData.
+    :ivar items: Index of the item ids and names.
+    :ivar locations: Index of the location ids and names.
+    """
+
+    __slots__ = ("__weakref__", "checksum", "items", "locations")
+
+    def __init__(self, checksum: str, items: IdNameIndex, locations: IdNameIndex):
+        self.checksum: str = checksum
+        self.items: IdNameIndex = items
+        self.locations: IdNameIndex = locations
+
+    @classmethod
+    def from_game_data(cls, data: GameData) -> Self:
+        return cls(
+            data.checksum,
+            IdNameIndex.from_mapping(data.item_name_to_id),
+            IdNameIndex.from_mapping(data.location_name_to_id),
+        )
+
+    @classmethod
+    def from_cached(cls, cached: CachedGameData) -> Self:
+        """
+        Builds the index from the columns of a cached game, which are already sorted by id.
+        """
+
+        return cls(
+            cached.checksum,
+            IdNameIndex(cached.item_ids, cached.item_names),
+            IdNameIndex(cached.location_ids, cached.location_names),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(checksum={self.checksum!r}, "
+            f"items={len(self.items)}, locations={len(self.locations)})"
+        )
+
+    def get_item_name(self, item_id: int) -> str | None:
+        return self.items.get_name(item_id)
+
+    def get_item_id(self, item_name: str) -> int | None:
+        return self.items.get_id(item_name)
+
+    def get_location_name(self, location_id: int) -> str | None:
+        return self.locations.get_name(location_id)
+
+    def get_location_id(self, location_name: str) -> int | None:
+        return self.locations.get_id(location_name)
+
+    def to_game_data(self) -> GameData:
+        return GameData(
+            checksum=self.checksum,
+            item_name_to_id=self.items.to_dict(),
+            location_name_to_id=self.locations.to_dict(),
+        )
+
+
+# Indexes which are still referenced, keyed by checksum.
+_INDEXES: Final[weakref.WeakValueDictionary[str, GameDataIndex]] = weakref.WeakValueDictionary()
+
+
+def get_game_data_index(data: GameData) -> GameDataIndex:
+    """
+    Returns the index of a GameData. The index is shared by everyone using the same checksum,
+    as long as it is referenced.
+    """
+
+    index: GameDataIndex | None = _INDEXES.get(data.checksum)
+    if index is None:
+        index = _INDEXES[data.checksum] = GameDataIndex.from_game_data(data)
+
+    return index
+
+
+class IdRangeIndex:
+    """
+    Interval index over the id ranges of multiple games, which resolves an id to the game and name it belongs to.
+    The ranges are split into disjoint segments, each with the games whose range covers it, so resolving an id
+    is a binary search for its segment followed by a binary search in the ids of each of the segment's games.
+    Ranges of different games may overlap, in which case the game added first is preferred.
+    The segments are rebuilt on the first lookup after games were added or removed.
+    """
+
+    def __init__(self):
+        self.__games: dict[str, IdNameIndex] = {}
+
+        # start of every segment and the games covering it
+        self.__starts: array = array("q")
+        self.__segments: list[tuple[tuple[str, IdNameIndex], ...]] = []
+        self.__dirty: bool = False
+
+    def __len__(self) -> int:
+        return len(self.__games)
+
+    def __contains__(self, game: str) -> bool:
+        return game in self.__games
+
+    def add(self, game: str, index: IdNameIndex):
+        """
+        Adds or replaces the ids of a game.
+        """
+
+        self.__games[game] = index
+        self.__dirty = True
+
+    def add_many(self, games: Mapping[str, IdNameIndex]):
+        """
+        Adds or replaces the ids of multiple games, in the order of the mapping.
+        """
+
+        self.__games.update(games)
+        self.__dirty = True
+
+    def remove(self, game: str):
+        if self.__games.pop(game, None) is not None:
+            self.__dirty = True
+
+    def _get_segments(self) -> tuple[array, list[tuple[tuple[str, IdNameIndex], ...]]]:
+        if self.__dirty:
+            self._build()
+            self.__dirty = False
+
+        return self.__starts, self.__segments
+
+    def _build(self):
+        # sweep over the start and end boundaries of all ranges, keeping the covering games in the order added
+        starting: dict[int, list[int]] = {}
+        ending: dict[int, list[int]] = {}
+        games: list[tuple[str, IdNameIndex]] = [(game, index) for game, index in self.__games.items() if len(index)]
+        for rank, (_, index) in enumerate(games):
+            starting.setdefault(index.ids[0], []).append(rank)
+            ending.setdefault(index.ids[-1] + 1, []).append(rank)
+
+        active: set[int] = set()
+        starts: array = array("q")
+        segments: list[tuple[tuple[str, IdNameIndex], ...]] = []
+        for boundary in sorted(starting.keys() | ending.keys()):
+            active.difference_update(ending.get(boundary, ()))
+            active.update(starting.get(boundary, ()))
+            covering: tuple[tuple[str, IdNameIndex], ...] = tuple(games[rank] for rank in sorted(active))
+
+            # merge adjacent segments with the same games
+            if segments and [game for game, _ in segments[-1]] == [game for game, _ in covering]:
+                continue
+
+            starts.append(boundary)
+            segments.append(covering)
+
+        self.__starts = starts
+        self.__segments = segments
+
+    def resolve(self, id_: int) -> tuple[str, str] | None:
+        """
+        Returns the game and name of an id, or None if no game contains it.
+        """
+
+        starts, segments = self._get_segments()
+        segment: int = bisect_right(starts, id_) - 1
+        if segment < 0:
+            return None
+
+        for game, index in segments[segment]:
+            name: str | None = index.get_name(id_)
+            if name is not None:
+                return game, name
+
+        return None
+
+    def resolve_all(self, id_: int) -> list[tuple[str, str]]:
+        """
+        Returns the game and name of every game containing the id.
+        """
+
+        starts, segments = self._get_segments()
+        segment: int = bisect_right(starts, id_) - 1
+        if segment < 0:
+            return []
+
+        resolved: list[tuple[str, str]] = []
+        for game, index in segments[segment]:
+            name: str | None = index.get_name(id_)
+            if name is not None:
+                resolved.append((game, name))
+
+        return resolved
+
+    def resolve_many(self, ids: Iterable[int]) -> list[tuple[str, str] | None]:
+        """
+        Resolves multiple ids at once, e.g. an id column of NetworkItemColumns.
+        Consecutive ids of the same segment, which are common in item lists, skip the segment search.
+        """
+
+        starts, segments = self._get_segments()
+
+        resolved: list[tuple[str, str] | None] = []
+        append = resolved.append
+
+        low: int = 1
+        high: int = 0
+        games: tuple[tuple[str, IdNameIndex], ...] = ()
+        for id_ in ids:
+            if not low <= id_ < high:
+                segment: int = bisect_right(starts, id_) - 1
+                if segment < 0:
+                    append(None)
+                    continue
+
+                low = starts[segment]
+                high = starts[segment + 1] if segment + 1 < len(starts) else sys.maxsize
+                games = segments[segment]
+
+            for game, index in games:
+                name: str | None = index.get_name(id_)
+                if name is not None:
+                    append((game, name))
+                    break
+            else:
+                append(None)
+
+        return resolved
+
+
+class DataPackageIndex:
+    """
+    Resolves item and location ids of all added games, regardless of the slot they belong to.
+
+    :ivar items: Range index of the item ids.
+    :ivar locations: Range index of the location ids.
+    """
+
+    def __init__(self):
+        self.items: IdRangeIndex = IdRangeIndex()
+        self.locations: IdRangeIndex = IdRangeIndex()
+
+    def add(self, game: str, data: GameData | GameDataIndex):
+        if isinstance(data, GameData):
+            data = get_game_data_index(data)
+
+        self.items.add(game, data.items)
+        self.locations.add(game, data.locations)
+
+    def add_many(self, games: Mapping[str, GameData | GameDataIndex]):
+        indexes: dict[str, GameDataIndex] = {
+            game: get_game_data_index(data) if isinstance(data, GameData) else data for game, data in games.items()
+        }
+
+        self.items.add_many({game: index.items for game, index in indexes.items()})
+        self.locations.add_many({game: index.locations for game, index in indexes.items()})
+
+    def remove(self, game: str):
+        self.items.remove(game)
+        self.locations.remove(game)
+
+    def resolve_item(self, item_id: int) -> tuple[str, str] | None:
+        return self.items.resolve(item_id)
+
+    def resolve_location(self, location_id: int) -> tuple[str, str] | None:
+        return self.locations.resolve(location_id)
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Mapping
+from typing import Final
+
+from archipelagopy.data_package.cache import DataPackageCache
+from archipelagopy.data_package.index import GameDataIndex, get_game_data_index
+from archipelagopy.structs.game_data import GameData
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+StoreKey = tuple[str, str]
+
+
+class DataPackageStore:
+    """
+    In-memory store of the data packages of games, keyed by game name and checksum, which can be shared by
+    all clients of a process (and event loop).
+
+    Data packages are fetched single-flight: while a data package is requested by one client, other clients
+    wait for its result instead of requesting it again. Every client holds a reference to the data packages
+    of its room, data packages are evicted once no client references them anymore.
+    """
+
+    def __init__(self, cache: DataPackageCache | None = None):
+        """
+        :param cache: An optional on-disk cache, which is checked before requesting data packages
+         and stores every received data package.
+        """
+
+        self.__cache: DataPackageCache | None = cache
+
+        self.__data: dict[StoreKey, GameData] = {}
+        self.__indexes: dict[StoreKey, GameDataIndex] = {}
+        self.__pending: dict[StoreKey, tuple[asyncio.Future[GameData], Hashable]] = {}
+        self.__refcounts: dict[StoreKey, int] = {}
+        self.__owners: dict[Hashable, set[StoreKey]] = {}
+
+    @property
+    def cache(self) -> DataPackageCache | None:
+        return self.__cache
+
+    def __contains__(self, key: StoreKey) -> bool:
+        return key in self.__data
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def get(self, game: str, checksum: str) -> GameData | None:
+        return self.__data.get((game, checksum))
+
+    def get_index(self, game: str, checksum: str) -> GameDataIndex | None:
+        """
+        Returns the shared id/name index of a stored data package, which is built on first use.
+        """
+
+        key: StoreKey = (game, checksum)
+        index: GameDataIndex | None = self.__indexes.get(key)
+        if index is None and key in self.__data:
+            index = self.__indexes[key] = get_game_data_index(self.__data[key])
+
+        return index
+
+    def refcount(self, game: str, checksum: str) -> int:
+        return self.__refcounts.get((game, checksum), 0)
+
+    def is_pending(self, game: str, checksum: str) -> bool:
+        return (game, checksum) in self.__pending
+
+    def acquire(self, owner: Hashable, game: str, checksum: str):
+        """
+        Adds a reference of the owner to a data package. Every owner holds at most one reference per data package.
+        """
+
+        keys: set[StoreKey] = self.__owners.setdefault(owner, set())
+        key: StoreKey = (game, checksum)
+
+        if key not in keys:
+            keys.add(key)
+            self.__refcounts[key] = self.__refcounts.get(key, 0) + 1
+
+    def release(self, owner: Hashable):
+        """
+        Removes all references of the owner and cancels its pending requests, so other waiting owners
+        request the data packages themselves. Data packages without references are evicted.
+        """
+
+        for key in self.__owners.pop(owner, ()):
+            refcount: int = self.__refcounts[key] - 1
+            if refcount:
+                self.__refcounts[key] = refcount
+                continue
+
+            del self.__refcounts[key]
+            self.__data.pop(key, None)
+            self.__indexes.pop(key, None)
+
+        for key, (future, pending_owner) in list(self.__pending.items()):
+            if pending_owner == owner:
+                del self.__pending[key]
+                future.cancel()
+
+    def _claim(self, owner: Hashable, key: StoreKey) -> asyncio.Future[GameData]:
+        future: asyncio.Future[GameData] = asyncio.get_running_loop().create_future()
+        self.__pending[key] = (future, owner)
+        return future
+
+    def _set(self, key: StoreKey, data: GameData):
+        if key in self.__refcounts:
+            self.__data[key] = data
+
+        pending: tuple[asyncio.Future[GameData], Hashable] | None = self.__pending.pop(key, None)
+        if pending is not None and not pending[0].done():
+            pending[0].set_result(data)
+
+    async def put(self, game: str, data: GameData):
+        """
+        Stores a received data package, resolves the pending request for it and adds it to the cache.
+        """
+
+        self._set((game, data.checksum), data)
+
+        if self.__cache is not None:
+            await asyncio.to_thread(self.__cache.put, game, data)
+
+    async def fetch(self, owner: Hashable, checksums: Mapping[str, str],
+                    request: Callable[[list[str]], Awaitable[None]]) -> AsyncIterator[tuple[str, GameData]]:
+        """
+        Acquires references to the data packages of the owner's room and yields (game, data) for every game
+        as soon as it is available. Games which are neither stored, cached, nor requested by another owner are
+        requested with a single call of request, their data packages have to be passed to put() once received.
+        :param owner: The owner of the references and requests, e.g. a client.
+        :param checksums: Maps game names to checksums, e.g. RoomInfo.datapackage_checksums.
+        :param request: Requests the data packages of the given games, e.g. by sending a GetDataPackage.
+        """
+
+        waiting: dict[asyncio.Future[GameData], str] = {}
+        missing: list[str] = []
+
+        for game, checksum in checksums.items():
+            key: StoreKey = (game, checksum)
+            self.acquire(owner, game, checksum)
+
+            data: GameData | None = self.__data.get(key)
+            if data is not None:
+                yield game, data
+                continue
+
+            pending: tuple[asyncio.Future[GameData], Hashable] | None = self.__pending.get(key)
+            if pending is not None:
+                waiting[pending[0]] = game
+                continue
+
+            future: asyncio.Future[GameData] = self._claim(owner, key)
+            if self.__cache is not None:
+                data = await asyncio.to_thread(self.__cache.get, game, checksum)
+                if data is not None:
+                    self._set(key, data)
+                    yield game, data
+                    continue
+
+            waiting[future] = game
+            missing.append(game)
+
+        if missing:
+            _LOGGER.debug("Requesting data packages of %s", missing)
+            await request(missing)
+
+        async for game, data in self._wait(owner, checksums, request, waiting):
+            yield game, data
+
+    async def _wait(self, owner: Hashable, checksums: Mapping[str, str],
+                    request: Callable[[list[str]], Awaitable[None]],
+                    waiting: dict[asyncio.Future[GameData], str]) -> AsyncIterator[tuple[str, GameData]]:
+        """
+        Yields the data packages of the waiting requests as they are received, and requests them again
+        if the owner of a request released it before receiving the data package.
+        """
+
+        while waiting:
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                game: str = waiting.pop(future)
+
+                if not future.cancelled():
+                    yield game, future.result()
+                    continue
+
+                # the owner of the request released it before receiving the data package, so request it again
+                key: StoreKey = (game, checksums[game])
+                data: GameData | None = self.__data.get(key)
+                if data is not None:
+                    yield game, data
+                    continue
+
+                pending: tuple[asyncio.Future[GameData], Hashable] | None = self.__pending.get(key)
+                if pending is not None:
+                    waiting[pending[0]] = game
+                    continue
+
+                waiting[self._claim(owner, key)] = game
+                await request([game])
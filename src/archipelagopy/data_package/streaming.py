@@ -0,0 +1,161 @@
+import json
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, Final
+
+_WHITESPACE: Final[re.Pattern] = re.compile(r"[ \t\n\r]*")
+_STRING: Final[re.Pattern] = re.compile(r'"[^"\\]*+(?:\\.[^"\\]*+)*+"', re.DOTALL)
+# skips everything up to the next bracket which is not part of a string, the quantifiers are possessive, so a
+# truncated or malformed document fails in linear time instead of backtracking
+_STRUCTURE: Final[re.Pattern] = re.compile(r'(?:[^"\[\]{}]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+([\[\]{}])', re.DOTALL)
+_PRIMITIVE: Final[re.Pattern] = re.compile(r"[^,:\[\]{}\s]+")
+
+
+class _Scanner:
+    """
+    Minimal JSON scanner which walks the structure of a document and only decodes the values it is asked for.
+    Values are located by the scanner and decoded with the given loads function.
+    """
+
+    def __init__(self, text: str, loads: Callable[[str], Any]):
+        self.text: str = text
+        self.pos: int = 0
+        self.loads: Callable[[str], Any] = loads
+
+    def peek(self) -> str:
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+
+        if self.pos >= len(self.text):
+            raise ValueError("Unexpected end of JSON document")
+
+        return self.text[self.pos]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at position {self.pos}")
+
+        self.pos += 1
+
+    def skip(self) -> int:
+        """
+        Moves past the next value without decoding it and returns its start position.
+        """
+
+        char: str = self.peek()
+        start: int = self.pos
+
+        if char in "[{":
+            depth: int = 0
+            structure: re.Match | None = _STRUCTURE.match(self.text, self.pos)
+            while structure is not None:
+                self.pos = structure.end()
+                depth += 1 if structure.group(1) in "[{" else -1
+                if depth == 0:
+                    return start
+
+                structure = _STRUCTURE.match(self.text, self.pos)
+        else:
+            value: re.Match | None = (_STRING if char == '"' else _PRIMITIVE).match(self.text, self.pos)
+            if value is not None:
+                self.pos = value.end()
+                return start
+
+        raise ValueError(f"Invalid JSON value at position {start}")
+
+    def value(self) -> Any:
+        start: int = self.skip()
+        return self.loads(self.text[start:self.pos])
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Iterates over the keys of an object. The value of every key has to be consumed by the caller.
+        """
+
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise ValueError(f"Expected an object key at position {self.pos}")
+
+            key: str = self.value()
+            self.expect(":")
+            yield key
+
+            if self.peek() == "}":
+                self.pos += 1
+                return
+
+            self.expect(",")
+
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Iterates over the items of an array. Every item has to be consumed by the caller.
+        """
+
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield None
+
+            if self.peek() == "]":
+                self.pos += 1
+                return
+
+            self.expect(",")
+
+
+def _iter_data(scanner: _Scanner, data: dict) -> Iterator[tuple[str, dict]]:
+    """
+    Streams the games of the data object of a DataPackage, all other keys are stored in data.
+    """
+
+    for key in scanner.iter_keys():
+        if key != "games" or scanner.peek() != "{":
+            data[key] = scanner.value()
+            continue
+
+        data[key] = {}
+        for game in scanner.iter_keys():
+            yield game, scanner.value()
+
+
+def iter_frame(text: str, loads: Callable[[str], Any] = json.loads) -> Iterator[tuple[str | None, dict]]:
+    """
+    Decodes a frame (a JSON array of packets) and streams the games of DataPackage packets one at a time,
+    so the decoded games never have to exist all at once.
+
+    Yields (game, game_data) for every game of a streamed DataPackage, and (None, packet) for every packet
+    of the frame. The packet of a streamed DataPackage is yielded after its games and contains an empty games
+    object. DataPackages are only streamed if their cmd field comes before their data field, which is the
+    order the Archipelago server sends them in, otherwise they are decoded as a whole.
+    Scanning the frame is an extra pass over it, so streaming takes up to about twice as long as a single loads.
+
+    :param loads: Decodes a single JSON value, e.g. the loads of the codec of a client.
+    """
+
+    scanner: _Scanner = _Scanner(text, loads)
+
+    for _ in scanner.iter_items():
+        if scanner.peek() != "{":
+            yield None, scanner.value()
+            continue
+
+        packet: dict = {}
+        for key in scanner.iter_keys():
+            if key == "data" and packet.get("cmd") == "DataPackage" and scanner.peek() == "{":
+                data: dict = {}
+                yield from _iter_data(scanner, data)
+                packet[key] = data
+            else:
+                packet[key] = scanner.value()
+
+        yield None, packet
+
+    if _WHITESPACE.match(text, scanner.pos).end() != len(text):
+        raise ValueError(f"Extra data at position {scanner.pos}")
@@ -0,0 +1,219 @@
+import collections
+import contextlib
+import copy
+import logging
+import math
+import operator
+from collections.abc import Callable, Iterable, Iterator
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
+
+from archipelagopy import packets
+from archipelagopy.enums.operation import Operation
+from archipelagopy.structs.data_storage_operation import DataStorageOperation
+
+if TYPE_CHECKING:
+    from archipelagopy.client import Client
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+def _remove(container: list, value: Any) -> list:
+    with contextlib.suppress(ValueError):
+        container.remove(value)
+
+    return container
+
+
+def _pop(container: list | dict, value: Any) -> list | dict:
+    # the server leaves the value unchanged if the index or key does not exist
+    with contextlib.suppress(IndexError, KeyError):
+        container.pop(value)
+
+    return container
+
+
+def _update(container: list | dict, value: Any) -> list | dict:
+    if isinstance(container, list):
+        existing: set = set(container)
+        container.extend(entry for entry in value if entry not in existing)
+    else:
+        container.update(value)
+
+    return container
+
+
+# Implementation of every operation, the same as the Archipelago server.
+OPERATIONS: Final[MappingProxyType[Operation, Callable[[Any, Any], Any]]] = MappingProxyType({
+    Operation.REPLACE: lambda _, value: value,
+    Operation.DEFAULT: lambda current, _: current,
+    Operation.ADD: operator.add,
+    Operation.MUL: operator.mul,
+    Operation.POW: operator.pow,
+    Operation.MOD: operator.mod,
+    Operation.FLOOR: lambda current, _: math.floor(current),
+    Operation.CEIL: lambda current, _: math.ceil(current),
+    Operation.MAX: max,
+    Operation.MIN: min,
+    Operation.AND: operator.and_,
+    Operation.OR: operator.or_,
+    Operation.XOR: operator.xor,
+    Operation.LEFT_SHIFT: operator.lshift,
+    Operation.RIGHT_SHIFT: operator.rshift,
+    Operation.REMOVE: _remove,
+    Operation.POP: _pop,
+    Operation.UPDATE: _update,
+})
+
+
+def apply_operations(value: Any, operations: Iterable[DataStorageOperation]) -> Any:
+    """
+    Applies operations to a value in order, the same as the server does for a Set.
+    The value is copied, so mutable values (lists and dicts) are not modified.
+    """
+
+    value = copy.deepcopy(value)
+    for data_storage_operation in operations:
+        value = OPERATIONS[data_storage_operation.operation](value, data_storage_operation.value)
+
+    return value
+
+
+class DataStorageMirror:
+    """
+    Local mirror of data storage keys. Watched keys are subscribed to with SetNotify, so every change is received
+    as a SetReply and reading them does not require a Get. Operations of Sets sent through the mirror are applied
+    locally right away (optimistic value), and reconciled with the value of the server once its SetReply arrives.
+
+    The mirror registers itself with the client, create it before the client connects.
+    """
+
+    def __init__(self, client: "Client"):
+        self.__client: Client = client
+        self.__slot: int | None = None
+
+        self.__watched: set[str] = set()
+        # values as last received from the server
+        self.__values: dict[str, Any] = {}
+        # values with the operations of sets which have not been answered yet applied
+        self.__optimistic: dict[str, Any] = {}
+        # sets which have not been answered yet, in the order they were sent
+        self.__pending: dict[str, collections.deque[tuple[Any, list[DataStorageOperation]]]] = {}
+
+        client.add_packet_hook(packets.Connected, self._on_connected)
+        client.add_packet_hook(packets.Retrieved, self._on_retrieved)
+        client.add_packet_hook(packets.SetReply, self._on_set_reply)
+
+    @property
+    def watched(self) -> frozenset[str]:
+        return frozenset(self.__watched)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__optimistic
+
+    def __getitem__(self, key: str) -> Any:
+        return self.__optimistic[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__optimistic)
+
+    def __len__(self) -> int:
+        return len(self.__optimistic)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of a key including the operations which have not been confirmed by the server yet.
+        """
+
+        return self.__optimistic.get(key, default)
+
+    def get_confirmed(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of a key as last received from the server.
+        """
+
+        return self.__values.get(key, default)
+
+    def is_pending(self, key: str) -> bool:
+        return key in self.__pending
+
+    async def watch(self, keys: Iterable[str]):
+        """
+        Subscribes to keys and retrieves their current values. The values are available once the server answered.
+        """
+
+        keys = [key for key in keys if key not in self.__watched]
+        if not keys:
+            return
+
+        self.__watched.update(keys)
+        await self._subscribe(keys)
+
+    async def _subscribe(self, keys: list[str]):
+        await self.__client.send(packets.SetNotify(keys=keys))
+        await self.__client.send(packets.Get(keys=keys))
+
+    async def set(self, key: str, operations: Iterable[DataStorageOperation], default: Any = 0) -> Any:
+        """
+        Sends a Set and returns the optimistic value of the key. Keys which are neither watched nor retrieved
+        start from the default value until the server answered.
+        """
+
+        operations = list(operations)
+        self.__pending.setdefault(key, collections.deque()).append((default, operations))
+        self._update_optimistic(key)
+
+        await self.__client.send(packets.Set(key=key, default=default, want_reply=True, operations=operations))
+        return self.__optimistic.get(key)
+
+    def _update_optimistic(self, key: str):
+        pending: collections.deque[tuple[Any, list[DataStorageOperation]]] | None = self.__pending.get(key)
+
+        if key in self.__values:
+            value: Any = self.__values[key]
+        elif pending:
+            value = pending[0][0]
+        else:
+            self.__optimistic.pop(key, None)
+            return
+
+        # every pending set starts from the result of the previous one, the same as on the server
+        try:
+            for _, operations in pending or ():
+                value = apply_operations(value, operations)
+        except (ArithmeticError, TypeError, ValueError, KeyError, AttributeError) as error:
+            _LOGGER.warning("Cannot apply the operations of %s locally: %s", key, error)
+            value = self.__values.get(key)
+
+        self.__optimistic[key] = value
+
+    async def _on_connected(self, packet: packets.Connected):
+        self.__slot = packet.slot
+
+        # unanswered sets of a previous connection are lost and subscriptions have to be renewed
+        pending_keys: list[str] = list(self.__pending)
+        self.__pending.clear()
+        for key in pending_keys:
+            self._update_optimistic(key)
+
+        if self.__watched:
+            await self._subscribe(sorted(self.__watched))
+
+    async def _on_retrieved(self, packet: packets.Retrieved):
+        for key, value in packet.keys.items():
+            if key in self.__watched or key in self.__values:
+                self.__values[key] = value
+                self._update_optimistic(key)
+
+    async def _on_set_reply(self, packet: packets.SetReply):
+        key: str = packet.key
+        pending: collections.deque | None = self.__pending.get(key)
+
+        # the server answers sets in order, so the reply to an own set answers the oldest pending one
+        if pending and (self.__slot is None or packet.slot == self.__slot):
+            pending.popleft()
+            if not pending:
+                del self.__pending[key]
+
+        self.__values[key] = packet.value
+        self._update_optimistic(key)
@@ -0,0 +1,191 @@
+import asyncio
+import collections
+import logging
+import traceback
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Final
+
+from archipelagopy import packets
+from archipelagopy.columns import LocationInfoColumns, ReceivedItemsColumns
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+PacketHandler = Callable[[Any], Awaitable[Any]]
+OrderingKey = Callable[[Any], Hashable | None]
+
+_Job = tuple[PacketHandler, Any]
+
+_SEQUENTIAL: Final[object] = object()
+
+# Packets whose handlers change the game state of a slot, in the order the server sent them.
+GAME_STATE_PACKET_TYPES: Final[frozenset[type]] = frozenset({
+    packets.Connected,
+    packets.ReceivedItems,
+    packets.RoomUpdate,
+    ReceivedItemsColumns,
+})
+
+
+def by_packet_type(packet: Any) -> Hashable:
+    """
+    Orders the handlers of packets of the same type, packets of different types are handled concurrently.
+    Columnar packets are ordered with their regular counterpart.
+    """
+
+    packet_type: type = type(packet)
+    if packet_type is ReceivedItemsColumns:
+        return packets.ReceivedItems
+    if packet_type is LocationInfoColumns:
+        return packets.LocationInfo
+
+    return packet_type
+
+
+def game_state_only(packet: Any) -> Hashable | None:
+    """
+    Orders the handlers of GAME_STATE_PACKET_TYPES, the handlers of all other packets run unordered.
+    """
+
+    return GAME_STATE_PACKET_TYPES if type(packet) in GAME_STATE_PACKET_TYPES else None
+
+
+def sequential(_: Any) -> Hashable:
+    """
+    Orders the handlers of all packets, so they only run outside the receive loop.
+    """
+
+    return _SEQUENTIAL
+
+
+class PacketDispatcher:
+    """
+    Runs packet handlers as tasks, so slow handlers neither block each other nor the receive loop.
+    Handlers of packets with the same ordering key run one after another in the order the packets were dispatched,
+    handlers of packets with different keys (or the key None) run concurrently.
+
+    Exceptions raised by handlers are logged, they do not stop the client.
+    """
+
+    def __init__(self, max_concurrency: int = 16, key: OrderingKey = by_packet_type, max_pending: int = 1024):
+        """
+        :param max_concurrency: Maximum number of handlers running at the same time.
+        :param key: Returns the ordering key of a packet, None if its handler does not have to be ordered.
+        :param max_pending: Maximum number of dispatched packets whose handlers have not finished,
+         dispatch() waits once it is reached, which stops the client from reading further packets.
+        """
+
+        if max_concurrency < 1 or max_pending < 1:
+            raise ValueError("max_concurrency and max_pending must be positive.")
+
+        self.__key: OrderingKey = key
+        self.__concurrency: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self.__slots: asyncio.Semaphore = asyncio.Semaphore(max_pending)
+
+        # packets waiting for the handler of the previous packet with the same key
+        self.__queues: dict[Hashable, collections.deque[_Job]] = {}
+        self.__tasks: set[asyncio.Task] = set()
+
+        self.__pending: int = 0
+        self.__running: int = 0
+        self.__idle: asyncio.Event = asyncio.Event()
+        self.__idle.set()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of dispatched packets whose handlers have not finished.
+        """
+
+        return self.__pending
+
+    @property
+    def running(self) -> int:
+        """
+        Number of handlers which are running.
+        """
+
+        return self.__running
+
+    async def dispatch(self, packet: Any, handler: PacketHandler):
+        """
+        Schedules the handler of a packet, waits while max_pending is reached.
+        """
+
+        await self.__slots.acquire()
+        self.__pending += 1
+        self.__idle.clear()
+
+        key: Hashable | None = self.__key(packet)
+        if key is None:
+            self._spawn(self._run(handler, packet)).add_done_callback(lambda _: self._done())
+            return
+
+        queue: collections.deque[_Job] | None = self.__queues.get(key)
+        if queue is not None:
+            queue.append((handler, packet))
+            return
+
+        self.__queues[key] = collections.deque(((handler, packet),))
+        self._spawn(self._run_ordered(key))
+
+    def _spawn(self, coroutine: Awaitable) -> asyncio.Task:
+        task: asyncio.Task = asyncio.create_task(coroutine, name=f"{__name__}.handler")
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+        return task
+
+    async def _run_ordered(self, key: Hashable):
+        queue: collections.deque[_Job] = self.__queues[key]
+        try:
+            while queue:
+                handler, packet = queue.popleft()
+                try:
+                    await self._run(handler, packet)
+                finally:
+                    self._done()
+        finally:
+            if self.__queues.get(key) is queue:
+                del self.__queues[key]
+
+    async def _run(self, handler: PacketHandler, packet: Any):
+        try:
+            async with self.__concurrency:
+                self.__running += 1
+                try:
+                    await handler(packet)
+                finally:
+                    self.__running -= 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _LOGGER.exception("Handler of %s failed: %s", type(packet).__name__, traceback.format_exc())
+
+    def _done(self):
+        self.__pending -= 1
+        self.__slots.release()
+        if not self.__pending:
+            self.__idle.set()
+
+    async def join(self):
+        """
+        Waits until the handlers of all dispatched packets have finished.
+        """
+
+        await self.__idle.wait()
+
+    async def cancel(self):
+        """
+        Cancels all running handlers and drops the packets waiting for their handlers.
+        """
+
+        for queue in self.__queues.values():
+            for _ in range(len(queue)):
+                self._done()
+            queue.clear()
+        self.__queues.clear()
+
+        tasks: list[asyncio.Task] = list(self.__tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
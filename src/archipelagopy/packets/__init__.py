@@ -26,10 +26,32 @@ from archipelagopy.packets.server.room_info import RoomInfo
 from archipelagopy.packets.server.room_update import RoomUpdate
 from archipelagopy.packets.server.server_packet import ServerPacket
 from archipelagopy.packets.server.set_reply import SetReply
-from archipelagopy.packets.type_adapter import PACKET_TYPE_ADAPTER
+from archipelagopy.packets.trusted_builder import (
+    TRUSTED_PACKET_BUILDERS,
+    build_trusted_packet,
+    create_model_builder,
+)
+from archipelagopy.packets.type_adapter import (
+    CLIENT_PACKET_ADAPTERS,
+    CLIENT_PACKET_TYPE_ADAPTER,
+    CLIENT_PACKET_TYPES,
+    PACKET_TYPE_ADAPTER,
+    SERVER_PACKET_ADAPTERS,
+    SERVER_PACKET_TYPE_ADAPTER,
+    SERVER_PACKET_TYPES,
+    decode_packet,
+    get_packet_adapter,
+)
 
 __all__ = [
+    "CLIENT_PACKET_ADAPTERS",
+    "CLIENT_PACKET_TYPES",
+    "CLIENT_PACKET_TYPE_ADAPTER",
     "PACKET_TYPE_ADAPTER",
+    "SERVER_PACKET_ADAPTERS",
+    "SERVER_PACKET_TYPES",
+    "SERVER_PACKET_TYPE_ADAPTER",
+    "TRUSTED_PACKET_BUILDERS",
     "Bounce",
     "Bounced",
     "ClientPacket",
@@ -57,5 +79,9 @@ __all__ = [
     "SetReply",
     "StatusUpdate",
     "Sync",
-    "UpdateHint"
+    "UpdateHint",
+    "build_trusted_packet",
+    "create_model_builder",
+    "decode_packet",
+    "get_packet_adapter"
 ]
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 from archipelagopy.packets.client.client_packet import ClientPacket
 from archipelagopy.structs.data_storage_operation import DataStorageOperation
@@ -24,6 +24,6 @@ class Set(ClientPacket):
 
     cmd: Literal["Set"] = "Set"
     operations: list[DataStorageOperation]
-    default: int | float
+    default: Any
     key: str
     want_reply: bool
@@ -1,5 +1,7 @@
 from typing import Any, Literal
 
+from pydantic import Field
+
 from archipelagopy.packets.server.server_packet import ServerPacket
 from archipelagopy.structs.network_player import NetworkPlayer
 from archipelagopy.structs.network_slot import NetworkSlot
@@ -33,6 +35,6 @@ class Connected(ServerPacket):
     hint_points: int
     slot_info: dict[int, NetworkSlot]
     players: tuple[NetworkPlayer, ...]
-    missing_location: tuple[int, ...] | None = None
-    checked_location: tuple[int, ...] | None = None
+    missing_location: tuple[int, ...] | None = Field(default=None, validation_alias="missing_locations")
+    checked_location: tuple[int, ...] | None = Field(default=None, validation_alias="checked_locations")
     slot_data: dict[str, Any] | None = None
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Any, Literal
 
+from pydantic import Field
+
 from archipelagopy.packets.server.server_packet import ServerPacket
 from archipelagopy.structs.network_player import NetworkPlayer
 from archipelagopy.structs.network_slot import NetworkSlot
@@ -62,7 +64,7 @@ class RoomUpdate(ServerPacket):
     slot_data: dict[str, Any] | None = None
     slot_info: dict[int, NetworkSlot] | None = None
     players: tuple[NetworkPlayer, ...] | None = None
-    checked_location: tuple[int, ...] | None = None
+    checked_location: tuple[int, ...] | None = Field(default=None, validation_alias="checked_locations")
     team: int | None = None
     slot: int | None = None
     hint_points: int | None = None
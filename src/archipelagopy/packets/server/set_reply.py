@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 from archipelagopy.packets.server.server_packet import ServerPacket
 
@@ -21,7 +21,7 @@ class SetReply(ServerPacket):
     """
 
     cmd: Literal["SetReply"] = "SetReply"
-    value: int | float
-    original_value: int | float
+    value: Any
+    original_value: Any = None
     key: str
     slot: int
@@ -0,0 +1,195 @@
+import types
+from collections.abc import Callable
+from datetime import UTC, datetime
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Final, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from archipelagopy.packets.type_adapter import SERVER_PACKET_TYPES
+
+# Timestamps above this value are interpreted as milliseconds, the same as pydantic does.
+_MS_TIMESTAMP_THRESHOLD: Final[float] = 2e10
+
+_IMMUTABLE_DEFAULT_TYPES: Final[tuple[type, ...]] = (type(None), bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+Converter = Callable[[Any], Any]
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _convert_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+
+    if abs(value) > _MS_TIMESTAMP_THRESHOLD:
+        value /= 1000
+
+    return datetime.fromtimestamp(value, tz=UTC)
+
+
+def _create_enum_converter(enum_type: type[Enum]) -> Converter:
+    members: dict[Any, Enum] = enum_type._value2member_map_
+
+    def convert(value: Any) -> Enum:
+        member: Enum | None = members.get(value)
+        return enum_type(value) if member is None else member
+
+    return convert
+
+
+def _create_converter(annotation: Any) -> Converter | None:
+    """
+    Creates a function which converts a decoded JSON value to the given type annotation.
+    Returns None if the value can be used as is.
+    """
+
+    origin: Any = get_origin(annotation)
+    args: tuple = get_args(annotation)
+
+    if annotation in (Any, int, float, str, bool, dict, list) or origin is Literal:
+        return None
+
+    if annotation is datetime:
+        return _convert_datetime
+
+    if isinstance(annotation, type):
+        return _create_class_converter(annotation)
+
+    if origin in (Union, types.UnionType):
+        return _create_union_converter(annotation, args)
+
+    if origin in (tuple, list, dict):
+        return _create_container_converter(annotation, origin, args)
+
+    # anything else is rare enough to fall back to regular validation
+    return TypeAdapter(annotation).validate_python
+
+
+def _create_class_converter(annotation: type) -> Converter:
+    if issubclass(annotation, Enum):
+        return _create_enum_converter(annotation)
+
+    if issubclass(annotation, BaseModel):
+        return create_model_builder(annotation)
+
+    return TypeAdapter(annotation).validate_python
+
+
+def _create_union_converter(annotation: Any, args: tuple) -> Converter | None:
+    non_none_args: list[Any] = [arg for arg in args if arg is not type(None)]
+
+    if len(non_none_args) == 1:
+        convert: Converter | None = _create_converter(non_none_args[0])
+        if convert is None:
+            return None
+        return lambda value: None if value is None else convert(value)
+
+    if all(_create_converter(arg) is None for arg in non_none_args):
+        return None
+
+    return TypeAdapter(annotation).validate_python
+
+
+def _create_container_converter(annotation: Any, origin: type, args: tuple) -> Converter | None:
+    if origin is list or (origin is tuple and args[1:] == (Ellipsis,)):
+        convert_item: Converter | None = _create_converter(args[0])
+        if convert_item is None:
+            return origin
+        return lambda value: origin(convert_item(item) for item in value)
+
+    if origin is dict:
+        return _create_dict_converter(args[0], args[1])
+
+    # fixed length tuples are rare enough to fall back to regular validation
+    return TypeAdapter(annotation).validate_python
+
+
+def _create_dict_converter(key_type: Any, value_type: Any) -> Converter | None:
+    # JSON object keys are always strings
+    convert_key: Converter | None = int if key_type is int else _create_converter(key_type)
+    convert_value: Converter | None = _create_converter(value_type)
+
+    # decoded JSON objects are owned by the caller and can be used without a copy
+    if convert_key is None and convert_value is None:
+        return None
+
+    convert_key = convert_key or (lambda key: key)
+    convert_value = convert_value or (lambda value: value)
+    return lambda value: {convert_key(k): convert_value(v) for k, v in value.items()}
+
+
+def _get_default_factory(field_info) -> Callable[[], Any]:
+    default: Any = field_info.default
+
+    if field_info.default_factory is None and isinstance(default, _IMMUTABLE_DEFAULT_TYPES):
+        return lambda: default
+
+    return lambda: field_info.get_default(call_default_factory=True)
+
+
+def create_model_builder(model_type: type[M]) -> Callable[[dict], M]:
+    """
+    Creates a function which builds a model from decoded JSON without validating it.
+    Values are only converted where the decoded JSON type differs from the annotated type
+    (e.g. enums, nested models, datetimes and integer dictionary keys).
+    Unknown keys are ignored and missing required fields raise a KeyError.
+    """
+
+    fields: list[tuple[str, str, Converter | None, Callable[[], Any] | None]] = [
+        (
+            name,
+            # fields are read from the key they have on the wire, if it differs from their name
+            field_info.validation_alias if isinstance(field_info.validation_alias, str) else name,
+            _create_converter(field_info.annotation),
+            None if field_info.is_required() else _get_default_factory(field_info)
+        )
+        for name, field_info in model_type.model_fields.items()
+    ]
+
+    def build(data: dict) -> M:
+        values: dict[str, Any] = {}
+        fields_set: set[str] = set()
+
+        for name, key, convert, default_factory in fields:
+            if key in data:
+                value: Any = data[key]
+                values[name] = value if convert is None else convert(value)
+                fields_set.add(name)
+            elif default_factory is None:
+                raise KeyError(f"{model_type.__name__}: missing required field {name}")
+            else:
+                values[name] = default_factory()
+
+        model: M = _object_new(model_type)
+        _object_setattr(model, "__dict__", values)
+        _object_setattr(model, "__pydantic_fields_set__", fields_set)
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
+
+    build.__name__ = f"build_{model_type.__name__}"
+    return build
+
+
+# Maps the cmd field of server packets to a builder which skips validation.
+TRUSTED_PACKET_BUILDERS: Final[MappingProxyType[str, Callable[[dict], Any]]] = MappingProxyType({
+    cmd: create_model_builder(packet_type) for cmd, packet_type in SERVER_PACKET_TYPES.items()
+})
+
+
+def build_trusted_packet(data: dict) -> Any:
+    """
+    Builds a server packet from decoded JSON without validating it.
+    Should only be used for data received from a trusted server.
+    :raises KeyError: If the cmd is unknown or a required field is missing.
+    """
+
+    return TRUSTED_PACKET_BUILDERS[data["cmd"]](data)
@@ -1,4 +1,5 @@
-from typing import Annotated, Final, Union
+from types import MappingProxyType
+from typing import Annotated, Final, TypeVar, Union, get_args
 
 from pydantic import TypeAdapter, Field
 
@@ -40,3 +41,55 @@ PacketUnionType: Union = ServerPacketUnionType | ClientPacketUnionType
 PACKET_TYPE_ADAPTER: Final[TypeAdapter] = TypeAdapter(
     list[Annotated[PacketUnionType, Field(discriminator="cmd")]]
 )
+
+# Decodes frames sent by the server, which only ever contain server packets.
+SERVER_PACKET_TYPE_ADAPTER: Final[TypeAdapter] = TypeAdapter(
+    list[Annotated[ServerPacketUnionType, Field(discriminator="cmd")]]
+)
+
+# Decodes frames sent by a client, which only ever contain client packets.
+CLIENT_PACKET_TYPE_ADAPTER: Final[TypeAdapter] = TypeAdapter(
+    list[Annotated[ClientPacketUnionType, Field(discriminator="cmd")]]
+)
+
+# Maps the cmd field of server packets to their packet type.
+SERVER_PACKET_TYPES: Final[MappingProxyType[str, type[packets.ServerPacket]]] = MappingProxyType({
+    packet_type.model_fields["cmd"].default: packet_type
+    for packet_type in get_args(ServerPacketUnionType)
+})
+
+# Maps the cmd field of client packets to their packet type.
+CLIENT_PACKET_TYPES: Final[MappingProxyType[str, type[packets.ClientPacket]]] = MappingProxyType({
+    packet_type.model_fields["cmd"].default: packet_type
+    for packet_type in get_args(ClientPacketUnionType)
+})
+
+# Precompiled adapters to decode a single packet of a known cmd.
+SERVER_PACKET_ADAPTERS: Final[MappingProxyType[str, TypeAdapter]] = MappingProxyType({
+    cmd: TypeAdapter(packet_type) for cmd, packet_type in SERVER_PACKET_TYPES.items()
+})
+
+CLIENT_PACKET_ADAPTERS: Final[MappingProxyType[str, TypeAdapter]] = MappingProxyType({
+    cmd: TypeAdapter(packet_type) for cmd, packet_type in CLIENT_PACKET_TYPES.items()
+})
+
+T = TypeVar("T", bound=packets.Packet)
+
+
+def get_packet_adapter(packet_type: type[T]) -> TypeAdapter[T]:
+    """
+    Returns the precompiled adapter of a packet type.
+    :raises KeyError: If the packet type is neither a server nor a client packet.
+    """
+
+    cmd: str = packet_type.model_fields["cmd"].default
+    adapters = SERVER_PACKET_ADAPTERS if issubclass(packet_type, packets.ServerPacket) else CLIENT_PACKET_ADAPTERS
+    return adapters[cmd]
+
+
+def decode_packet(packet_type: type[T], data: str | bytes) -> T:
+    """
+    Decodes a single JSON encoded packet of a known type, without going through the discriminated union.
+    """
+
+    return get_packet_adapter(packet_type).validate_json(data)
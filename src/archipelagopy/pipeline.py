@@ -0,0 +1,194 @@
+import asyncio
+import collections
+from collections.abc import Callable
+from enum import Enum
+from types import MappingProxyType
+from typing import Generic, NamedTuple, TypeVar
+
+from archipelagopy import packets
+from archipelagopy.send_queue import OverflowPolicy
+
+T = TypeVar("T")
+
+
+class PipelineStage(Enum):
+    """
+    Stages of the inbound pipeline, each running in a task of its own.
+
+    :ivar READ: Reads frames from the websocket.
+    :ivar PARSE: Decodes frames into packets.
+    :ivar DISPATCH: Runs the internal handlers and callbacks of packets.
+    """
+
+    READ = "read"
+    PARSE = "parse"
+    DISPATCH = "dispatch"
+
+
+class PipelineConfig(NamedTuple):
+    """
+    :ivar frame_queue_size: Maximum number of read frames waiting to be decoded, 0 means unbounded.
+    :ivar frame_overflow: What happens when a frame is read while the frame queue is full.
+    :ivar packet_queue_size: Maximum number of decoded packets waiting to be dispatched, 0 means unbounded.
+    :ivar packet_overflow: What happens when a packet is decoded while the packet queue is full.
+    :ivar droppable_packet_types: Packet types which are dropped (oldest first) from a full packet queue,
+     before the packet_overflow policy applies.
+    """
+
+    frame_queue_size: int = 256
+    frame_overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    packet_queue_size: int = 1024
+    packet_overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    droppable_packet_types: frozenset[type] = frozenset({packets.PrintJSON})
+
+
+class StageMetrics:
+    """
+    Counters of a pipeline stage.
+
+    :ivar processed: Number of frames (READ, PARSE) or packets (DISPATCH) processed by the stage.
+    :ivar dropped: Number of frames or packets dropped from the input queue of the stage.
+    :ivar max_depth: Highest number of frames or packets waiting in the input queue of the stage.
+    :ivar busy_time: Seconds spent processing, excluding waiting for input or output.
+    :ivar blocked_time: Seconds spent waiting for space in the output queue of the stage.
+    """
+
+    __slots__ = ("blocked_time", "busy_time", "dropped", "max_depth", "processed")
+
+    def __init__(self):
+        self.processed: int = 0
+        self.dropped: int = 0
+        self.max_depth: int = 0
+        self.busy_time: float = 0.0
+        self.blocked_time: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(processed={self.processed}, dropped={self.dropped}, "
+            f"max_depth={self.max_depth}, busy_time={self.busy_time:.3f}, blocked_time={self.blocked_time:.3f})"
+        )
+
+
+def create_pipeline_metrics() -> MappingProxyType[PipelineStage, StageMetrics]:
+    return MappingProxyType({stage: StageMetrics() for stage in PipelineStage})
+
+
+class InboundQueue(Generic[T]):
+    """
+    Bounded FIFO queue between two pipeline stages. When an item is added to a full queue, the oldest droppable
+    item is dropped, otherwise the overflow policy applies. close() marks the end of the input, after which get()
+    returns the remaining items followed by None and a blocked put() returns. Supports a single producer and a single
+    consumer.
+    """
+
+    def __init__(self, maxsize: int = 0, overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+                 droppable: Callable[[T], bool] | None = None, metrics: StageMetrics | None = None):
+        """
+        :param maxsize: Maximum number of queued items, 0 means unbounded.
+        :param overflow: What happens when an item is added to a full queue and no item is droppable.
+        :param droppable: Returns whether an item may be dropped from a full queue.
+        :param metrics: The metrics of the consuming stage, whose dropped and max_depth counters are updated.
+        """
+
+        self.__maxsize: int = maxsize
+        self.__overflow: OverflowPolicy = overflow
+        self.__droppable: Callable[[T], bool] | None = droppable
+        self.__metrics: StageMetrics = StageMetrics() if metrics is None else metrics
+
+        self.__queue: collections.deque[T] = collections.deque()
+        self.__closed: bool = False
+        self.__getter: asyncio.Event = asyncio.Event()
+        self.__putter: asyncio.Event = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self.__queue)
+
+    def empty(self) -> bool:
+        return not self.__queue
+
+    def full(self) -> bool:
+        return 0 < self.__maxsize <= len(self.__queue)
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def _drop(self) -> bool:
+        if self.__droppable is not None:
+            for index, item in enumerate(self.__queue):
+                if self.__droppable(item):
+                    del self.__queue[index]
+                    self.__metrics.dropped += 1
+                    return True
+
+        if self.__overflow == OverflowPolicy.DROP_OLDEST:
+            self.__queue.popleft()
+            self.__metrics.dropped += 1
+            return True
+
+        return False
+
+    def _append(self, item: T):
+        self.__queue.append(item)
+        self.__metrics.max_depth = max(self.__metrics.max_depth, len(self.__queue))
+        self.__getter.set()
+
+    def put_nowait(self, item: T):
+        """
+        :raises asyncio.QueueFull: If the queue is full, no item is droppable and the policy is not DROP_OLDEST.
+        """
+
+        if self.full() and not self._drop():
+            raise asyncio.QueueFull
+
+        self._append(item)
+
+    async def put(self, item: T):
+        """
+        Adds an item, waits for space if the queue is full, no item is droppable and the policy is BLOCK.
+        :raises asyncio.QueueFull: If the queue is full, no item is droppable and the policy is RAISE.
+        """
+
+        while self.full() and not self._drop():
+            if self.__overflow != OverflowPolicy.BLOCK:
+                raise asyncio.QueueFull
+
+            self.__putter.clear()
+            await self.__putter.wait()
+
+            # items added to a closed queue are discarded
+            if self.__closed:
+                return
+
+        self._append(item)
+
+    def close(self):
+        self.__closed = True
+        self.__getter.set()
+        self.__putter.set()
+
+    def get_nowait(self) -> T:
+        """
+        :raises asyncio.QueueEmpty: If the queue is empty.
+        """
+
+        if not self.__queue:
+            raise asyncio.QueueEmpty
+
+        item: T = self.__queue.popleft()
+        self.__putter.set()
+        return item
+
+    async def get(self) -> T | None:
+        """
+        Returns the oldest item, or None once the queue is closed and empty.
+        """
+
+        while not self.__queue:
+            if self.__closed:
+                return None
+
+            self.__getter.clear()
+            await self.__getter.wait()
+
+        return self.get_nowait()
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from ssl import SSLContext
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from archipelagopy.codec import Codec, get_fastest_codec
+from archipelagopy.data_package.store import DataPackageStore
+from archipelagopy.tls import get_default_ssl_context
+
+if TYPE_CHECKING:
+    from archipelagopy.client import Client
+
+ClientT = TypeVar("ClientT", bound="Client")
+
+
+class HandshakeLimiter:
+    """
+    Limits the number of concurrent websocket handshakes of the clients sharing it, and staggers the start
+    of handshakes, so reconnecting many clients at once does not overwhelm the server (or the event loop with
+    TLS handshakes).
+    """
+
+    def __init__(self, max_concurrent: int = 32, stagger: float = 0.0):
+        """
+        :param max_concurrent: Maximum number of handshakes in progress at the same time.
+        :param stagger: Minimum number of seconds between the start of two handshakes.
+        """
+
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive.")
+
+        self.__semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+        self.__stagger: float = stagger
+        self.__stagger_lock: asyncio.Lock = asyncio.Lock()
+        self.__last_start: float = float("-inf")
+
+        self.__active: int = 0
+        self.__completed: int = 0
+        self.__failed: int = 0
+
+    @property
+    def active(self) -> int:
+        return self.__active
+
+    @property
+    def completed(self) -> int:
+        return self.__completed
+
+    @property
+    def failed(self) -> int:
+        return self.__failed
+
+    async def __aenter__(self):
+        await self.__semaphore.acquire()
+
+        try:
+            if self.__stagger > 0:
+                async with self.__stagger_lock:
+                    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+                    delay: float = self.__last_start + self.__stagger - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                    self.__last_start = loop.time()
+        except BaseException:
+            self.__semaphore.release()
+            raise
+
+        self.__active += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__active -= 1
+        if exc_type is None:
+            self.__completed += 1
+        else:
+            self.__failed += 1
+
+        self.__semaphore.release()
+
+
+class PoolStats(NamedTuple):
+    """
+    :ivar clients: Number of clients in the pool.
+    :ivar connected: Number of clients with an open connection.
+    :ivar handshakes_active: Number of handshakes in progress.
+    :ivar handshakes_completed: Number of successful handshakes.
+    :ivar handshakes_failed: Number of failed handshakes.
+    :ivar frames_received: Number of frames received by all clients.
+    :ivar frames_sent: Number of frames sent by all clients.
+    :ivar uptime: Seconds since the pool was started.
+    """
+
+    clients: int
+    connected: int
+    handshakes_active: int
+    handshakes_completed: int
+    handshakes_failed: int
+    frames_received: int
+    frames_sent: int
+    uptime: float
+
+    @property
+    def received_per_second(self) -> float:
+        return self.frames_received / self.uptime if self.uptime > 0 else 0.0
+
+    @property
+    def sent_per_second(self) -> float:
+        return self.frames_sent / self.uptime if self.uptime > 0 else 0.0
+
+
+class ClientPool:
+    """
+    Owns a set of clients running in the same event loop. Clients created by the pool share one SSL context,
+    one codec and a HandshakeLimiter, which limits and staggers their handshakes. A DataPackageStore is only shared
+    if one is given, as clients with a store fetch the data packages of their room.
+    """
+
+    def __init__(self, max_handshakes: int = 32, handshake_stagger: float = 0.0,
+                 ssl_context: SSLContext | None = None, data_package_store: DataPackageStore | None = None,
+                 codec: Codec | None = None):
+        """
+        :param max_handshakes: Maximum number of concurrent websocket handshakes.
+        :param handshake_stagger: Minimum number of seconds between the start of two handshakes.
+        :param ssl_context: The SSLContext shared by all clients, defaults to the default context of the process.
+        :param data_package_store: An optional DataPackageStore shared by all clients.
+        :param codec: The codec shared by all clients, defaults to the fastest available codec.
+        """
+
+        self.__ssl_context: SSLContext = get_default_ssl_context() if ssl_context is None else ssl_context
+        self.__data_package_store: DataPackageStore | None = data_package_store
+        self.__codec: Codec = get_fastest_codec() if codec is None else codec
+        self.__handshake_limiter: HandshakeLimiter = HandshakeLimiter(max_handshakes, handshake_stagger)
+
+        self.__clients: dict[Client, None] = {}
+        self.__started: float | None = None
+
+    @property
+    def ssl_context(self) -> SSLContext:
+        return self.__ssl_context
+
+    @property
+    def data_package_store(self) -> DataPackageStore | None:
+        return self.__data_package_store
+
+    @property
+    def codec(self) -> Codec:
+        return self.__codec
+
+    @property
+    def handshake_limiter(self) -> HandshakeLimiter:
+        return self.__handshake_limiter
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def __iter__(self) -> Iterator["Client"]:
+        return iter(self.__clients)
+
+    def __contains__(self, client: "Client") -> bool:
+        return client in self.__clients
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """
+        Returns the keyword arguments which make a client use the shared resources of the pool.
+        """
+
+        kwargs: dict[str, Any] = {
+            "ssl_context": self.__ssl_context,
+            "codec": self.__codec,
+            "handshake_limiter": self.__handshake_limiter,
+        }
+
+        if self.__data_package_store is not None:
+            kwargs["data_package_store"] = self.__data_package_store
+
+        return kwargs
+
+    def create(self, client_type: type[ClientT], *args, **kwargs) -> ClientT:
+        """
+        Creates a client with the shared resources of the pool and adds it. Keyword arguments overwrite
+        the shared resources.
+        """
+
+        client: ClientT = client_type(*args, **{**self.client_kwargs(), **kwargs})
+        self.add(client)
+        return client
+
+    def add(self, client: "Client"):
+        """
+        Adds a client, which is started by the next call of start().
+        """
+
+        self.__clients[client] = None
+
+    async def remove(self, client: "Client"):
+        """
+        Stops a client and removes it from the pool.
+        """
+
+        if client in self.__clients:
+            del self.__clients[client]
+            await client.stop()
+
+    async def start(self):
+        """
+        Starts all clients which are not running, their handshakes are limited by the HandshakeLimiter.
+        """
+
+        if self.__started is None:
+            self.__started = time.monotonic()
+
+        await asyncio.gather(*(client.start() for client in self.__clients))
+
+    async def stop(self):
+        await asyncio.gather(*(client.stop() for client in self.__clients))
+        self.__started = None
+
+    def stats(self) -> PoolStats:
+        limiter: HandshakeLimiter = self.__handshake_limiter
+
+        return PoolStats(
+            clients=len(self.__clients),
+            connected=sum(client.is_connected for client in self.__clients),
+            handshakes_active=limiter.active,
+            handshakes_completed=limiter.completed,
+            handshakes_failed=limiter.failed,
+            frames_received=sum(client.frames_received for client in self.__clients),
+            frames_sent=sum(client.frames_sent for client in self.__clients),
+            uptime=0.0 if self.__started is None else time.monotonic() - self.__started,
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
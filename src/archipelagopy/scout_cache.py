@@ -0,0 +1,177 @@
+import logging
+import os
+import re
+import sys
+import threading
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+from archipelagopy.enums.network_item_flag import NetworkItemFlag
+from archipelagopy.structs.network_item import NetworkItem
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+_MAGIC: Final[bytes] = b"APSC\x01\x00\x00\x00"
+
+# location, item, player, flags
+_RECORD_SIZE: Final[int] = 4
+
+# seed names are used as file names
+_SEED_PATTERN: Final[re.Pattern] = re.compile(r"[0-9A-Za-z_-]{1,128}")
+
+ScoutKey = tuple[str, int, int]
+
+
+def _to_bytes(records: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        records = array("q", records)
+        records.byteswap()
+
+    return records.tobytes()
+
+
+def _from_bytes(data: bytes) -> array:
+    records: array = array("q")
+    records.frombytes(data)
+
+    if sys.byteorder == "big":  # pragma: no cover
+        records.byteswap()
+
+    return records
+
+
+class ScoutCache:
+    """
+    Cache of scouted locations, keyed by seed name, team, slot and location. The items of locations never change
+    within a seed, so a location only has to be scouted once.
+
+    With a path, the scouted items of every slot are appended to a file of int64 records, so they survive restarts.
+    The cache is thread safe, so the blocking methods can be called in a thread while the event loop reads from it.
+    """
+
+    SUFFIX: str = ".apsc"
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        """
+        :param path: Optional directory to store the scouted items in. Is created if it does not exist.
+        """
+
+        self.__path: Path | None = None if path is None else Path(path)
+        if self.__path is not None:
+            self.__path.mkdir(parents=True, exist_ok=True)
+
+        self.__slots: dict[ScoutKey, dict[int, NetworkItem]] = {}
+        # guards the slots, it is never held during file IO, so readers on the event loop do not wait for the disk
+        self.__lock: threading.Lock = threading.Lock()
+        # one lock per file, so concurrent puts do not interleave their writes
+        self.__file_locks: dict[Path, threading.Lock] = {}
+
+    @property
+    def path(self) -> Path | None:
+        return self.__path
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return sum(len(items) for items in self.__slots.values())
+
+    def _get_file(self, seed_name: str, team: int, slot: int) -> Path | None:
+        if self.__path is None or _SEED_PATTERN.fullmatch(seed_name) is None:
+            return None
+
+        return self.__path / f"{seed_name}_{team}_{slot}{self.SUFFIX}"
+
+    def _get_slot(self, seed_name: str, team: int, slot: int) -> dict[int, NetworkItem]:
+        key: ScoutKey = (seed_name, team, slot)
+
+        with self.__lock:
+            items: dict[int, NetworkItem] | None = self.__slots.get(key)
+
+        if items is not None:
+            return items
+
+        loaded: dict[int, NetworkItem] = self._read(seed_name, team, slot)
+        with self.__lock:
+            # another thread may have loaded the slot in the meantime
+            return self.__slots.setdefault(key, loaded)
+
+    def _read(self, seed_name: str, team: int, slot: int) -> dict[int, NetworkItem]:
+        file: Path | None = self._get_file(seed_name, team, slot)
+        if file is None:
+            return {}
+
+        try:
+            data: bytes = file.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as error:
+            _LOGGER.warning("Cannot read scout cache file %s: %s", file, error)
+            return {}
+
+        if not data.startswith(_MAGIC):
+            _LOGGER.warning("Ignoring invalid scout cache file %s", file)
+            return {}
+
+        # ignore a partially written last record
+        record_bytes: int = _RECORD_SIZE * 8
+        end: int = len(_MAGIC) + (len(data) - len(_MAGIC)) // record_bytes * record_bytes
+        records: array = _from_bytes(data[len(_MAGIC):end])
+
+        items: dict[int, NetworkItem] = {}
+        for index in range(0, len(records), _RECORD_SIZE):
+            location, item, player, flags = records[index:index + _RECORD_SIZE]
+            items[location] = NetworkItem(item=item, location=location, player=player, flags=NetworkItemFlag(flags))
+
+        return items
+
+    def load(self, seed_name: str, team: int, slot: int):
+        """
+        Loads the scouted items of a slot from disk, if they are not loaded yet. Does blocking file IO.
+        """
+
+        self._get_slot(seed_name, team, slot)
+
+    def get(self, seed_name: str, team: int, slot: int, location: int) -> NetworkItem | None:
+        items: dict[int, NetworkItem] = self._get_slot(seed_name, team, slot)
+        with self.__lock:
+            return items.get(location)
+
+    def get_many(self, seed_name: str, team: int, slot: int, locations: Iterable[int]) -> dict[int, NetworkItem]:
+        """
+        Returns the cached items of the locations, locations which have not been scouted are missing.
+        """
+
+        items: dict[int, NetworkItem] = self._get_slot(seed_name, team, slot)
+        with self.__lock:
+            return {location: items[location] for location in locations if location in items}
+
+    def put(self, seed_name: str, team: int, slot: int, network_items: Iterable[NetworkItem]):
+        """
+        Adds scouted items, the location of every item has to belong to the slot. Does blocking file IO.
+        """
+
+        items: dict[int, NetworkItem] = self._get_slot(seed_name, team, slot)
+        file: Path | None = self._get_file(seed_name, team, slot)
+
+        with self.__lock:
+            records: array = array("q")
+            for network_item in network_items:
+                if items.get(network_item.location) == network_item:
+                    continue
+
+                items[network_item.location] = network_item
+                records.extend((network_item.location, network_item.item, network_item.player, network_item.flags))
+
+            if file is None or not records:
+                return
+
+            file_lock: threading.Lock = self.__file_locks.setdefault(file, threading.Lock())
+
+        try:
+            with file_lock, open(file, "ab") as f:
+                if f.tell() == 0:
+                    f.write(_MAGIC)
+                f.write(_to_bytes(records))
+        except OSError as error:
+            _LOGGER.warning("Cannot write scout cache file %s: %s", file, error)
@@ -0,0 +1,215 @@
+import asyncio
+import collections
+import contextlib
+from collections.abc import Callable, Mapping
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import Final, Generic, NamedTuple, TypeVar
+
+from archipelagopy import packets
+
+T = TypeVar("T")
+
+
+class SendLane(IntEnum):
+    """
+    Priority lanes of the send queue, lower values are sent first.
+
+    :ivar CONTROL: Connection management, e.g. Connect, Sync and GetDataPackage.
+    :ivar GAMEPLAY: Game state, e.g. LocationChecks, StatusUpdate and data storage operations.
+    :ivar CHAT: Chat messages.
+    :ivar BULK: Everything else, e.g. Bounce.
+    """
+
+    CONTROL = 0
+    GAMEPLAY = 1
+    CHAT = 2
+    BULK = 3
+
+
+class OverflowPolicy(Enum):
+    """
+    What happens when an item is added to a full queue.
+
+    :ivar BLOCK: Wait until there is space, put_nowait raises asyncio.QueueFull.
+    :ivar RAISE: Raise asyncio.QueueFull.
+    :ivar DROP_OLDEST: Drop the oldest queued item.
+    """
+
+    BLOCK = "block"
+    RAISE = "raise"
+    DROP_OLDEST = "drop_oldest"
+
+
+class LaneConfig(NamedTuple):
+    """
+    :ivar maxsize: Maximum number of queued items, 0 means unbounded.
+    :ivar overflow: What happens when an item is added to a full lane.
+    """
+
+    maxsize: int
+    overflow: OverflowPolicy
+
+
+DEFAULT_LANE_CONFIGS: Final[MappingProxyType[SendLane, LaneConfig]] = MappingProxyType({
+    SendLane.CONTROL: LaneConfig(64, OverflowPolicy.BLOCK),
+    SendLane.GAMEPLAY: LaneConfig(1024, OverflowPolicy.BLOCK),
+    SendLane.CHAT: LaneConfig(256, OverflowPolicy.DROP_OLDEST),
+    SendLane.BULK: LaneConfig(1024, OverflowPolicy.BLOCK),
+})
+
+# Lane of every client packet type, packet types which are not listed use SendLane.BULK.
+PACKET_LANES: Final[MappingProxyType[type[packets.ClientPacket], SendLane]] = MappingProxyType({
+    packets.Connect: SendLane.CONTROL,
+    packets.ConnectUpdate: SendLane.CONTROL,
+    packets.GetDataPackage: SendLane.CONTROL,
+    packets.Sync: SendLane.CONTROL,
+    packets.Get: SendLane.GAMEPLAY,
+    packets.LocationChecks: SendLane.GAMEPLAY,
+    packets.LocationScouts: SendLane.GAMEPLAY,
+    packets.Set: SendLane.GAMEPLAY,
+    packets.SetNotify: SendLane.GAMEPLAY,
+    packets.StatusUpdate: SendLane.GAMEPLAY,
+    packets.UpdateHint: SendLane.GAMEPLAY,
+    packets.Say: SendLane.CHAT,
+    packets.Bounce: SendLane.BULK,
+})
+
+
+def get_packet_lane(packet: packets.ClientPacket) -> SendLane:
+    return PACKET_LANES.get(type(packet), SendLane.BULK)
+
+
+def _wakeup_next(waiters: collections.deque[asyncio.Future]):
+    while waiters:
+        waiter: asyncio.Future = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+class SendQueue(Generic[T]):
+    """
+    Bounded priority queue with a FIFO lane per priority. get() returns the oldest item of the
+    highest priority lane which is not empty. Every lane has its own maximum size and overflow policy.
+    Mirrors the interface of asyncio.Queue, put() and put_nowait() take the lane of the item.
+    """
+
+    def __init__(self, lanes: Mapping[SendLane, LaneConfig] | None = None, on_drop: Callable[[T], None] | None = None):
+        """
+        :param lanes: Overwrites the configuration of lanes, lanes which are not given use DEFAULT_LANE_CONFIGS.
+        :param on_drop: Called with every item dropped from a lane because of the DROP_OLDEST policy.
+        """
+
+        self.__configs: dict[SendLane, LaneConfig] = {**DEFAULT_LANE_CONFIGS, **(lanes or {})}
+        self.__on_drop: Callable[[T], None] | None = on_drop
+        self.__lanes: dict[SendLane, collections.deque[T]] = {lane: collections.deque() for lane in SendLane}
+        self.__dropped: dict[SendLane, int] = dict.fromkeys(SendLane, 0)
+
+        self.__getters: collections.deque[asyncio.Future] = collections.deque()
+        self.__putters: dict[SendLane, collections.deque[asyncio.Future]] = {
+            lane: collections.deque() for lane in SendLane
+        }
+
+    def get_config(self, lane: SendLane) -> LaneConfig:
+        return self.__configs[lane]
+
+    def qsize(self) -> int:
+        return sum(len(queue) for queue in self.__lanes.values())
+
+    def empty(self) -> bool:
+        return not any(self.__lanes.values())
+
+    def depth(self, lane: SendLane) -> int:
+        """
+        Returns the number of items queued in a lane.
+        """
+
+        return len(self.__lanes[lane])
+
+    def depths(self) -> dict[SendLane, int]:
+        return {lane: len(queue) for lane, queue in self.__lanes.items()}
+
+    def dropped(self, lane: SendLane) -> int:
+        """
+        Returns the number of items dropped from a lane because of the DROP_OLDEST policy.
+        """
+
+        return self.__dropped[lane]
+
+    def full(self, lane: SendLane) -> bool:
+        maxsize: int = self.__configs[lane].maxsize
+        return 0 < maxsize <= len(self.__lanes[lane])
+
+    def put_nowait(self, item: T, lane: SendLane):
+        """
+        :raises asyncio.QueueFull: If the lane is full and its policy is not DROP_OLDEST.
+        """
+
+        queue: collections.deque[T] = self.__lanes[lane]
+
+        if self.full(lane):
+            if self.__configs[lane].overflow != OverflowPolicy.DROP_OLDEST:
+                raise asyncio.QueueFull
+
+            dropped: T = queue.popleft()
+            self.__dropped[lane] += 1
+            if self.__on_drop is not None:
+                self.__on_drop(dropped)
+
+        queue.append(item)
+        _wakeup_next(self.__getters)
+
+    async def put(self, item: T, lane: SendLane):
+        """
+        Adds an item to a lane, waits for space if the lane is full and its policy is BLOCK.
+        :raises asyncio.QueueFull: If the lane is full and its policy is RAISE.
+        """
+
+        putters: collections.deque[asyncio.Future] = self.__putters[lane]
+
+        while self.full(lane) and self.__configs[lane].overflow == OverflowPolicy.BLOCK:
+            putter: asyncio.Future = asyncio.get_running_loop().create_future()
+            putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                with contextlib.suppress(ValueError):
+                    putters.remove(putter)
+
+                if not self.full(lane) and not putter.cancelled():
+                    _wakeup_next(putters)
+                raise
+
+        self.put_nowait(item, lane)
+
+    def get_nowait(self) -> T:
+        """
+        :raises asyncio.QueueEmpty: If all lanes are empty.
+        """
+
+        for lane, queue in self.__lanes.items():
+            if queue:
+                item: T = queue.popleft()
+                _wakeup_next(self.__putters[lane])
+                return item
+
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> T:
+        while self.empty():
+            getter: asyncio.Future = asyncio.get_running_loop().create_future()
+            self.__getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                with contextlib.suppress(ValueError):
+                    self.__getters.remove(getter)
+
+                if not self.empty() and not getter.cancelled():
+                    _wakeup_next(self.__getters)
+                raise
+
+        return self.get_nowait()
@@ -0,0 +1,345 @@
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from typing import Any, Final, NamedTuple
+
+from archipelagopy import packets
+from archipelagopy.pool import ClientPool
+from archipelagopy.send_queue import OverflowPolicy
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# Maximum number of events buffered by a worker, per forwarded packet type of a client and for the whole worker.
+# While the supervisor does not keep up, the oldest packets of a client are dropped.
+EVENT_BUFFER_SIZE: Final[int] = 1024
+
+# Seconds a worker thread waits for a message before checking whether the receive was cancelled.
+_POLL_INTERVAL: Final[float] = 0.1
+
+
+class ClientSpec(NamedTuple):
+    """
+    Definition of a client run by a worker process. Everything has to be picklable, e.g. the factory has to be
+    a Client subclass or a module level function accepting the keyword arguments of Client.
+
+    :ivar key: Unique key of the client, used to address commands and to tag its events.
+    :ivar factory: Creates the client from args and kwargs, in the worker process.
+    :ivar args: Positional arguments of the factory.
+    :ivar kwargs: Optional keyword arguments of the factory.
+    :ivar packet_types: Received packet types which are forwarded to the supervisor.
+    :ivar forward: Converts a forwarded packet into the payload sent to the supervisor, e.g. to only send selected
+     fields. Defaults to sending the decoded packet.
+    """
+
+    key: Hashable
+    factory: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict[str, Any] | None = None
+    packet_types: tuple[type, ...] = ()
+    forward: Callable[[Any], Any] | None = None
+
+
+class ShardEvent(NamedTuple):
+    """
+    :ivar key: The key of the client which received the packet.
+    :ivar payload: The forwarded packet, or the result of the forward function of the client.
+    """
+
+    key: Hashable
+    payload: Any
+
+
+def _set_ready(ready: asyncio.Future):
+    if not ready.done():
+        ready.set_result(None)
+
+
+async def _recv(connection: multiprocessing.connection.Connection) -> Any:
+    """
+    Receives a message, waiting for the connection to become readable with a reader of the event loop instead of
+    blocking a thread. Raises EOFError once the other end is closed.
+    """
+
+    if sys.platform == "win32":
+        # the proactor event loop has no add_reader() and pipe connections are named pipe handles, a thread polls
+        # for a short time at once, so the receive can be cancelled
+        while not await asyncio.to_thread(connection.poll, _POLL_INTERVAL):
+            pass
+
+        return connection.recv()
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    while not connection.poll():
+        ready: asyncio.Future = loop.create_future()
+        loop.add_reader(connection.fileno(), _set_ready, ready)
+        try:
+            await ready
+        finally:
+            loop.remove_reader(connection.fileno())
+
+    return connection.recv()
+
+
+async def _forward_packets(spec: ClientSpec, client: Any, packet_type: type, events: asyncio.Queue):
+    stream = client.stream(packet_type, maxsize=EVENT_BUFFER_SIZE, overflow=OverflowPolicy.DROP_OLDEST)
+    async for packet in stream:
+        await events.put((spec.key, packet if spec.forward is None else spec.forward(packet)))
+
+
+async def _send_events(connection: multiprocessing.connection.Connection, events: asyncio.Queue):
+    # all events which are ready are sent as a single message
+    while True:
+        batch: list[tuple[Hashable, Any]] = [await events.get()]
+        while not events.empty():
+            batch.append(events.get_nowait())
+
+        await asyncio.to_thread(connection.send, batch)
+
+
+async def _run_shard(specs: list[ClientSpec], connection: multiprocessing.connection.Connection):
+    pool: ClientPool = ClientPool()
+    clients: dict[Hashable, Any] = {
+        spec.key: pool.create(spec.factory, *spec.args, **(spec.kwargs or {})) for spec in specs
+    }
+
+    events: asyncio.Queue = asyncio.Queue(EVENT_BUFFER_SIZE)
+    tasks: list[asyncio.Task] = [
+        asyncio.create_task(_forward_packets(spec, clients[spec.key], packet_type, events))
+        for spec in specs for packet_type in spec.packet_types
+    ]
+    tasks.append(asyncio.create_task(_send_events(connection, events)))
+
+    await pool.start()
+    try:
+        while True:
+            try:
+                command: tuple = await _recv(connection)
+            except EOFError:
+                break
+
+            if command[0] == "stop":
+                break
+
+            _, key, packet = command
+            try:
+                await clients[key].send(packet)
+            except Exception:
+                # a single command must not stop the other clients of the shard
+                _LOGGER.exception("Cannot send %s with client %r", type(packet).__name__, key)
+    finally:
+        await pool.stop()
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_shard(specs: list[ClientSpec], connection: multiprocessing.connection.Connection):
+    """
+    Entry point of a worker process, runs the clients of a shard until the supervisor stops it.
+    """
+
+    asyncio.run(_run_shard(specs, connection))
+
+
+class _Shard:
+    def __init__(self, index: int):
+        self.index: int = index
+        self.specs: list[ClientSpec] = []
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.connection: multiprocessing.connection.Connection | None = None
+        self.restarts: int = 0
+        self.task: asyncio.Task | None = None
+        # Connection.send() blocks while the pipe is full, so messages are sent in a thread, one at a time
+        self.send_lock: asyncio.Lock = asyncio.Lock()
+
+    async def send(self, message: tuple):
+        async with self.send_lock:
+            if self.connection is None:
+                raise ConnectionError(f"Shard {self.index} is not running.")
+
+            await asyncio.to_thread(self.connection.send, message)
+
+
+class ShardSupervisor:
+    """
+    Shards clients across worker processes, so decoding and handling packets is spread over multiple CPU cores.
+    Every worker runs its clients in a ClientPool and forwards the selected packets of its clients to the supervisor.
+    Workers which exit unexpectedly are restarted.
+    """
+
+    # Seconds stop() waits for a worker to stop, before it is terminated.
+    STOP_TIMEOUT: float = 5.0
+
+    def __init__(self, specs: Iterable[ClientSpec], workers: int | None = None, restart_delay: float = 1.0,
+                 max_restarts: int | None = None, mp_context: multiprocessing.context.BaseContext | None = None):
+        """
+        :param specs: The clients to run, which are assigned to the workers in turn.
+        :param workers: Number of worker processes, defaults to the number of CPU cores.
+        :param restart_delay: Seconds to wait before restarting a worker which exited.
+        :param max_restarts: Maximum number of restarts per worker, None restarts indefinitely.
+        :param mp_context: The multiprocessing context used to start workers, defaults to spawn.
+        """
+
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be positive.")
+
+        self.__restart_delay: float = restart_delay
+        self.__max_restarts: int | None = max_restarts
+        self.__mp_context: multiprocessing.context.BaseContext = (
+            multiprocessing.get_context("spawn") if mp_context is None else mp_context
+        )
+
+        self.__shards: list[_Shard] = [_Shard(index) for index in range(workers)]
+        self.__shard_of: dict[Hashable, _Shard] = {}
+        for index, spec in enumerate(specs):
+            if spec.key in self.__shard_of:
+                raise ValueError(f"Duplicate client key {spec.key!r}.")
+
+            shard: _Shard = self.__shards[index % workers]
+            shard.specs.append(spec)
+            self.__shard_of[spec.key] = shard
+
+        self.__events: asyncio.Queue[ShardEvent] = asyncio.Queue()
+        self.__stopping: bool = False
+
+    @property
+    def workers(self) -> int:
+        return len(self.__shards)
+
+    def get_shard(self, key: Hashable) -> int:
+        """
+        Returns the index of the worker running a client.
+        """
+
+        return self.__shard_of[key].index
+
+    def get_pid(self, shard: int) -> int | None:
+        process: multiprocessing.process.BaseProcess | None = self.__shards[shard].process
+        return None if process is None else process.pid
+
+    def restarts(self, shard: int) -> int:
+        return self.__shards[shard].restarts
+
+    async def start(self):
+        self.__stopping = False
+
+        for shard in self.__shards:
+            if shard.specs and shard.task is None:
+                shard.task = asyncio.create_task(self._supervise(shard), name=f"{__name__}.shard[{shard.index}]")
+
+    async def stop(self):
+        """
+        Stops all workers, which stop their clients first. Workers which do not stop within STOP_TIMEOUT seconds
+        are terminated.
+        """
+
+        self.__stopping = True
+        await asyncio.gather(*(self._stop_shard(shard) for shard in self.__shards))
+
+    async def _stop_shard(self, shard: _Shard):
+        task: asyncio.Task | None = shard.task
+        if task is None:
+            return
+
+        try:
+            async with asyncio.timeout(self.STOP_TIMEOUT):
+                with contextlib.suppress(OSError):
+                    await shard.send(("stop",))
+
+                await asyncio.wait([task])
+        except TimeoutError:
+            _LOGGER.warning("Shard %s did not stop within %s seconds, terminating it", shard.index, self.STOP_TIMEOUT)
+            if shard.process is not None:
+                shard.process.terminate()
+
+        await asyncio.gather(task, return_exceptions=True)
+        shard.task = None
+
+    async def send(self, key: Hashable, packet: packets.ClientPacket):
+        """
+        Sends a packet with the client of the given key, in its worker.
+        :raises KeyError: If there is no client with the key.
+        :raises ConnectionError: If the worker of the client is not running.
+        """
+
+        await self.__shard_of[key].send(("send", key, packet))
+
+    async def events(self) -> AsyncIterator[ShardEvent]:
+        """
+        Yields the forwarded packets of all clients, in the order they were received by the supervisor.
+        """
+
+        while True:
+            yield await self.__events.get()
+
+    async def _supervise(self, shard: _Shard):
+        while True:
+            parent_connection, child_connection = self.__mp_context.Pipe()
+            process: multiprocessing.process.BaseProcess = self.__mp_context.Process(
+                target=run_shard, args=(shard.specs, child_connection), name=f"archipelagopy-shard-{shard.index}",
+                daemon=True
+            )
+            process.start()
+            child_connection.close()
+
+            shard.process = process
+            shard.connection = parent_connection
+            _LOGGER.debug("Started shard %s (pid %s)", shard.index, process.pid)
+
+            try:
+                await self._receive_events(parent_connection)
+            finally:
+                async with shard.send_lock:
+                    shard.connection = None
+                    parent_connection.close()
+
+                await self._join(shard, process)
+
+            if self.__stopping:
+                return
+
+            _LOGGER.warning("Shard %s exited with code %s", shard.index, process.exitcode)
+            if self.__max_restarts is not None and shard.restarts >= self.__max_restarts:
+                _LOGGER.error("Shard %s exceeded %s restarts, giving up", shard.index, self.__max_restarts)
+                return
+
+            shard.restarts += 1
+            await asyncio.sleep(self.__restart_delay)
+
+            if self.__stopping:
+                return
+
+    async def _join(self, shard: _Shard, process: multiprocessing.process.BaseProcess):
+        # the worker closed its end of the pipe, but may still be stopping its clients
+        await asyncio.to_thread(process.join, self.STOP_TIMEOUT)
+        if process.exitcode is None:
+            _LOGGER.warning("Shard %s did not exit within %s seconds, terminating it", shard.index, self.STOP_TIMEOUT)
+            process.terminate()
+            await asyncio.to_thread(process.join)
+
+    async def _receive_events(self, connection: multiprocessing.connection.Connection):
+        while True:
+            try:
+                batch: list[tuple[Hashable, Any]] = await _recv(connection)
+            except (EOFError, OSError):
+                return
+            except Exception:
+                _LOGGER.exception("Cannot receive events of a shard")
+                return
+
+            for key, payload in batch:
+                self.__events.put_nowait(ShardEvent(key, payload))
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
@@ -0,0 +1,124 @@
+import asyncio
+from collections.abc import Callable
+from typing import Generic, Self, TypeVar
+
+from archipelagopy.pipeline import InboundQueue, StageMetrics
+from archipelagopy.send_queue import OverflowPolicy
+
+T = TypeVar("T")
+
+
+class PacketStream(Generic[T]):
+    """
+    Subscription to the received packets of a single type, created by Client.stream(). Packets are buffered until
+    they are consumed with async for, get() or get_batch(). Iteration ends once the stream or the client is closed.
+
+    With the BLOCK policy, the client stops processing received packets while the buffer is full.
+    With the RAISE policy, an overflowing buffer closes the stream and the consumer gets asyncio.QueueFull
+    once it reaches the point where packets were lost.
+    """
+
+    def __init__(self, packet_type: type[T], maxsize: int = 1024, overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+                 on_close: Callable[["PacketStream[T]"], None] | None = None):
+        """
+        :param packet_type: The type of the streamed packets.
+        :param maxsize: Maximum number of buffered packets, 0 means unbounded.
+        :param overflow: What happens when a packet is received while the buffer is full.
+        :param on_close: Called once when the stream is closed, e.g. to unsubscribe it.
+        """
+
+        self.packet_type: type[T] = packet_type
+
+        self.__metrics: StageMetrics = StageMetrics()
+        self.__queue: InboundQueue[T] = InboundQueue(maxsize, overflow, metrics=self.__metrics)
+        self.__on_close: Callable[[PacketStream[T]], None] | None = on_close
+        self.__overflowed: bool = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.packet_type.__name__}, buffered={self.qsize()})"
+
+    @property
+    def closed(self) -> bool:
+        return self.__queue.closed
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of packets dropped because of the DROP_OLDEST policy.
+        """
+
+        return self.__metrics.dropped
+
+    def qsize(self) -> int:
+        return self.__queue.qsize()
+
+    async def put(self, packet: T):
+        """
+        Buffers a received packet, called by the client.
+        """
+
+        if self.closed:
+            return
+
+        try:
+            await self.__queue.put(packet)
+        except asyncio.QueueFull:
+            self.__overflowed = True
+            self.close()
+
+    def close(self):
+        """
+        Unsubscribes the stream. Buffered packets can still be consumed.
+        """
+
+        if self.closed:
+            return
+
+        self.__queue.close()
+        if self.__on_close is not None:
+            self.__on_close(self)
+
+    async def get(self) -> T | None:
+        """
+        Returns the next packet, or None once the stream is closed and all buffered packets have been consumed.
+        :raises asyncio.QueueFull: If packets were lost, because the buffer overflowed with the RAISE policy.
+        """
+
+        packet: T | None = await self.__queue.get()
+        if packet is None and self.__overflowed:
+            raise asyncio.QueueFull
+
+        return packet
+
+    async def get_batch(self, max_packets: int = 0) -> list[T]:
+        """
+        Waits for the next packet and returns it along with all buffered packets, up to max_packets (0 means
+        no limit). Returns an empty list once the stream is closed and all buffered packets have been consumed.
+        :raises asyncio.QueueFull: If packets were lost, because the buffer overflowed with the RAISE policy.
+        """
+
+        packet: T | None = await self.get()
+        if packet is None:
+            return []
+
+        batch: list[T] = [packet]
+        while self.__queue.qsize() and (not max_packets or len(batch) < max_packets):
+            batch.append(self.__queue.get_nowait())
+
+        return batch
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> T:
+        packet: T | None = await self.get()
+        if packet is None:
+            raise StopAsyncIteration
+
+        return packet
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
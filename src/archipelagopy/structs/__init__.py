@@ -1,3 +1,4 @@
+from archipelagopy.structs.data_storage_operation import DataStorageOperation
 from archipelagopy.structs.game_data import GameData
 from archipelagopy.structs.json_message_part import JSONMessagePart
 from archipelagopy.structs.network_item import NetworkItem
@@ -8,6 +9,7 @@ from archipelagopy.structs.struct import Struct
 from archipelagopy.structs.version import Version
 
 __all__ = [
+    "DataStorageOperation",
     "GameData",
     "JSONMessagePart",
     "NetworkItem",
@@ -1,3 +1,5 @@
+from typing import Any
+
 from archipelagopy.enums.operation import Operation
 from archipelagopy.structs.struct import Struct
 
@@ -20,4 +22,4 @@ class DataStorageOperation(Struct):
     """
 
     operation: Operation
-    value: int
+    value: Any = None
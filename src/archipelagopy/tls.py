@@ -0,0 +1,127 @@
+import functools
+import ssl
+import sys
+import threading
+from ssl import SSLContext, SSLObject, SSLSession
+
+
+class _SessionCachingSSLObject(SSLObject):
+    def do_handshake(self):
+        super().do_handshake()
+        if not self.server_side:
+            self.context.handshake_done(self)
+
+
+class SessionCachingSSLContext(SSLContext):
+    """
+    An SSLContext for client connections, which offers the TLS session of the previous connection to a host
+    when connecting to it again, so reconnects resume the session instead of doing a full handshake.
+    Servers which do not accept the session (e.g. because their session ticket keys changed) fall back
+    to a full handshake.
+
+    Only connections using wrap_bio() (which is used by asyncio and websockets) take part in the session cache.
+    """
+
+    sslobject_class = _SessionCachingSSLObject
+
+    def __new__(cls, *args, **kwargs):
+        # SSLContext is set up by __new__, which takes the protocol, so the state is added here instead of __init__
+        self = super().__new__(cls, *args, **kwargs)
+        self.__lock: threading.Lock = threading.Lock()
+        # the latest connection per host, its session is read on the next connection to the host, as TLS 1.3
+        # servers send session tickets after the handshake
+        self.__connections: dict[str, SSLObject] = {}
+        self.__resumed: int = 0
+        self.__handshakes: int = 0
+        return self
+
+    @property
+    def resumed(self) -> int:
+        """
+        Number of handshakes which resumed a session.
+        """
+
+        return self.__resumed
+
+    @property
+    def handshakes(self) -> int:
+        """
+        Number of completed handshakes.
+        """
+
+        return self.__handshakes
+
+    def get_session(self, server_hostname: str) -> SSLSession | None:
+        """
+        Returns the session offered on the next connection to a host, if there is a resumable one.
+        """
+
+        with self.__lock:
+            connection: SSLObject | None = self.__connections.get(server_hostname)
+
+        if connection is None:
+            return None
+
+        try:
+            session: SSLSession | None = connection.session
+        except ValueError:
+            return None
+
+        if session is None or (connection.version() == "TLSv1.3" and not session.has_ticket):
+            return None
+
+        return session
+
+    def clear_sessions(self):
+        with self.__lock:
+            self.__connections.clear()
+
+    def wrap_bio(self, incoming: ssl.MemoryBIO, outgoing: ssl.MemoryBIO, server_side: bool = False,
+                 server_hostname: str | None = None, session: SSLSession | None = None) -> SSLObject:
+        if not server_side and server_hostname is not None and session is None:
+            session = self.get_session(server_hostname)
+
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
+
+    def handshake_done(self, connection: SSLObject):
+        """
+        Called by the connections of the context once their handshake completed, so their session is offered
+        on the next connection to the host.
+        """
+
+        with self.__lock:
+            self.__handshakes += 1
+            if connection.session_reused:
+                self.__resumed += 1
+
+            if connection.server_hostname is not None:
+                self.__connections[connection.server_hostname] = connection
+
+
+def create_session_caching_context(cafile: str | None = None, capath: str | None = None,
+                                   cadata: str | bytes | None = None) -> SessionCachingSSLContext:
+    """
+    Creates a SessionCachingSSLContext with the settings of ssl.create_default_context() for server authentication.
+    """
+
+    context: SessionCachingSSLContext = SessionCachingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+    if sys.version_info >= (3, 13):
+        context.verify_flags |= ssl.VERIFY_X509_PARTIAL_CHAIN | ssl.VERIFY_X509_STRICT
+
+    if cafile or capath or cadata:
+        context.load_verify_locations(cafile, capath, cadata)
+    else:
+        context.load_default_certs(ssl.Purpose.SERVER_AUTH)
+
+    return context
+
+
+@functools.cache
+def get_default_ssl_context() -> SessionCachingSSLContext:
+    """
+    Returns the SSLContext used by clients without an ssl_context. It is created once per process, so the system
+    CA store is only loaded once and all clients share the TLS sessions of the hosts they connect to.
+    """
+
+    return create_session_caching_context()
@@ -11,20 +11,22 @@ from archipelagopy import Client, packets
 
 class ServerClient:
 
-    def __init__(self):
+    def __init__(self, **client_kwargs):
         self.stop_event = asyncio.Event()
         self.send_queue = asyncio.Queue()
-        self.client = Client(0, host="localhost", secure=False)
+        self.received = asyncio.Queue()
+        self.client = Client(0, host="localhost", secure=False, **client_kwargs)
         self.task: asyncio.Task | None = None
 
     async def server_task_handler(self, ws: ServerConnection):
 
         queue_task = asyncio.create_task(self.send_queue.get())
         stop_task = asyncio.create_task(self.stop_event.wait())
+        recv_task = asyncio.create_task(ws.recv())
         while True:
 
             done, pending = await asyncio.wait(
-                [queue_task, stop_task],
+                [queue_task, stop_task, recv_task],
                 return_when=asyncio.FIRST_COMPLETED
             )
 
@@ -35,9 +37,18 @@ class ServerClient:
                 await ws.send(msg)
                 queue_task = asyncio.create_task(self.send_queue.get())
 
+            elif done is recv_task:
+                if done.exception() is not None:
+                    break
+                self.received.put_nowait(done.result())
+                recv_task = asyncio.create_task(ws.recv())
+
             elif done is stop_task:
                 break
 
+        for task in (queue_task, recv_task):
+            task.cancel()
+
         await ws.close(code=websockets.CloseCode.NORMAL_CLOSURE)
 
     async def server_send(self, msg: str):
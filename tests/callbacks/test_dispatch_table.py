@@ -0,0 +1,57 @@
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.client import PACKET_CALLBACK_MAP
+
+BOUNCED = packets.Bounced.model_construct(slots=(1,))
+
+
+def test_defaults_skipped():
+    client = Client(0)
+
+    assert all(client._resolve_packet_callback(packet_type.model_construct()) is None
+               for packet_type in PACKET_CALLBACK_MAP if issubclass(packet_type, packets.ServerPacket))
+    assert not any(client._is_packet_handled(packet_type) for packet_type in PACKET_CALLBACK_MAP)
+
+
+def test_table_cached():
+    class BouncedClient(Client):
+        async def on_bounced(self, packet: packets.Bounced):
+            pass
+
+    client = BouncedClient(0)
+    callback = client._resolve_packet_callback(BOUNCED)
+
+    assert callback == client.on_bounced
+    assert client._resolve_packet_callback(BOUNCED) is callback
+
+
+@pytest.mark.asyncio
+async def test_invalidated_by_monkey_patching():
+    client = Client(0)
+    received: list[str] = []
+
+    assert client._resolve_packet_callback(BOUNCED) is None
+
+    async def on_bounced(packet: packets.Bounced):
+        received.append("bounced")
+
+    async def on_packet(packet: packets.ServerPacket):
+        received.append("packet")
+
+    client.on_bounced = on_bounced
+    assert client._resolve_packet_callback(BOUNCED) is on_bounced
+    assert client._is_packet_handled(packets.Bounced)
+    assert not client._is_packet_handled(packets.PrintJSON)
+
+    client.on_packet = on_packet
+    assert client._is_packet_handled(packets.PrintJSON)
+
+    await client._process_packet(BOUNCED)
+    assert received == ["packet", "bounced"]
+
+    del client.on_bounced
+    assert client._resolve_packet_callback(BOUNCED) is None
+
+    await client._process_packet(BOUNCED)
+    assert received == ["packet", "bounced", "packet"]
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+from archipelagopy import Client, packets
+from tests.callbacks import ServerClient, test_data
+from tests.callbacks.test_packet_callbacks import PACKET_CALLBACKS, id_func
+
+
+def combined_frame(test_data) -> str:
+    return json.dumps([element for frame in test_data.values() for element in json.loads(frame)])
+
+
+def test_lazy_decode_unhandled(test_data):
+    client = Client(0, lazy_decode=True)
+    assert client._decode_frame(combined_frame(test_data)) == []
+
+
+@pytest.mark.parametrize("callback", PACKET_CALLBACKS, ids=id_func)
+def test_lazy_decode_handled(test_data, callback: tuple[type[packets.ServerPacket], str]):
+    packet_type, callback_name = callback
+    client = Client(0, lazy_decode=True)
+
+    async def on_callback(_: packet_type):
+        pass
+
+    setattr(client, callback_name, on_callback)
+
+    packet_list = client._decode_frame(combined_frame(test_data))
+    assert packet_list == packets.PACKET_TYPE_ADAPTER.validate_json(test_data[packet_type.__name__])
+
+
+def test_lazy_decode_on_packet(test_data):
+    client = Client(0, lazy_decode=True)
+
+    async def on_packet(_: packets.ServerPacket):
+        pass
+
+    client.on_packet = on_packet
+
+    frame: str = combined_frame(test_data)
+    assert client._decode_frame(frame) == packets.PACKET_TYPE_ADAPTER.validate_json(frame)
+
+
+def test_lazy_decode_subclass(test_data):
+    class ReceivedItemsClient(Client):
+        async def on_received_items(self, packet: packets.ReceivedItems):
+            pass
+
+    client = ReceivedItemsClient(0, lazy_decode=True)
+    packet_list = client._decode_frame(combined_frame(test_data))
+
+    assert len(packet_list) == 1
+    assert isinstance(packet_list[0], packets.ReceivedItems)
+
+
+@pytest.mark.asyncio
+async def test_lazy_decode_dispatch(test_data):
+    server_client = ServerClient(lazy_decode=True)
+    received_event = asyncio.Event()
+    room_update_event = asyncio.Event()
+
+    async def on_received(_: str):
+        received_event.set()
+
+    async def on_room_update(packet: packets.RoomUpdate):
+        assert isinstance(packet, packets.RoomUpdate)
+        room_update_event.set()
+
+    server_client.client.on_received = on_received
+    server_client.client.on_room_update = on_room_update
+
+    async with server_client:
+        await server_client.server_send(test_data["PrintJSON"])
+        await asyncio.wait_for(received_event.wait(), timeout=0.5)
+        await server_client.server_send(test_data["RoomUpdate"])
+        await asyncio.wait_for(room_update_event.wait(), timeout=0.5)
@@ -0,0 +1,161 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from archipelagopy.data_package import DataPackageCache, DataPackageStore
+from tests.parsing import load_data
+
+DATA_PACKAGE_DATA: Final[list[tuple[Path, str]]] = load_data(
+    Path(__file__).parent.parent / "parsing" / "server" / "test_data_package"
+)
+
+
+def load_games() -> dict[str, structs.GameData]:
+    games: dict[str, structs.GameData] = {}
+    for _, json_data in sorted(DATA_PACKAGE_DATA):
+        games.update(packets.DataPackage.model_validate_json(json_data).data.games)
+
+    return games
+
+
+GAMES: Final[dict[str, structs.GameData]] = load_games()
+
+
+@pytest.mark.parametrize("game", GAMES)
+def test_round_trip(tmp_path: Path, game: str):
+    cache = DataPackageCache(tmp_path)
+    data: structs.GameData = GAMES[game]
+
+    assert (game, data.checksum) not in cache
+    assert cache.get(game, data.checksum) is None
+
+    assert cache.put(game, data)
+
+    assert (game, data.checksum) in cache
+    assert cache.get(game, data.checksum) == data
+
+    columns = cache.load_columns(game, data.checksum)
+    assert list(columns.item_ids) == sorted(data.item_name_to_id.values())
+    assert list(columns.location_ids) == sorted(data.location_name_to_id.values())
+
+
+def test_missing(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    for game, data in GAMES.items():
+        cache.put(game, data)
+
+    checksums: dict[str, str] = {game: data.checksum for game, data in GAMES.items()}
+    assert cache.missing(checksums) == []
+
+    stale_game: str = next(iter(GAMES))
+    checksums[stale_game] = "0" * 40
+    checksums["Unknown Game"] = "1" * 40
+    assert cache.missing(checksums) == [stale_game, "Unknown Game"]
+
+
+def test_other_game_same_checksum(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    game, data = next(iter(GAMES.items()))
+    cache.put(game, data)
+
+    assert ("Other Game", data.checksum) not in cache
+    assert cache.get("Other Game", data.checksum) is None
+
+    # games with the same checksum are stored side by side
+    other: structs.GameData = structs.GameData(checksum=data.checksum, item_name_to_id={"Item": 1})
+    cache.put("Other/Game", other)
+    assert cache.get(game, data.checksum) == data
+    assert cache.get("Other/Game", data.checksum) == other
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.parametrize("checksum", ["", "../escape", "a/b", "a" * 129])
+def test_invalid_checksum(tmp_path: Path, checksum: str):
+    cache = DataPackageCache(tmp_path)
+    data = structs.GameData(checksum=checksum, item_name_to_id={"Item": 1}, location_name_to_id={})
+
+    assert not cache.put("Game", data)
+    assert ("Game", checksum) not in cache
+    assert cache.get("Game", checksum) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_null_character_in_name(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    data = structs.GameData(checksum="abc", item_name_to_id={"It\0em": 1}, location_name_to_id={})
+
+    assert not cache.put("Game", data)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("truncate", [0, 3, 20, 60, -1])
+def test_corrupted_file(tmp_path: Path, truncate: int):
+    cache = DataPackageCache(tmp_path)
+    game, data = max(GAMES.items(), key=lambda g: len(g[1].item_name_to_id))
+    cache.put(game, data)
+
+    file: Path = next(tmp_path.iterdir())
+    file.write_bytes(file.read_bytes()[:truncate])
+
+    assert cache.get(game, data.checksum) is None
+
+
+class CacheClient(Client):
+    def __init__(self, cache: DataPackageCache):
+        super().__init__(0, data_package_cache=cache, lazy_decode=True)
+        self.games: dict[str, structs.GameData] = {}
+        self.sent: list[packets.ClientPacket] = []
+
+    async def on_game_data(self, game: str, data: structs.GameData):
+        self.games[game] = data
+
+    async def send(self, packet: packets.ClientPacket):
+        self.sent.append(packet)
+
+    async def process_room_info(self, room_info: packets.RoomInfo):
+        await self._process_packet(room_info)
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_client(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    cached_game, uncached_game, *_ = GAMES
+
+    cache.put(cached_game, GAMES[cached_game])
+
+    room_info = packets.RoomInfo.model_validate_json(json.dumps({
+        "cmd": "RoomInfo", "password": False, "games": [cached_game, uncached_game], "tags": [],
+        "version": {"major": 0, "minor": 6, "build": 2, "class": "Version"},
+        "generator_version": {"major": 0, "minor": 6, "build": 1, "class": "Version"},
+        "permissions": {"release": 6, "remaining": 2, "collect": 6}, "hint_cost": 10, "location_check_points": 1,
+        "datapackage_checksums": {game: GAMES[game].checksum for game in (cached_game, uncached_game)},
+        "seed_name": "seed", "time": 1753463815.9338603,
+    }))
+
+    client = CacheClient(cache)
+    assert client._is_packet_handled(packets.RoomInfo)
+    assert client._is_packet_handled(packets.DataPackage)
+
+    await client.process_room_info(room_info)
+
+    assert client.games == {cached_game: GAMES[cached_game]}
+    assert client.sent == [packets.GetDataPackage(games=[uncached_game])]
+
+    await client._process_packet(packets.DataPackage(data={"games": {uncached_game: GAMES[uncached_game]}}))
+    assert cache.get(uncached_game, GAMES[uncached_game].checksum) == GAMES[uncached_game]
+
+    client.sent.clear()
+    client.games.clear()
+    await client.process_room_info(room_info)
+    assert client.sent == []
+    assert client.games == {game: GAMES[game] for game in (cached_game, uncached_game)}
+
+
+def test_client_cache_and_store(tmp_path: Path):
+    with pytest.raises(ValueError):
+        Client(0, data_package_cache=DataPackageCache(tmp_path), data_package_store=DataPackageStore())
@@ -0,0 +1,192 @@
+import gc
+import weakref
+from array import array
+from pathlib import Path
+
+import pytest
+
+from archipelagopy import structs
+from archipelagopy.data_package import (
+    DataPackageCache,
+    DataPackageIndex,
+    DataPackageStore,
+    GameDataIndex,
+    IdNameIndex,
+    IdRangeIndex,
+    get_game_data_index,
+)
+from tests.data_package.test_cache import GAMES
+
+
+@pytest.mark.parametrize("game", GAMES)
+def test_lookup(game: str):
+    data: structs.GameData = GAMES[game]
+    index = GameDataIndex.from_game_data(data)
+
+    for name, item_id in data.item_name_to_id.items():
+        assert index.get_item_id(name) == item_id
+        assert data.item_name_to_id[index.get_item_name(item_id)] == item_id
+
+    for name, location_id in data.location_name_to_id.items():
+        assert index.get_location_id(name) == location_id
+        assert data.location_name_to_id[index.get_location_name(location_id)] == location_id
+
+    assert index.to_game_data() == data
+
+
+def test_lookup_missing():
+    index = IdNameIndex.from_mapping({"B": 2, "A": 5, "C": -1})
+
+    assert list(index) == [(-1, "C"), (2, "B"), (5, "A")]
+    assert index.get_name(3) is None
+    assert index.get_name(6) is None
+    assert index.get_name(-2) is None
+    assert index.get_id("D") is None
+    assert index.get_id("") is None
+
+    empty = IdNameIndex.from_mapping({})
+    assert len(empty) == 0
+    assert empty.get_name(1) is None
+    assert empty.get_id("A") is None
+
+
+def test_invalid_columns():
+    with pytest.raises(ValueError):
+        IdNameIndex(IdNameIndex.from_mapping({"A": 1}).ids, [])
+
+
+def test_interned_names():
+    first = IdNameIndex.from_mapping({"".join(["Item", " ", "A"]): 1})
+    second = IdNameIndex.from_mapping({"".join(["Item", " ", "A"]): 1})
+
+    assert first.names[0] is second.names[0]
+
+
+def test_from_cached(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    game, data = next(iter(GAMES.items()))
+    cache.put(game, data)
+
+    assert GameDataIndex.from_cached(cache.load_columns(game, data.checksum)).to_game_data() == data
+
+
+def test_shared_index():
+    data: structs.GameData = next(iter(GAMES.values()))
+
+    index: GameDataIndex = get_game_data_index(data)
+    assert get_game_data_index(data.model_copy()) is index
+
+    # indexes are only shared while referenced
+    ref: weakref.ref = weakref.ref(index)
+    del index
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.asyncio
+async def test_store_index():
+    store = DataPackageStore()
+    data = structs.GameData(checksum="aaa", item_name_to_id={"Item": 1}, location_name_to_id={})
+
+    async def request(_: list[str]):
+        await store.put("A", data)
+
+    assert [game async for game, _ in store.fetch("owner", {"A": "aaa"}, request)] == ["A"]
+
+    index: GameDataIndex = store.get_index("A", "aaa")
+    assert index.get_item_name(1) == "Item"
+    assert store.get_index("A", "aaa") is index
+    assert store.get_index("B", "bbb") is None
+
+    store.release("owner")
+    assert store.get_index("A", "aaa") is None
+
+
+def create_range_index() -> IdRangeIndex:
+    index = IdRangeIndex()
+    index.add("A", IdNameIndex.from_mapping({"A1": 1, "A5": 5, "A10": 10}))
+    index.add("B", IdNameIndex.from_mapping({"B3": 3, "B5": 5, "B20": 20}))
+    index.add("C", IdNameIndex.from_mapping({"C-2": -2}))
+    index.add("Empty", IdNameIndex.from_mapping({}))
+    return index
+
+
+@pytest.mark.parametrize("id_, expected", [
+    (-3, None), (-2, ("C", "C-2")), (0, None), (1, ("A", "A1")), (2, None), (3, ("B", "B3")),
+    (5, ("A", "A5")), (10, ("A", "A10")), (11, None), (20, ("B", "B20")), (21, None),
+])
+def test_range_resolve(id_: int, expected: tuple[str, str] | None):
+    index: IdRangeIndex = create_range_index()
+
+    assert index.resolve(id_) == expected
+    assert index.resolve_many([id_]) == [expected]
+
+
+def test_range_resolve_all():
+    index: IdRangeIndex = create_range_index()
+
+    assert index.resolve_all(5) == [("A", "A5"), ("B", "B5")]
+    assert index.resolve_all(4) == []
+    assert index.resolve_all(-10) == []
+
+
+def test_range_resolve_many():
+    index: IdRangeIndex = create_range_index()
+    ids: list[int] = [1, 1, 5, 10, 10, 3, 20, 21, 2, -2, -5, 30, 20]
+
+    assert index.resolve_many(array("q", ids)) == [index.resolve(id_) for id_ in ids]
+    assert IdRangeIndex().resolve_many(ids) == [None] * len(ids)
+
+
+def test_range_remove():
+    index: IdRangeIndex = create_range_index()
+    index.remove("A")
+    index.remove("Unknown")
+
+    assert "A" not in index
+    assert len(index) == 3
+    assert index.resolve(5) == ("B", "B5")
+    assert index.resolve(1) is None
+
+    index.add("B", IdNameIndex.from_mapping({"New B": 1}))
+    assert index.resolve(1) == ("B", "New B")
+    assert index.resolve(20) is None
+
+
+def test_range_add_many():
+    index: IdRangeIndex = create_range_index()
+    bulk = IdRangeIndex()
+    bulk.add_many({
+        "A": IdNameIndex.from_mapping({"A1": 1, "A5": 5, "A10": 10}),
+        "B": IdNameIndex.from_mapping({"B3": 3, "B5": 5, "B20": 20}),
+        "C": IdNameIndex.from_mapping({"C-2": -2}),
+    })
+    ids: list[int] = list(range(-3, 22))
+
+    assert bulk.resolve_many(ids) == index.resolve_many(ids)
+    assert bulk.resolve_all(5) == [("A", "A5"), ("B", "B5")]
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_data_package_index(bulk: bool):
+    index = DataPackageIndex()
+    if bulk:
+        index.add_many(GAMES)
+    else:
+        for game, data in GAMES.items():
+            index.add(game, data)
+
+    for game, data in GAMES.items():
+        for name, item_id in data.item_name_to_id.items():
+            assert game in dict(index.items.resolve_all(item_id))
+            assert (game, name) in index.items.resolve_all(item_id)
+        for name, location_id in data.location_name_to_id.items():
+            assert (game, name) in index.locations.resolve_all(location_id)
+
+    game, data = next(iter(GAMES.items()))
+    item_name, item_id = next(iter(data.item_name_to_id.items()))
+    assert index.resolve_item(item_id) == (game, item_name)
+
+    index.remove(game)
+    assert game not in index.items
+    assert game not in index.locations
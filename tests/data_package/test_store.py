@@ -0,0 +1,159 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from archipelagopy.data_package import DataPackageCache, DataPackageStore
+
+GAME_A = structs.GameData(checksum="aaa", item_name_to_id={"Item A": 1}, location_name_to_id={"Location A": 2})
+GAME_B = structs.GameData(checksum="bbb", item_name_to_id={"Item B": 3}, location_name_to_id={"Location B": 4})
+CHECKSUMS: dict[str, str] = {"A": GAME_A.checksum, "B": GAME_B.checksum}
+
+
+class Requester:
+    def __init__(self):
+        self.requests: list[list[str]] = []
+
+    async def __call__(self, games: list[str]):
+        self.requests.append(games)
+
+
+async def collect(store: DataPackageStore, owner: object, requester: Requester,
+                  checksums: dict[str, str] = CHECKSUMS) -> dict[str, structs.GameData]:
+    return {game: data async for game, data in store.fetch(owner, checksums, requester)}
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    store = DataPackageStore()
+    requesters: list[Requester] = [Requester() for _ in range(3)]
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(collect(store, r, r)) for r in requesters]
+    await asyncio.sleep(0)
+
+    assert requesters[0].requests == [["A", "B"]]
+    assert requesters[1].requests == requesters[2].requests == []
+    assert store.is_pending("A", "aaa")
+
+    await store.put("A", GAME_A)
+    await store.put("B", GAME_B)
+
+    for task in tasks:
+        assert await task == {"A": GAME_A, "B": GAME_B}
+
+    assert store.get("A", "aaa") == GAME_A
+    assert store.refcount("A", "aaa") == 3
+
+    # stored games are never requested
+    requester = Requester()
+    assert await collect(store, requester, requester) == {"A": GAME_A, "B": GAME_B}
+    assert requester.requests == []
+
+
+@pytest.mark.asyncio
+async def test_release_evicts():
+    store = DataPackageStore()
+    first, second = Requester(), Requester()
+
+    task = asyncio.create_task(collect(store, first, first))
+    await asyncio.sleep(0)
+    await store.put("A", GAME_A)
+    await store.put("B", GAME_B)
+    await task
+
+    assert await collect(store, second, second, {"A": "aaa"}) == {"A": GAME_A}
+
+    store.release(first)
+    assert ("A", "aaa") in store
+    assert ("B", "bbb") not in store
+    assert store.refcount("A", "aaa") == 1
+
+    store.release(second)
+    assert len(store) == 0
+    assert store.refcount("A", "aaa") == 0
+
+
+@pytest.mark.asyncio
+async def test_release_pending_requests_again():
+    store = DataPackageStore()
+    first, second = Requester(), Requester()
+
+    first_task = asyncio.create_task(collect(store, first, first))
+    second_task = asyncio.create_task(collect(store, second, second))
+    await asyncio.sleep(0)
+
+    first_task.cancel()
+    store.release(first)
+    await asyncio.sleep(0.01)
+
+    assert first.requests == [["A", "B"]]
+    assert sorted(second.requests) == [["A"], ["B"]]
+
+    await store.put("A", GAME_A)
+    await store.put("B", GAME_B)
+    assert await second_task == {"A": GAME_A, "B": GAME_B}
+
+
+@pytest.mark.asyncio
+async def test_put_unreferenced():
+    store = DataPackageStore()
+    await store.put("A", GAME_A)
+
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache(tmp_path: Path):
+    cache = DataPackageCache(tmp_path)
+    cache.put("A", GAME_A)
+
+    store = DataPackageStore(cache)
+    requester = Requester()
+    task = asyncio.create_task(collect(store, requester, requester))
+    await asyncio.sleep(0.05)
+
+    assert requester.requests == [["B"]]
+
+    await store.put("B", GAME_B)
+    assert await task == {"A": GAME_A, "B": GAME_B}
+    assert cache.get("B", "bbb") == GAME_B
+
+
+class StoreClient(Client):
+    def __init__(self, store: DataPackageStore):
+        super().__init__(0, data_package_store=store)
+        self.games: dict[str, structs.GameData] = {}
+        self.sent: list[packets.ClientPacket] = []
+
+    async def on_game_data(self, game: str, data: structs.GameData):
+        self.games[game] = data
+
+    async def send(self, packet: packets.ClientPacket):
+        self.sent.append(packet)
+
+
+@pytest.mark.asyncio
+async def test_clients():
+    store = DataPackageStore()
+    clients: list[StoreClient] = [StoreClient(store) for _ in range(3)]
+    room_info = packets.RoomInfo.model_construct(datapackage_checksums=CHECKSUMS)
+
+    for client in clients:
+        await client._process_packet(room_info)
+    await asyncio.sleep(0)
+
+    assert clients[0].sent == [packets.GetDataPackage(games=["A", "B"])]
+    assert clients[1].sent == clients[2].sent == []
+
+    # the requesting client fires on_game_data when decoding the DataPackage
+    await clients[0]._process_packet(packets.DataPackage(data={"games": {"A": GAME_A, "B": GAME_B}}))
+    await asyncio.sleep(0.01)
+
+    assert clients[0].games == {}
+    assert clients[1].games == clients[2].games == {"A": GAME_A, "B": GAME_B}
+
+    for client in clients:
+        client._release_data_packages()
+
+    assert len(store) == 0
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from archipelagopy.data_package import iter_frame
+from tests.callbacks import ServerClient
+from tests.parsing import load_data
+
+DATA_PACKAGE_DATA: Final[list[tuple[Path, str]]] = load_data(
+    Path(__file__).parent.parent / "parsing" / "server" / "test_data_package"
+)
+
+
+def create_frame() -> str:
+    return f"[{','.join(json_data for _, json_data in sorted(DATA_PACKAGE_DATA))}]"
+
+
+@pytest.mark.parametrize("data", DATA_PACKAGE_DATA, ids=lambda d: d[0].name)
+def test_iter_frame(data: tuple[Path, str]):
+    _, json_data = data
+    expected: dict = json.loads(json_data)
+
+    games: dict[str, dict] = {}
+    elements: list[dict] = []
+    for game, element in iter_frame(f"[{json_data}, {{\"cmd\": \"Bounced\"}}]"):
+        if game is not None:
+            assert not elements, "games must be yielded before their packet"
+            games[game] = element
+        else:
+            elements.append(element)
+
+    assert elements[1] == {"cmd": "Bounced"}
+    assert elements[0]["data"]["games"] == {}
+    assert list(games) == list(expected["data"]["games"])
+
+    elements[0]["data"]["games"] = games
+    assert elements[0] == expected
+
+
+def test_iter_frame_data_before_cmd():
+    frame: str = '[{"data": {"games": {"A": {"checksum": "a"}}}, "cmd": "DataPackage"}]'
+    assert list(iter_frame(frame)) == [(None, json.loads(frame)[0])]
+
+
+def test_iter_frame_loads():
+    frame: str = '[{"cmd": "DataPackage", "data": {"games": {"A": {"checksum": "}{\\"]["}}}}]'
+    loaded: list[str] = []
+
+    def loads(text: str):
+        loaded.append(text)
+        return json.loads(text)
+
+    assert list(iter_frame(frame, loads))[0] == ("A", {"checksum": '}{"]['})
+    assert '{"checksum": "}{\\"]["}' in loaded
+
+
+@pytest.mark.parametrize("frame", ["", "[", "[{]", '[{"cmd": "DataPackage"}', "[] []", '{"cmd": "Bounced"}'])
+def test_iter_frame_invalid(frame: str):
+    with pytest.raises(ValueError):
+        list(iter_frame(frame))
+
+
+def test_iter_frame_truncated():
+    # a truncated frame fails right away instead of backtracking exponentially
+    frame: str = '[{"cmd": "DataPackage", "data": {"games": {"A": {"checksum": ' + "1" * 100_000
+    start: float = time.perf_counter()
+    with pytest.raises(ValueError):
+        list(iter_frame(frame))
+
+    assert time.perf_counter() - start < 0.5
+
+
+class GameDataClient(Client):
+    def __init__(self, **kwargs):
+        super().__init__(0, **kwargs)
+        self.games: dict[str, structs.GameData] = {}
+
+    async def on_game_data(self, game: str, data: structs.GameData):
+        self.games[game] = data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trusted_server", [False, True])
+async def test_client_streaming(trusted_server: bool):
+    client = GameDataClient(trusted_server=trusted_server)
+    frame: str = create_frame()
+
+    packet_list = await client._decode_frame_streaming(frame)
+    expected = packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(frame)
+
+    assert packet_list == expected
+    assert client.games == {g: d for p in expected for g, d in p.data.games.items()}
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_lazy():
+    client = GameDataClient(lazy_decode=True)
+    frame: str = create_frame()
+
+    assert await client._decode_frame_streaming(frame) == []
+    assert client.games
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_data_before_cmd():
+    client = GameDataClient()
+    frame: str = '[{"data": {"games": {"A": {"checksum": "a"}}}, "cmd": "DataPackage"}]'
+
+    assert await client._decode_frame_streaming(frame) == packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(frame)
+    assert client.games == {"A": structs.GameData(checksum="a")}
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_yields():
+    client = GameDataClient()
+    other_task_steps: int = 0
+
+    async def other_task():
+        nonlocal other_task_steps
+        while True:
+            other_task_steps += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(other_task())
+    await asyncio.sleep(0)
+    await client._decode_frame_streaming(create_frame())
+    task.cancel()
+
+    # the event loop has to run other tasks between the games of a DataPackage
+    assert other_task_steps > len(client.games)
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_dispatch():
+    server_client = ServerClient()
+    data_package_event = asyncio.Event()
+    games: list[str] = []
+
+    async def on_game_data(game: str, _: structs.GameData):
+        assert not data_package_event.is_set()
+        games.append(game)
+
+    async def on_data_package(packet: packets.DataPackage):
+        assert list(packet.data.games) == games
+        data_package_event.set()
+
+    server_client.client.on_game_data = on_game_data
+    server_client.client.on_data_package = on_data_package
+
+    _, json_data = max(DATA_PACKAGE_DATA, key=lambda d: len(d[1]))
+    async with server_client:
+        await server_client.server_send(f"[{json_data}]")
+        await asyncio.wait_for(data_package_event.wait(), timeout=1)
+
+    assert games
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_only_data_packages():
+    client = GameDataClient()
+    frame: str = '[{"cmd": "PrintJSON", "data": [{"text": "DataPackage"}, {"text": "{\\"cmd\\":\\"DataPackage\\"}"}]}]'
+
+    async def decode_frame_streaming(js: str):
+        raise AssertionError("The frame does not contain a DataPackage")
+
+    client._decode_frame_streaming = decode_frame_streaming
+    assert await client._decode_received_frame(frame) == packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(frame)
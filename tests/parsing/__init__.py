@@ -1,6 +1,9 @@
 from pathlib import Path
 from typing import TypeVar
 
+import pytest
+from pydantic import ValidationError
+
 from archipelagopy import packets
 
 PATH = Path(__file__).parent
@@ -22,6 +25,31 @@ def helper_test_packet_adapter(data: str, packet_cls: type[T]) -> T:
 
     return packet[0]
 
+def helper_test_directional_adapter(data: str, packet_cls: type[T]) -> T:
+    if issubclass(packet_cls, packets.ServerPacket):
+        adapter, opposite_adapter = packets.SERVER_PACKET_TYPE_ADAPTER, packets.CLIENT_PACKET_TYPE_ADAPTER
+    else:
+        adapter, opposite_adapter = packets.CLIENT_PACKET_TYPE_ADAPTER, packets.SERVER_PACKET_TYPE_ADAPTER
+
+    packet = adapter.validate_json(f"[{data}]")
+
+    assert isinstance(packet, list)
+    assert len(packet) == 1
+    assert isinstance(packet[0], packet_cls)
+
+    with pytest.raises(ValidationError):
+        opposite_adapter.validate_json(f"[{data}]")
+
+    return packet[0]
+
+def helper_test_decode_packet(data: str, packet_cls: type[T]) -> T:
+    packet = packets.decode_packet(packet_cls, data)
+
+    assert isinstance(packet, packet_cls)
+    assert packet == packet_cls.model_validate_json(data)
+
+    return packet
+
 def load_data(folder: Path, recursive: bool = False) -> list[tuple[Path, str]]:
     assert folder.exists(), f"{folder} does not exist"
 
@@ -5,7 +5,13 @@ import pytest
 
 from archipelagopy import packets
 from archipelagopy.enums import PrintJSONType
-from tests.parsing import load_data, helper_test_packet_adapter, helper_test_parse_json
+from tests.parsing import (
+    load_data,
+    helper_test_decode_packet,
+    helper_test_directional_adapter,
+    helper_test_packet_adapter,
+    helper_test_parse_json
+)
 
 TEST_DATA: Final[list[tuple[PrintJSONType | None, str]]] = [
     (PrintJSONType.CHAT, "chat"),
@@ -41,4 +47,16 @@ def test_model(data: tuple[PrintJSONType | None, tuple[Path, str]]):
 @pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
 def test_packet_adapter(data: tuple[PrintJSONType | None, tuple[Path, str]]):
     _, (_, json_data) = data
-    helper_test_packet_adapter(json_data, packets.PrintJSON)
\ No newline at end of file
+    helper_test_packet_adapter(json_data, packets.PrintJSON)
+
+
+@pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
+def test_directional_adapter(data: tuple[PrintJSONType | None, tuple[Path, str]]):
+    _, (_, json_data) = data
+    helper_test_directional_adapter(json_data, packets.PrintJSON)
+
+
+@pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
+def test_decode_packet(data: tuple[PrintJSONType | None, tuple[Path, str]]):
+    _, (_, json_data) = data
+    helper_test_decode_packet(json_data, packets.PrintJSON)
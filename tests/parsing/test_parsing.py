@@ -4,7 +4,13 @@ from typing import Final
 import pytest
 
 from archipelagopy import packets
-from tests.parsing import load_data, helper_test_packet_adapter, helper_test_parse_json
+from tests.parsing import (
+    load_data,
+    helper_test_decode_packet,
+    helper_test_directional_adapter,
+    helper_test_packet_adapter,
+    helper_test_parse_json
+)
 
 TEST_DATA: Final[list[tuple[type[packets.Packet], str]]] = [
     (packets.Bounced, "server/test_bounced"),
@@ -42,4 +48,14 @@ def test_model(data: tuple[type[packets.Packet], tuple[Path, str]]):
 @pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
 def test_packet_adapter(data: tuple[type[packets.Packet], tuple[Path, str]]):
     packet_type, (_, json_data) = data
-    helper_test_packet_adapter(json_data, packet_type)
\ No newline at end of file
+    helper_test_packet_adapter(json_data, packet_type)
+
+@pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
+def test_directional_adapter(data: tuple[type[packets.Packet], tuple[Path, str]]):
+    packet_type, (_, json_data) = data
+    helper_test_directional_adapter(json_data, packet_type)
+
+@pytest.mark.parametrize("data", FLAT_TEST_DATA, ids=id_func)
+def test_decode_packet(data: tuple[type[packets.Packet], tuple[Path, str]]):
+    packet_type, (_, json_data) = data
+    helper_test_decode_packet(json_data, packet_type)
@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from tests.parsing import load_data
+
+SERVER_DATA: Final[list[tuple[Path, str]]] = load_data(Path(__file__).parent / "server", recursive=True)
+
+
+def id_func(data: tuple[Path, str]) -> str:
+    path, _ = data
+    return f"{path.parent.name}/{path.name}"
+
+
+@pytest.mark.parametrize("data", SERVER_DATA, ids=id_func)
+def test_trusted_parity(data: tuple[Path, str]):
+    _, json_data = data
+
+    validated = packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(f"[{json_data}]")[0]
+    trusted = packets.build_trusted_packet(json.loads(json_data))
+
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump_json(by_alias=True) == validated.model_dump_json(by_alias=True)
+
+
+def test_trusted_missing_field():
+    builder = packets.create_model_builder(structs.NetworkItem)
+
+    with pytest.raises(KeyError):
+        builder({"item": 1, "location": 2, "player": 3})
+
+
+def test_trusted_defaults():
+    game_data = packets.create_model_builder(structs.GameData)({"checksum": "abc"})
+
+    assert game_data == structs.GameData(checksum="abc")
+    assert game_data.model_fields_set == {"checksum"}
+
+    # mutable defaults must not be shared between instances
+    game_data.item_name_to_id["item"] = 1
+    assert structs.GameData(checksum="abc").item_name_to_id == {}
+
+
+@pytest.mark.parametrize("lazy_decode", [False, True])
+def test_client_trusted_server(lazy_decode: bool):
+    client = Client(0, trusted_server=True, lazy_decode=lazy_decode)
+
+    async def on_packet(_: packets.ServerPacket):
+        pass
+
+    client.on_packet = on_packet
+
+    frame: str = f"[{','.join(json_data for _, json_data in SERVER_DATA)}]"
+    assert client._decode_frame(frame) == packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(frame)
@@ -0,0 +1,148 @@
+import asyncio
+import math
+import random
+
+import pytest
+import websockets
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client
+from archipelagopy.backoff import (
+    Backoff, DecorrelatedJitterBackoff, ExponentialBackoff, FullJitterBackoff, ReconnectLimiter
+)
+
+
+def test_exponential_backoff():
+    backoff = ExponentialBackoff(base=1, max_wait=60)
+
+    assert [backoff.get_wait(attempt, 0) for attempt in (0, 1, 5, 6, 1000)] == [1, 2, 32, 60, 60]
+
+
+def test_full_jitter_backoff():
+    backoff = FullJitterBackoff(base=1, max_wait=10, rng=random.Random(0))
+    waits: list[float] = [backoff.get_wait(3, 0) for _ in range(1000)]
+
+    assert all(0 <= wait <= 8 for wait in waits)
+    # clients retrying at the same attempt do not wait the same time
+    assert len(set(waits)) == len(waits)
+    assert max(backoff.get_wait(10, 0) for _ in range(100)) <= 10
+
+
+def test_decorrelated_jitter_backoff():
+    backoff = DecorrelatedJitterBackoff(base=1, max_wait=10, rng=random.Random(0))
+
+    previous: float = 0.0
+    for attempt in range(1, 100):
+        wait: float = backoff.get_wait(attempt, previous)
+        assert 1 <= wait <= min(max(previous, 1) * 3, 10)
+        previous = wait
+
+
+def test_invalid_backoff():
+    with pytest.raises(ValueError):
+        FullJitterBackoff(base=0)
+
+    with pytest.raises(ValueError):
+        FullJitterBackoff(base=10, max_wait=1)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_limiter():
+    limiter = ReconnectLimiter(rate=100, burst=2)
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+    start: float = loop.time()
+    waits: list[float] = await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+    elapsed: float = loop.time() - start
+
+    # the burst is served immediately, the remaining reconnects are spread at the refill rate
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == sorted(waits[2:])
+    assert math.isclose(waits[4], 0.03, abs_tol=0.005)
+    assert elapsed >= 0.029
+
+
+@pytest.mark.asyncio
+async def test_reconnect_limiter_cancel():
+    limiter = ReconnectLimiter(rate=10, burst=1)
+    await limiter.acquire()
+
+    task: asyncio.Task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.tokens < 0
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # the token reserved by the cancelled reconnect is returned
+    assert limiter.tokens >= 0
+
+
+@pytest.mark.asyncio
+async def test_client_backoff():
+    attempts: list[tuple[int, float]] = []
+    stop_event = asyncio.Event()
+    limiter = ReconnectLimiter(rate=1000, burst=1)
+
+    client = Client(0, secure=False, auto_reconnect=True, backoff=ExponentialBackoff(base=0.001, max_wait=0.004),
+                    reconnect_limiter=limiter)
+    client.RECONNECT_ACCUMULATION_PERIOD = math.inf
+
+    def on_reconnect_attempt(attempt: int, wait: float):
+        attempts.append((attempt, wait))
+        if len(attempts) == 3:
+            stop_event.set()
+
+    async def connect_monkey_patch(*args, **kwargs):
+        if stop_event.is_set():
+            await asyncio.Event().wait()  # block until cancelled
+
+        raise ConnectionRefusedError()
+
+    client.on_reconnect_attempt = on_reconnect_attempt
+    client._connect = connect_monkey_patch
+
+    async with client:
+        await asyncio.wait_for(stop_event.wait(), timeout=1)
+
+    assert [attempt for attempt, _ in attempts] == [1, 2, 3]
+    assert all(wait >= backoff for (_, wait), backoff in zip(attempts, (0.002, 0.004, 0.004)))
+
+
+@pytest.mark.asyncio
+async def test_standby_backoff():
+    attempts: list[tuple[int, float]] = []
+    stop_event = asyncio.Event()
+
+    async def server_task_handler(ws: ServerConnection):
+        await ws.close(code=websockets.CloseCode.GOING_AWAY)
+
+    def on_reconnect_attempt(attempt: int, wait: float):
+        attempts.append((attempt, wait))
+        if len(attempts) == 3:
+            stop_event.set()
+
+    async with serve(server_task_handler, "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        client = Client(port, host="localhost", secure=False, auto_reconnect=True,
+                        backoff=FullJitterBackoff(base=0.001, max_wait=0.01, rng=random.Random(0)))
+        client.RECONNECT_ACCUMULATION_PERIOD = math.inf
+        client.on_reconnect_attempt = on_reconnect_attempt
+
+        async with client:
+            await asyncio.wait_for(stop_event.wait(), timeout=1)
+
+    # standby reconnects are counted and jittered, but are not failed connection attempts
+    assert [attempt for attempt, _ in attempts[:3]] == [1, 2, 3]
+    assert all(0 < wait <= 0.01 for _, wait in attempts)
+    assert client._get_reconnect_frequency() == 0
+
+
+def test_backoff_interface():
+    with pytest.raises(TypeError):
+        Backoff()
+
+    # the strategies keep the parameter names of the base class
+    assert ExponentialBackoff(base=1).get_wait(attempt=2, previous=0) == 4
+    assert DecorrelatedJitterBackoff(base=1, max_wait=1).get_wait(attempt=1, previous=5) == 1
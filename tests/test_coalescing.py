@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import pytest
+
+from archipelagopy import Client, packets
+from tests.callbacks import ServerClient
+
+# in the order of their send lanes
+PACKETS: list[packets.ClientPacket] = [
+    packets.Sync(),
+    packets.LocationChecks(locations=[1, 2, 3]),
+    packets.Say(text="Hello"),
+]
+
+
+def encoded(client: Client, packet_list: list[packets.ClientPacket]) -> list[dict]:
+    return [json.loads(client.codec.encode_packet(packet)) for packet in packet_list]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_queued():
+    client = Client(0)
+    for packet in PACKETS:
+        await client.send(packet)
+
+    assert json.loads(await client._next_frame()) == encoded(client, PACKETS)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled():
+    client = Client(0, coalesce_limit=0)
+    for packet in PACKETS:
+        await client.send(packet)
+
+    for packet in PACKETS:
+        assert json.loads(await client._next_frame()) == encoded(client, [packet])
+
+
+@pytest.mark.asyncio
+async def test_coalesce_limit():
+    say: packets.Say = packets.Say(text="a" * 100)
+    size: int = len(Client(0).codec.encode_packet(say))
+
+    # fits exactly two packets
+    client = Client(0, coalesce_limit=2 * size + 3)
+    for _ in range(5):
+        await client.send(say)
+
+    frames: list[list] = [json.loads(await client._next_frame()) for _ in range(3)]
+    assert [len(frame) for frame in frames] == [2, 2, 1]
+    assert frames[0] == encoded(client, [say, say])
+
+
+@pytest.mark.asyncio
+async def test_coalesce_limit_bytes():
+    say: packets.Say = packets.Say(text="\u00e9" * 100)
+    size: int = len(Client(0).codec.encode_packet(say).encode("utf-8"))
+
+    # the limit applies to the UTF-8 encoded frame, which is larger than its number of characters
+    client = Client(0, coalesce_limit=2 * size + 3)
+    for _ in range(3):
+        await client.send(say)
+
+    frames: list[list] = [json.loads(await client._next_frame()) for _ in range(2)]
+    assert [len(frame) for frame in frames] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_oversized_packet():
+    small: packets.Say = packets.Say(text="a")
+    large: packets.Say = packets.Say(text="a" * 1000)
+
+    client = Client(0, coalesce_limit=100)
+    for packet in (small, large, small):
+        await client.send(packet)
+
+    frames: list[list] = [json.loads(await client._next_frame()) for _ in range(3)]
+    assert frames == [encoded(client, [small]), encoded(client, [large]), encoded(client, [small])]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_delay():
+    client = Client(0, coalesce_delay=0.1)
+    await client.send(PACKETS[0])
+
+    async def send_later():
+        await asyncio.sleep(0.02)
+        await client.send(PACKETS[1])
+
+    task = asyncio.create_task(send_later())
+    assert json.loads(await client._next_frame()) == encoded(client, PACKETS[:2])
+    await task
+
+
+@pytest.mark.asyncio
+async def test_coalesce_server():
+    server_client = ServerClient()
+
+    async def on_ready():
+        for packet in PACKETS:
+            await server_client.client.send(packet)
+
+    server_client.client.on_ready = on_ready
+
+    async with server_client:
+        frame: str = await asyncio.wait_for(server_client.received.get(), timeout=1)
+
+    assert json.loads(frame) == encoded(server_client.client, PACKETS)
+
+
+@pytest.mark.asyncio
+async def test_send_loop_logs_exceptions(caplog: pytest.LogCaptureFixture):
+    class FailingSocket:
+        async def send(self, message: str, text: bool):
+            raise RuntimeError("send failed")
+
+    client = Client(0)
+    client._Client__socket = FailingSocket()
+    await client.send(PACKETS[0])
+
+    with caplog.at_level("DEBUG"), pytest.raises(RuntimeError):
+        await client._send_loop()
+
+    assert "[_send_loop]: Exception" in caplog.text
+    assert "_next_frame" not in caplog.text
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from archipelagopy.client import packet_to_json
+from archipelagopy.codec import Codec, MsgspecCodec, OrjsonCodec, PydanticCodec, get_fastest_codec
+from tests.callbacks import ServerClient, test_data
+from tests.parsing import load_data
+
+SERVER_DATA: list[tuple[Path, str]] = load_data(Path(__file__).parent / "parsing" / "server", recursive=True)
+
+CLIENT_PACKETS: list[packets.ClientPacket] = [
+    packets.Say(text="Hello äöü"),
+    packets.LocationChecks(locations=[1, 2, 3]),
+    packets.Bounce(slots=[1], data={"time": 1.5, "cause": "DeathLink"}),
+    packets.Connect(version=structs.Version(major=0, minor=6, build=2), name="Player1"),
+]
+
+
+def create_codec(codec_type: type[Codec]) -> Codec:
+    if codec_type is OrjsonCodec:
+        pytest.importorskip("orjson")
+    elif codec_type is MsgspecCodec:
+        pytest.importorskip("msgspec")
+
+    return codec_type()
+
+
+@pytest.fixture(params=[PydanticCodec, OrjsonCodec, MsgspecCodec], ids=lambda c: c.__name__)
+def codec(request) -> Codec:
+    return create_codec(request.param)
+
+
+@pytest.mark.parametrize("data", SERVER_DATA, ids=lambda d: d[0].name)
+def test_loads(codec: Codec, data: tuple[Path, str]):
+    _, json_data = data
+    assert codec.loads(json_data) == json.loads(json_data)
+
+
+@pytest.mark.parametrize("data", SERVER_DATA, ids=lambda d: d[0].name)
+def test_decode(codec: Codec, data: tuple[Path, str]):
+    _, json_data = data
+    frame: str = f"[{json_data}]"
+    assert codec.decode(frame, packets.SERVER_PACKET_TYPE_ADAPTER) == (
+        packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(frame)
+    )
+
+
+def test_encode_frame(codec: Codec):
+    frame: str = codec.encode_frame(CLIENT_PACKETS)
+    assert packets.CLIENT_PACKET_TYPE_ADAPTER.validate_json(frame) == CLIENT_PACKETS
+
+    for packet in CLIENT_PACKETS:
+        assert json.loads(packet_to_json(packet, codec)) == json.loads(packet_to_json(packet))
+
+
+def test_fastest_codec():
+    assert isinstance(get_fastest_codec(), Codec)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lazy_decode", [False, True])
+async def test_client_codec(test_data, codec: Codec, lazy_decode: bool):
+    server_client = ServerClient(codec=codec, lazy_decode=lazy_decode)
+    assert server_client.client.codec is codec
+
+    room_info_event = asyncio.Event()
+
+    async def on_room_info(packet: packets.RoomInfo):
+        assert packet == packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(test_data["RoomInfo"])[0]
+        room_info_event.set()
+
+    server_client.client.on_room_info = on_room_info
+
+    async with server_client:
+        await server_client.server_send(test_data["RoomInfo"])
+        await asyncio.wait_for(room_info_event.wait(), timeout=0.5)
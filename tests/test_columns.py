@@ -0,0 +1,113 @@
+import asyncio
+import json
+from array import array
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from archipelagopy import Client, enums, packets
+from archipelagopy.columns import LocationInfoColumns, NetworkItemColumns, ReceivedItemsColumns
+from tests.callbacks import ServerClient, test_data
+from tests.parsing import load_data
+
+PARSING_PATH: Final[Path] = Path(__file__).parent / "parsing" / "server"
+
+ITEM_DATA: Final[list[tuple[Path, str]]] = [
+    *load_data(PARSING_PATH / "test_received_items"),
+    *load_data(PARSING_PATH / "test_location_info"),
+]
+
+
+@pytest.mark.parametrize("data", ITEM_DATA, ids=lambda d: d[0].name)
+def test_columns_from_json(data: tuple[Path, str]):
+    _, json_data = data
+    element: dict = json.loads(json_data)
+    packet = packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(f"[{json_data}]")[0]
+    network_items = packet.items if isinstance(packet, packets.ReceivedItems) else packet.locations
+
+    columns = NetworkItemColumns.from_json(element.get("items", element.get("locations")))
+
+    assert len(columns) == len(network_items)
+    assert columns == NetworkItemColumns.from_network_items(network_items)
+    assert tuple(columns) == network_items
+
+
+def test_columns_flags():
+    flags = [0, 1, 2, 3, 4, 5]
+    columns = NetworkItemColumns.from_json([
+        {"item": i, "location": i * 10, "player": 1, "flags": f} for i, f in enumerate(flags)
+    ])
+
+    assert columns.has_flag(enums.NetworkItemFlag.COMMON) == [True, False, False, False, False, False]
+    assert columns.has_flag(enums.NetworkItemFlag.MINOR) == [False, True, False, True, False, True]
+
+    progression = columns.select(columns.has_flag(enums.NetworkItemFlag.MINOR))
+    assert list(progression.items) == [1, 3, 5]
+    assert list(progression.locations) == [10, 30, 50]
+    assert progression[1].flags == enums.NetworkItemFlag.MINOR | enums.NetworkItemFlag.MAJOR
+
+
+def test_columns_length_mismatch():
+    with pytest.raises(ValueError):
+        NetworkItemColumns(items=array("q", [1]))
+
+
+def test_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = NetworkItemColumns.from_json([
+        {"item": 5, "location": 6, "player": 7, "flags": 1},
+        {"item": 8, "location": 9, "player": 7, "flags": 0},
+    ])
+
+    items, locations, players, flags = columns.to_numpy()
+    assert items.tolist() == [5, 8]
+    assert locations.tolist() == [6, 9]
+    assert players.tolist() == [7, 7]
+    assert numpy.count_nonzero(flags & enums.NetworkItemFlag.MINOR) == 1
+
+
+class ColumnarClient(Client):
+    async def on_received_items_columns(self, packet: ReceivedItemsColumns):
+        pass
+
+    async def on_location_info_columns(self, packet: LocationInfoColumns):
+        pass
+
+
+@pytest.mark.parametrize("lazy_decode", [False, True])
+def test_client_decode_columns(test_data, lazy_decode: bool):
+    client = ColumnarClient(0, lazy_decode=lazy_decode)
+    frame: str = json.dumps([element for frame in test_data.values() for element in json.loads(frame)])
+
+    packet_list = client._decode_frame(frame)
+    columnar = [p for p in packet_list if isinstance(p, ReceivedItemsColumns | LocationInfoColumns)]
+    assert [type(p) for p in columnar] == [LocationInfoColumns, ReceivedItemsColumns]
+
+    # lazy decoding skips the unhandled regular packets
+    assert any(isinstance(p, packets.ReceivedItems) for p in packet_list) != lazy_decode
+
+
+@pytest.mark.asyncio
+async def test_client_columns_dispatch(test_data):
+    server_client = ServerClient(lazy_decode=True)
+    columns_event = asyncio.Event()
+    on_packet_calls: list[packets.ServerPacket] = []
+
+    async def on_received_items_columns(packet: ReceivedItemsColumns):
+        expected = packets.SERVER_PACKET_TYPE_ADAPTER.validate_json(test_data["ReceivedItems"])[0]
+        assert packet.index == expected.index
+        assert tuple(packet.items) == expected.items
+        columns_event.set()
+
+    async def on_packet(packet: packets.ServerPacket):
+        on_packet_calls.append(packet)
+
+    server_client.client.on_received_items_columns = on_received_items_columns
+    server_client.client.on_packet = on_packet
+
+    async with server_client:
+        await server_client.server_send(test_data["ReceivedItems"])
+        await asyncio.wait_for(columns_event.wait(), timeout=0.5)
+
+    assert [type(p) for p in on_packet_calls] == [packets.ReceivedItems]
@@ -0,0 +1,183 @@
+from typing import Any
+
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.data_storage import OPERATIONS, DataStorageMirror, apply_operations
+from archipelagopy.enums import Operation
+from archipelagopy.structs import DataStorageOperation
+
+
+def op(operation: Operation, value: Any = None) -> DataStorageOperation:
+    return DataStorageOperation(operation=operation, value=value)
+
+
+@pytest.mark.parametrize("current, operation, expected", [
+    (1, op(Operation.REPLACE, 5), 5),
+    (1, op(Operation.DEFAULT, 5), 1),
+    (1, op(Operation.ADD, 5), 6),
+    ([1], op(Operation.ADD, [2, 1]), [1, 2, 1]),
+    (3, op(Operation.MUL, 5), 15),
+    (3, op(Operation.POW, 2), 9),
+    (7, op(Operation.MOD, 3), 1),
+    (2.5, op(Operation.FLOOR), 2),
+    (2.5, op(Operation.CEIL), 3),
+    (2, op(Operation.MAX, 5), 5),
+    (2, op(Operation.MIN, 5), 2),
+    (0b110, op(Operation.AND, 0b011), 0b010),
+    (0b110, op(Operation.OR, 0b011), 0b111),
+    (0b110, op(Operation.XOR, 0b011), 0b101),
+    (1, op(Operation.LEFT_SHIFT, 3), 8),
+    (8, op(Operation.RIGHT_SHIFT, 3), 1),
+    ([1, 2, 1], op(Operation.REMOVE, 1), [2, 1]),
+    ([1, 2], op(Operation.REMOVE, 3), [1, 2]),
+    ([1, 2, 3], op(Operation.POP, 1), [1, 3]),
+    ([1, 2, 3], op(Operation.POP, 5), [1, 2, 3]),
+    ([1, 2, 3], op(Operation.POP, -4), [1, 2, 3]),
+    ([], op(Operation.POP, 0), []),
+    ({"a": 1, "b": 2}, op(Operation.POP, "a"), {"b": 2}),
+    ({"a": 1}, op(Operation.POP, "c"), {"a": 1}),
+    ([1, 2], op(Operation.UPDATE, [2, 3]), [1, 2, 3]),
+    ({"a": 1}, op(Operation.UPDATE, {"a": 2, "b": 3}), {"a": 2, "b": 3}),
+])
+def test_operation(current: Any, operation: DataStorageOperation, expected: Any):
+    assert apply_operations(current, [operation]) == expected
+
+
+def test_all_operations():
+    assert set(OPERATIONS) == set(Operation)
+
+
+def test_apply_operations_copies():
+    value: dict = {"a": [1]}
+    assert apply_operations(value, [op(Operation.UPDATE, {"b": 2})]) == {"a": [1], "b": 2}
+    assert value == {"a": [1]}
+
+    assert apply_operations(1, [op(Operation.ADD, 2), op(Operation.MUL, 3), op(Operation.MAX, 5)]) == 9
+
+
+class MirrorClient(Client):
+    def __init__(self):
+        super().__init__(0, lazy_decode=True)
+        self.sent: list[packets.ClientPacket] = []
+
+    async def send(self, packet: packets.ClientPacket, lane=None):
+        self.sent.append(packet)
+
+
+def set_reply(key: str, value: Any, slot: int = 1) -> packets.SetReply:
+    return packets.SetReply(key=key, value=value, original_value=None, slot=slot)
+
+
+async def connect(client: Client, slot: int = 1):
+    await client._process_packet(packets.Connected.model_construct(slot=slot, checked_location=None))
+
+
+@pytest.mark.asyncio
+async def test_watch():
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+
+    assert client._is_packet_handled(packets.SetReply)
+
+    await mirror.watch(["a", "b"])
+    await mirror.watch(["a"])
+    assert client.sent == [packets.SetNotify(keys=["a", "b"]), packets.Get(keys=["a", "b"])]
+    assert mirror.watched == {"a", "b"}
+    assert "a" not in mirror
+
+    await client._process_packet(packets.Retrieved(keys={"a": 1, "b": None, "c": 3}))
+    assert mirror["a"] == 1
+    assert mirror.get("b", 0) is None
+    assert "c" not in mirror
+
+    await client._process_packet(set_reply("a", 5, slot=2))
+    assert mirror["a"] == 5
+    assert dict((key, mirror[key]) for key in mirror) == {"a": 5, "b": None}
+
+
+@pytest.mark.asyncio
+async def test_optimistic_set():
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+    await connect(client, slot=1)
+
+    await mirror.watch(["a"])
+    await client._process_packet(packets.Retrieved(keys={"a": 10}))
+
+    assert await mirror.set("a", [op(Operation.ADD, 1)]) == 11
+    assert await mirror.set("a", [op(Operation.MUL, 2)]) == 22
+    assert mirror.is_pending("a")
+    assert mirror.get_confirmed("a") == 10
+    assert client.sent[-1] == packets.Set(key="a", default=0, want_reply=True, operations=[op(Operation.MUL, 2)])
+
+    # another slot changed the key before the own sets were applied
+    await client._process_packet(set_reply("a", 100, slot=2))
+    assert mirror["a"] == 202
+
+    # the server applied the first own set
+    await client._process_packet(set_reply("a", 101))
+    assert mirror["a"] == 202
+    assert mirror.is_pending("a")
+
+    await client._process_packet(set_reply("a", 202))
+    assert mirror["a"] == 202
+    assert not mirror.is_pending("a")
+
+
+@pytest.mark.asyncio
+async def test_set_unknown_key():
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+
+    assert await mirror.set("a", [op(Operation.ADD, 1)], default=5) == 6
+
+    # the key already existed on the server
+    await client._process_packet(set_reply("a", 21))
+    assert mirror["a"] == 21
+
+
+@pytest.mark.asyncio
+async def test_set_invalid_operation():
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+    await mirror.watch(["a"])
+    await client._process_packet(packets.Retrieved(keys={"a": "text"}))
+
+    assert await mirror.set("a", [op(Operation.MUL, 1.5)]) == "text"
+
+
+@pytest.mark.asyncio
+async def test_reconnect():
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+    await connect(client)
+    await mirror.watch(["a", "b"])
+    await client._process_packet(packets.Retrieved(keys={"a": 1, "b": 2}))
+    await mirror.set("a", [op(Operation.ADD, 1)])
+
+    client.sent.clear()
+    await connect(client)
+
+    # subscriptions are renewed and unanswered sets are dropped
+    assert client.sent == [packets.SetNotify(keys=["a", "b"]), packets.Get(keys=["a", "b"])]
+    assert mirror["a"] == 1
+    assert not mirror.is_pending("a")
+
+
+@pytest.mark.asyncio
+async def test_set_reply_parsing():
+    packet = packets.SetReply.model_validate_json(
+        '{"cmd": "SetReply", "key": "k", "value": {"a": [1, 2]}, "original_value": null, "slot": 1}'
+    )
+    assert packet.value == {"a": [1, 2]}
+
+    client = MirrorClient()
+    mirror = DataStorageMirror(client)
+    await client._process_packet(packet)
+    assert mirror["k"] == {"a": [1, 2]}
+
+
+def test_set_serialization():
+    packet = packets.Set(key="k", default=[], want_reply=True, operations=[op(Operation.UPDATE, ["a"])])
+    assert packets.Set.model_validate_json(packet.model_dump_json(by_alias=True)) == packet
@@ -0,0 +1,108 @@
+import asyncio
+import concurrent.futures
+import json
+import pickle
+from types import MappingProxyType
+
+import pytest
+
+from archipelagopy import Client, packets, structs
+from archipelagopy.client import decode_frame
+from archipelagopy.codec import MsgspecCodec, OrjsonCodec, PydanticCodec
+from archipelagopy.columns import ReceivedItemsColumns
+from tests.callbacks import ServerClient, test_data
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted: int = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def full_frame(test_data: MappingProxyType[str, str]) -> str:
+    return json.dumps([element for frame in test_data.values() for element in json.loads(frame)])
+
+
+@pytest.mark.parametrize("codec_type", [PydanticCodec, OrjsonCodec, MsgspecCodec], ids=lambda c: c.__name__)
+def test_pickle_codec(codec_type: type):
+    if codec_type is OrjsonCodec:
+        pytest.importorskip("orjson")
+    elif codec_type is MsgspecCodec:
+        pytest.importorskip("msgspec")
+
+    codec = pickle.loads(pickle.dumps(codec_type()))
+    assert type(codec) is codec_type
+    assert codec.loads("[1]") == [1]
+
+
+@pytest.mark.parametrize("trusted_server", [False, True])
+def test_decode_frame(test_data, trusted_server: bool):
+    frame: str = full_frame(test_data)
+    client = Client(0, trusted_server=trusted_server)
+
+    assert decode_frame(frame, PydanticCodec(), trusted_server) == client._decode_frame(frame)
+
+
+def test_decode_frame_selected(test_data):
+    frame: str = full_frame(test_data)
+    packet_list = decode_frame(frame, PydanticCodec(), decode_cmds=frozenset({"Bounced"}),
+                               columnar_cmds=frozenset({"ReceivedItems"}))
+
+    assert [type(packet) for packet in packet_list] == [packets.Bounced, ReceivedItemsColumns]
+
+
+def test_process_pool(test_data):
+    frame: str = test_data["Connected"]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        packet_list = executor.submit(decode_frame, frame, PydanticCodec(), True).result(timeout=2)
+
+    assert packet_list == decode_frame(frame, PydanticCodec(), True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 1 << 30], ids=["large", "small"])
+async def test_client_offload(test_data, size: int):
+    executor = CountingExecutor()
+    server_client = ServerClient(decode_executor=executor, decode_offload_threshold=size)
+    received: list[packets.ServerPacket] = []
+
+    async def on_packet(packet: packets.ServerPacket):
+        received.append(packet)
+
+    server_client.client.on_packet = on_packet
+
+    with executor:
+        async with server_client:
+            await server_client.server_send(test_data["Connected"])
+            for _ in range(50):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+
+    assert [type(packet) for packet in received] == [packets.Connected]
+    assert executor.submitted == (size == 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lazy_decode", [False, True])
+async def test_client_offload_game_data(test_data, lazy_decode: bool):
+    class GameDataClient(Client):
+        def __init__(self):
+            super().__init__(0, lazy_decode=lazy_decode, decode_executor=CountingExecutor(),
+                             decode_offload_threshold=0)
+            self.games: list[str] = []
+
+        async def on_game_data(self, game: str, data: structs.GameData):
+            self.games.append(game)
+
+    client = GameDataClient()
+    frame: str = test_data["DataPackage"]
+    packet_list = await client._decode_received_frame(frame)
+
+    assert client.games == list(json.loads(frame)[0]["data"]["games"])
+    assert [type(packet) for packet in packet_list] == ([] if lazy_decode else [packets.DataPackage])
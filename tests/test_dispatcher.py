@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.dispatcher import PacketDispatcher, by_packet_type, game_state_only, sequential
+
+RECEIVED_ITEMS = packets.ReceivedItems.model_construct(index=0, items=())
+ROOM_UPDATE = packets.RoomUpdate.model_construct()
+PRINT_JSON = packets.PrintJSON.model_construct(data=())
+
+
+class Recorder:
+    def __init__(self):
+        self.events: list[tuple[str, object]] = []
+        self.release: asyncio.Event = asyncio.Event()
+
+    def handler(self, name: str, wait: bool = False):
+        async def handle(packet):
+            self.events.append(("start", name))
+            if wait:
+                await self.release.wait()
+            await asyncio.sleep(0)
+            self.events.append(("end", name))
+
+        return handle
+
+
+def test_keys():
+    assert by_packet_type(RECEIVED_ITEMS) is packets.ReceivedItems
+    assert game_state_only(RECEIVED_ITEMS) == game_state_only(ROOM_UPDATE)
+    assert game_state_only(PRINT_JSON) is None
+    assert sequential(RECEIVED_ITEMS) == sequential(PRINT_JSON)
+
+
+@pytest.mark.asyncio
+async def test_ordered_per_key():
+    dispatcher = PacketDispatcher()
+    recorder = Recorder()
+
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("print 1", wait=True))
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("print 2"))
+    await dispatcher.dispatch(RECEIVED_ITEMS, recorder.handler("items"))
+    await asyncio.sleep(0.01)
+
+    # the second PrintJSON waits for the first one, ReceivedItems does not
+    assert recorder.events == [("start", "print 1"), ("start", "items"), ("end", "items")]
+    assert dispatcher.pending == 2
+
+    recorder.release.set()
+    await dispatcher.join()
+    assert recorder.events[3:] == [("end", "print 1"), ("start", "print 2"), ("end", "print 2")]
+    assert dispatcher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_game_state_only():
+    dispatcher = PacketDispatcher(key=game_state_only)
+    recorder = Recorder()
+
+    await dispatcher.dispatch(RECEIVED_ITEMS, recorder.handler("items", wait=True))
+    await dispatcher.dispatch(ROOM_UPDATE, recorder.handler("update"))
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("print 1", wait=True))
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("print 2"))
+    await asyncio.sleep(0.01)
+
+    assert ("start", "update") not in recorder.events
+    assert ("end", "print 2") in recorder.events
+
+    recorder.release.set()
+    await dispatcher.join()
+    assert recorder.events.index(("end", "items")) < recorder.events.index(("start", "update"))
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency():
+    dispatcher = PacketDispatcher(max_concurrency=2, key=lambda _: None)
+    recorder = Recorder()
+
+    for i in range(4):
+        await dispatcher.dispatch(PRINT_JSON, recorder.handler(str(i), wait=True))
+    await asyncio.sleep(0.01)
+
+    assert dispatcher.running == 2
+    assert dispatcher.pending == 4
+
+    recorder.release.set()
+    await dispatcher.join()
+    assert dispatcher.running == 0
+
+
+@pytest.mark.asyncio
+async def test_max_pending():
+    dispatcher = PacketDispatcher(max_pending=1)
+    recorder = Recorder()
+
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("1", wait=True))
+    task = asyncio.create_task(dispatcher.dispatch(RECEIVED_ITEMS, recorder.handler("2")))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    recorder.release.set()
+    await task
+    await dispatcher.join()
+    assert ("end", "2") in recorder.events
+
+
+@pytest.mark.asyncio
+async def test_handler_exception():
+    dispatcher = PacketDispatcher()
+    recorder = Recorder()
+
+    async def fail(_):
+        raise RuntimeError("handler failed")
+
+    await dispatcher.dispatch(PRINT_JSON, fail)
+    await dispatcher.dispatch(PRINT_JSON, recorder.handler("after"))
+    await dispatcher.join()
+
+    assert recorder.events == [("start", "after"), ("end", "after")]
+
+
+@pytest.mark.asyncio
+async def test_cancel():
+    dispatcher = PacketDispatcher(key=sequential)
+    recorder = Recorder()
+
+    for i in range(3):
+        await dispatcher.dispatch(PRINT_JSON, recorder.handler(str(i), wait=True))
+    await dispatcher.dispatch(RECEIVED_ITEMS, recorder.handler("3", wait=True))
+    await asyncio.sleep(0.01)
+
+    await dispatcher.cancel()
+    assert dispatcher.pending == 0
+    await asyncio.wait_for(dispatcher.join(), 1)
+    assert recorder.events == [("start", "0")]
+
+
+@pytest.mark.asyncio
+async def test_client():
+    release = asyncio.Event()
+    received: list[packets.ReceivedItems] = []
+
+    class SlowClient(Client):
+        async def on_print_json(self, packet: packets.PrintJSON):
+            await release.wait()
+
+        async def on_received_items(self, packet: packets.ReceivedItems):
+            received.append(packet)
+
+    client = SlowClient(0, dispatcher=PacketDispatcher())
+    await client._process_packet(PRINT_JSON)
+    await client._process_packet(RECEIVED_ITEMS)
+    await asyncio.sleep(0.01)
+
+    # the slow PrintJSON handler blocks neither the receive loop nor other packet types
+    assert received == [RECEIVED_ITEMS]
+    assert client.dispatcher.pending == 1
+
+    release.set()
+    await client.dispatcher.join()
@@ -0,0 +1,151 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.send_queue import LaneConfig, OverflowPolicy, SendLane
+from tests.callbacks import ServerClient
+
+SERVER_DATA: Path = Path(__file__).parent / "parsing" / "server"
+
+
+class CheckClient(Client):
+    def __init__(self, **kwargs):
+        super().__init__(0, **kwargs)
+        self.sent: list[packets.ClientPacket] = []
+
+    async def send(self, packet: packets.ClientPacket):
+        self.sent.append(packet)
+
+
+@pytest.mark.asyncio
+async def test_interval():
+    client = CheckClient(location_check_interval=0.02)
+
+    await client.check_locations([1, 2])
+    await client.check_locations([2, 3])
+    assert client.sent == []
+
+    await asyncio.sleep(0.05)
+    assert client.sent == [packets.LocationChecks(locations=[1, 2, 3])]
+
+    # already sent locations are dropped
+    await client.check_locations([3, 4])
+    await asyncio.sleep(0.05)
+    assert client.sent[1:] == [packets.LocationChecks(locations=[4])]
+
+
+@pytest.mark.asyncio
+async def test_batch_size():
+    client = CheckClient(location_check_interval=10, location_check_batch_size=3)
+
+    await client.check_locations([1, 2])
+    assert client.sent == []
+
+    await client.check_locations([3])
+    assert client.sent == [packets.LocationChecks(locations=[1, 2, 3])]
+
+
+@pytest.mark.asyncio
+async def test_flush():
+    client = CheckClient(location_check_interval=10)
+
+    await client.flush()
+    assert client.sent == []
+
+    await client.check_locations(range(5))
+    await client.flush()
+    assert client.sent == [packets.LocationChecks(locations=[0, 1, 2, 3, 4])]
+
+    await asyncio.sleep(0)
+    await client.flush()
+    assert len(client.sent) == 1
+
+
+def read_frame(name: str) -> str:
+    return f"[{(SERVER_DATA / name).read_text()}]"
+
+
+async def receive(client: Client, frame: str) -> list[packets.ServerPacket]:
+    packet_list = client._decode_frame(frame)
+    for packet in packet_list:
+        await client._process_packet(packet)
+
+    return packet_list
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_kwargs", [{}, {"lazy_decode": True}, {"trusted_server": True}],
+                         ids=["validated", "lazy", "trusted"])
+async def test_checked_by_server(client_kwargs: dict):
+    client = CheckClient(location_check_interval=10, **client_kwargs)
+    await client.check_locations([797200, 797302, 797303])
+
+    # Connected contains 797200, the RoomUpdate 797302
+    await receive(client, read_frame("test_connected/connected_00.json"))
+    await receive(client, read_frame("test_room_update/test_room_update_00.json"))
+    await receive(client, '[{"cmd": "RoomUpdate", "hint_points": 1}]')
+
+    await client.check_locations([797207, 797304])
+    await client.flush()
+    assert client.sent == [packets.LocationChecks(locations=[797303, 797304])]
+
+
+@pytest.mark.asyncio
+async def test_checked_before_check_locations():
+    client = CheckClient(location_check_interval=10)
+    await receive(client, read_frame("test_room_update/test_room_update_00.json"))
+
+    await client.check_locations([797302, 797303])
+    await client.flush()
+    assert client.sent == [packets.LocationChecks(locations=[797303])]
+
+
+@pytest.mark.asyncio
+async def test_checked_by_server_lazy():
+    client = CheckClient(lazy_decode=True)
+
+    # unhandled packets are not validated, their checked locations are read from the JSON
+    assert await receive(client, read_frame("test_room_update/test_room_update_00.json")) == []
+
+    await client.check_locations([797302, 797303])
+    await client.flush()
+    assert client.sent == [packets.LocationChecks(locations=[797303])]
+
+
+@pytest.mark.asyncio
+async def test_send_failure(caplog: pytest.LogCaptureFixture):
+    client = Client(0, location_check_interval=0.01,
+                    send_lanes={SendLane.GAMEPLAY: LaneConfig(1, OverflowPolicy.RAISE)})
+    await client.send(packets.LocationChecks(locations=[1]))
+
+    # the lane is full, the locations are kept instead of being lost
+    await client.check_locations([2, 3])
+    await asyncio.sleep(0.05)
+    assert "Cannot send location checks" in caplog.text
+
+    await client.check_locations([4])
+    with pytest.raises(asyncio.QueueFull):
+        await client.flush()
+
+    client.send_queue.get_nowait()
+    await client.flush()
+    assert json.loads(client.send_queue.get_nowait().data) == {"cmd": "LocationChecks", "locations": [2, 3, 4]}
+
+
+@pytest.mark.asyncio
+async def test_server():
+    server_client = ServerClient(location_check_interval=0.01)
+
+    async def on_ready():
+        await server_client.client.check_locations([1, 2])
+        await server_client.client.check_locations([3])
+
+    server_client.client.on_ready = on_ready
+
+    async with server_client:
+        frame: str = await asyncio.wait_for(server_client.received.get(), timeout=1)
+
+    assert json.loads(frame) == [{"cmd": "LocationChecks", "locations": [1, 2, 3]}]
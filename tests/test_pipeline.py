@@ -0,0 +1,138 @@
+import asyncio
+from types import MappingProxyType
+
+import pytest
+
+from archipelagopy import packets
+from archipelagopy.pipeline import InboundQueue, PipelineConfig, PipelineStage, StageMetrics
+from archipelagopy.send_queue import OverflowPolicy
+from tests.callbacks import ServerClient, test_data
+
+
+def is_odd(item: int) -> bool:
+    return item % 2 == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_droppable_first():
+    metrics = StageMetrics()
+    queue: InboundQueue[int] = InboundQueue(3, OverflowPolicy.RAISE, droppable=is_odd, metrics=metrics)
+    for item in (0, 1, 2, 3):
+        queue.put_nowait(item)
+
+    queue.put_nowait(4)
+    assert [await queue.get() for _ in range(3)] == [0, 2, 4]
+    assert metrics.dropped == 2
+    assert metrics.max_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies():
+    queue: InboundQueue[int] = InboundQueue(1, OverflowPolicy.RAISE)
+    await queue.put(0)
+    with pytest.raises(asyncio.QueueFull):
+        await queue.put(1)
+
+    queue = InboundQueue(1, OverflowPolicy.DROP_OLDEST)
+    await queue.put(0)
+    await queue.put(1)
+    assert await queue.get() == 1
+
+    queue = InboundQueue(1, OverflowPolicy.BLOCK)
+    await queue.put(0)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(1)
+
+    task = asyncio.create_task(queue.put(1))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    assert await queue.get() == 0
+    await task
+    assert await queue.get() == 1
+
+
+@pytest.mark.asyncio
+async def test_close():
+    queue: InboundQueue[int] = InboundQueue()
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+
+    queue.put_nowait(1)
+    queue.close()
+    assert await getter == 1
+    assert await queue.get() is None
+    assert queue.closed
+
+
+@pytest.mark.asyncio
+async def test_client_pipeline(test_data: MappingProxyType[str, str]):
+    server_client = ServerClient(pipeline=PipelineConfig(frame_queue_size=2, packet_queue_size=2))
+    release = asyncio.Event()
+    received: list[type] = []
+
+    async def on_packet(packet: packets.ServerPacket):
+        if not received:
+            await release.wait()
+        received.append(type(packet))
+
+    server_client.client.on_packet = on_packet
+
+    names: list[str] = ["Bounced", "Retrieved", "SetReply", "RoomUpdate", "ReceivedItems"]
+    async with server_client:
+        for name in names:
+            await server_client.server_send(test_data[name])
+
+        # frames are read while the first callback is still running
+        metrics: MappingProxyType[PipelineStage, StageMetrics] = server_client.client.pipeline_metrics
+        for _ in range(50):
+            if metrics[PipelineStage.READ].processed == len(names):
+                break
+            await asyncio.sleep(0.01)
+
+        assert metrics[PipelineStage.READ].processed == len(names)
+        assert metrics[PipelineStage.DISPATCH].processed == 0
+
+        release.set()
+        for _ in range(50):
+            if len(received) == len(names):
+                break
+            await asyncio.sleep(0.01)
+
+    assert [packet_type.__name__ for packet_type in received] == names
+    assert metrics[PipelineStage.PARSE].processed == len(names)
+    assert metrics[PipelineStage.DISPATCH].processed == len(names)
+    assert metrics[PipelineStage.DISPATCH].max_depth == 2
+
+
+@pytest.mark.asyncio
+async def test_client_pipeline_drops_print_json(test_data: MappingProxyType[str, str]):
+    server_client = ServerClient(pipeline=PipelineConfig(frame_queue_size=0, packet_queue_size=1))
+    release = asyncio.Event()
+    received: list[str] = []
+
+    async def on_packet(packet: packets.ServerPacket):
+        if not received:
+            await release.wait()
+        received.append(packet.__class__.__name__)
+
+    server_client.client.on_packet = on_packet
+
+    async with server_client:
+        for name in ("Bounced", "PrintJSON", "Retrieved"):
+            await server_client.server_send(test_data[name])
+
+        metrics: StageMetrics = server_client.client.pipeline_metrics[PipelineStage.DISPATCH]
+        for _ in range(50):
+            if metrics.dropped:
+                break
+            await asyncio.sleep(0.01)
+
+        release.set()
+        for _ in range(50):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+    assert received == ["Bounced", "Retrieved"]
+    assert metrics.dropped == 1
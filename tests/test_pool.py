@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client
+from archipelagopy.codec import PydanticCodec
+from archipelagopy.data_package.store import DataPackageStore
+from archipelagopy.pool import ClientPool, HandshakeLimiter
+
+
+@pytest.mark.asyncio
+async def test_handshake_limiter_concurrency():
+    limiter = HandshakeLimiter(max_concurrent=2)
+    release = asyncio.Event()
+    max_active: int = 0
+
+    async def handshake():
+        nonlocal max_active
+        async with limiter:
+            max_active = max(max_active, limiter.active)
+            await release.wait()
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(handshake()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    assert limiter.active == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max_active == 2
+    assert limiter.completed == 5
+
+
+@pytest.mark.asyncio
+async def test_handshake_limiter_stagger():
+    limiter = HandshakeLimiter(stagger=0.02)
+    starts: list[float] = []
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+    async def handshake(fail: bool):
+        async with limiter:
+            starts.append(loop.time())
+            if fail:
+                raise OSError
+
+    results = await asyncio.gather(*(handshake(i == 0) for i in range(3)), return_exceptions=True)
+
+    assert isinstance(results[0], OSError)
+    assert all(b - a >= 0.019 for a, b in zip(starts, starts[1:]))
+    assert (limiter.completed, limiter.failed) == (2, 1)
+
+
+def test_shared_resources():
+    pool = ClientPool(codec=PydanticCodec())
+    first: Client = pool.create(Client, 1)
+    second: Client = pool.create(Client, 2, secure=False)
+
+    assert first.codec is second.codec is pool.codec
+    # clients only fetch data packages if a store is shared
+    assert first.data_package_store is second.data_package_store is pool.data_package_store is None
+    assert list(pool) == [first, second]
+    assert first in pool
+
+    store = DataPackageStore()
+    third: Client = ClientPool(data_package_store=store).create(Client, 3)
+    assert third.data_package_store is store
+
+
+@pytest.mark.asyncio
+async def test_pool():
+    connections: int = 0
+    all_connected = asyncio.Event()
+
+    async def server_task_handler(ws: ServerConnection):
+        nonlocal connections
+        connections += 1
+        if connections == 20:
+            all_connected.set()
+
+        await ws.send('[{"cmd":"Bounced","slots":[1]}]')
+        await ws.wait_closed()
+
+    async with serve(server_task_handler, "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+
+        pool = ClientPool(max_handshakes=4)
+        for _ in range(20):
+            pool.create(Client, port, host="localhost", secure=False)
+
+        async with pool:
+            await asyncio.wait_for(all_connected.wait(), 2)
+            for _ in range(50):
+                if pool.stats().frames_received == 20:
+                    break
+                await asyncio.sleep(0.01)
+
+            stats = pool.stats()
+            assert stats.clients == stats.connected == stats.handshakes_completed == 20
+            assert stats.frames_received == 20
+            assert stats.received_per_second > 0
+
+            client: Client = next(iter(pool))
+            await pool.remove(client)
+            assert client not in pool
+            assert not client.is_connected
+
+        assert pool.stats().connected == 0
@@ -0,0 +1,211 @@
+import asyncio
+import json
+
+import pytest
+
+from archipelagopy import Client, enums, packets, structs
+from archipelagopy.client import InvalidPacketError
+from archipelagopy.send_queue import LaneConfig, OverflowPolicy, SendLane
+from tests.callbacks import ServerClient
+
+ITEM = structs.NetworkItem(item=1, location=2, player=1, flags=enums.NetworkItemFlag.MINOR)
+
+
+async def transmit(client: Client) -> list[dict]:
+    return json.loads(await client._next_frame())
+
+
+def retrieved(**keys) -> packets.Retrieved:
+    return packets.Retrieved(keys=keys)
+
+
+@pytest.mark.asyncio
+async def test_get():
+    client = Client(0)
+    task = asyncio.create_task(client.get(["a"]))
+    await asyncio.sleep(0)
+
+    assert await transmit(client) == [{"cmd": "Get", "keys": ["a"]}]
+    await client._process_packet(retrieved(a=1))
+
+    assert await task == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_pipelining():
+    client = Client(0)
+    tasks: list[asyncio.Task] = [asyncio.create_task(client.get([str(i)])) for i in range(3)]
+    scout_task = asyncio.create_task(client.scout([2]))
+    data_package_task = asyncio.create_task(client.fetch_data_package(["Game"]))
+    await asyncio.sleep(0)
+
+    assert [p["cmd"] for p in await transmit(client)] == ["GetDataPackage", "Get", "Get", "Get", "LocationScouts"]
+
+    game_data = structs.GameData(checksum="a", item_name_to_id={}, location_name_to_id={})
+    await client._process_packet(packets.LocationInfo(locations=(ITEM,)))
+    for i in range(3):
+        await client._process_packet(retrieved(**{str(i): i}))
+    await client._process_packet(packets.DataPackage(data={"games": {"Game": game_data}}))
+
+    assert [await task for task in tasks] == [{"0": 0}, {"1": 1}, {"2": 2}]
+    assert await scout_task == (ITEM,)
+    assert await data_package_task == {"Game": game_data}
+
+
+@pytest.mark.asyncio
+async def test_unawaited_requests():
+    client = Client(0)
+    await client.send(packets.Get(keys=["manual"]))
+    task = asyncio.create_task(client.get(["helper"]))
+    await asyncio.sleep(0)
+    await transmit(client)
+
+    # the answer to the manually sent request does not resolve the helper
+    await client._process_packet(retrieved(manual=1))
+    assert not task.done()
+
+    await client._process_packet(retrieved(helper=2))
+    assert await task == {"helper": 2}
+
+
+@pytest.mark.asyncio
+async def test_registered_when_sent():
+    client = Client(0)
+    task = asyncio.create_task(client.get(["a"]))
+    await asyncio.sleep(0)
+
+    # an answer to a request which has not been sent yet is not matched
+    await client._process_packet(retrieved(other=1))
+    await transmit(client)
+    await client._process_packet(retrieved(a=1))
+
+    assert await task == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    client = Client(0)
+
+    async def get_with_timeout() -> dict:
+        async with asyncio.timeout(0.01):
+            return await client.get(["a"])
+
+    task = asyncio.create_task(get_with_timeout())
+    await asyncio.sleep(0)
+    second_task = asyncio.create_task(client.get(["b"]))
+    await asyncio.sleep(0)
+    await transmit(client)
+
+    with pytest.raises(TimeoutError):
+        await task
+
+    # the answer of the timed out request is discarded
+    await client._process_packet(retrieved(a=1))
+    await client._process_packet(retrieved(b=2))
+    assert await second_task == {"b": 2}
+
+
+@pytest.mark.asyncio
+async def test_dropped():
+    client = Client(0, send_lanes={SendLane.GAMEPLAY: LaneConfig(1, OverflowPolicy.DROP_OLDEST)})
+    task = asyncio.create_task(client.get(["a"]))
+    await asyncio.sleep(0)
+    second_task = asyncio.create_task(client.get(["b"]))
+    await asyncio.sleep(0)
+
+    # the first request was evicted by the second one, instead of waiting for an answer forever
+    with pytest.raises(asyncio.QueueFull):
+        await asyncio.wait_for(task, 1)
+
+    assert await transmit(client) == [{"cmd": "Get", "keys": ["b"]}]
+    await client._process_packet(retrieved(b=2))
+    assert await second_task == {"b": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled():
+    client = Client(0)
+    task = asyncio.create_task(client.scout([1]))
+    await asyncio.sleep(0)
+    second_task = asyncio.create_task(client.scout([2]))
+    await asyncio.sleep(0)
+    await transmit(client)
+
+    task.cancel()
+    await client._process_packet(packets.LocationInfo(locations=()))
+    await client._process_packet(packets.LocationInfo(locations=(ITEM,)))
+
+    assert await second_task == (ITEM,)
+
+
+@pytest.mark.asyncio
+async def test_invalid_packet():
+    client = Client(0)
+    task = asyncio.create_task(client.scout([1]))
+    await asyncio.sleep(0)
+    await transmit(client)
+
+    invalid_packet = packets.InvalidPacket(
+        type=enums.PacketProblemType.ARGUMENTS, text="Invalid location", original_cmd="LocationScouts"
+    )
+    await client._process_packet(invalid_packet)
+
+    with pytest.raises(InvalidPacketError) as exc_info:
+        await task
+    assert exc_info.value.packet == invalid_packet
+
+
+@pytest.mark.asyncio
+async def test_lazy_decoding():
+    client = Client(0, lazy_decode=True)
+    assert not client._is_packet_handled(packets.Retrieved)
+    assert not client._is_packet_handled(packets.InvalidPacket)
+
+    task = asyncio.create_task(client.get(["a"]))
+    await asyncio.sleep(0)
+    await transmit(client)
+
+    assert client._is_packet_handled(packets.Retrieved)
+    assert client._is_packet_handled(packets.InvalidPacket)
+    assert not client._is_packet_handled(packets.LocationInfo)
+
+    for packet in client._decode_frame('[{"cmd": "Retrieved", "keys": {"a": 1}}]'):
+        await client._process_packet(packet)
+
+    assert await task == {"a": 1}
+    assert not client._is_packet_handled(packets.Retrieved)
+
+
+@pytest.mark.asyncio
+async def test_server():
+    server_client = ServerClient()
+    result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def on_ready():
+        result.set_result(asyncio.create_task(asyncio.wait_for(server_client.client.get(["a"]), 1)))
+
+    server_client.client.on_ready = on_ready
+
+    async with server_client:
+        frame: str = await asyncio.wait_for(server_client.received.get(), timeout=1)
+        assert json.loads(frame) == [{"cmd": "Get", "keys": ["a"]}]
+
+        await server_client.server_send('[{"cmd": "Retrieved", "keys": {"a": 1}}]')
+        assert await (await result) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_connection_closed():
+    server_client = ServerClient()
+    result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def on_ready():
+        result.set_result(asyncio.create_task(server_client.client.get(["a"])))
+
+    server_client.client.on_ready = on_ready
+
+    async with server_client:
+        await asyncio.wait_for(server_client.received.get(), timeout=1)
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(await result, timeout=1)
@@ -0,0 +1,160 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from archipelagopy import Client, enums, packets, scout_cache, structs
+from archipelagopy.scout_cache import ScoutCache
+
+SEED = "12345678901234567890"
+
+
+def item(location: int, item_id: int = 1, player: int = 2) -> structs.NetworkItem:
+    return structs.NetworkItem(item=item_id, location=location, player=player, flags=enums.NetworkItemFlag.MINOR)
+
+
+def test_get_and_put():
+    cache = ScoutCache()
+    cache.put(SEED, 0, 1, [item(1), item(2)])
+
+    assert cache.get(SEED, 0, 1, 1) == item(1)
+    assert cache.get(SEED, 0, 2, 1) is None
+    assert cache.get("other", 0, 1, 1) is None
+    assert cache.get_many(SEED, 0, 1, [2, 3, 1]) == {2: item(2), 1: item(1)}
+    assert len(cache) == 2
+
+
+def test_persistence(tmp_path: Path):
+    cache = ScoutCache(tmp_path)
+    cache.put(SEED, 0, 1, [item(1)])
+    cache.put(SEED, 0, 1, [item(1), item(2, 3, 4)])
+
+    loaded = ScoutCache(tmp_path)
+    assert loaded.get_many(SEED, 0, 1, [1, 2]) == {1: item(1), 2: item(2, 3, 4)}
+    assert loaded.get_many(SEED, 1, 1, [1, 2]) == {}
+
+    # already cached items are not written again
+    assert (tmp_path / f"{SEED}_0_1{ScoutCache.SUFFIX}").stat().st_size == 8 + 2 * 32
+
+
+def test_concurrent_puts(tmp_path: Path):
+    cache = ScoutCache(tmp_path)
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        for location in range(200):
+            executor.submit(cache.put, SEED, 0, 1, [item(location)])
+
+    # the header is only written once and no record is lost
+    assert (tmp_path / f"{SEED}_0_1{ScoutCache.SUFFIX}").stat().st_size == 8 + 200 * 32
+    assert len(ScoutCache(tmp_path).get_many(SEED, 0, 1, range(200))) == 200
+
+
+def test_read_during_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = ScoutCache(tmp_path)
+    cache.put(SEED, 0, 1, [item(1)])
+
+    writing = threading.Event()
+    release = threading.Event()
+    to_bytes = scout_cache._to_bytes
+
+    def blocking_to_bytes(records):
+        writing.set()
+        release.wait(2)
+        return to_bytes(records)
+
+    monkeypatch.setattr(scout_cache, "_to_bytes", blocking_to_bytes)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(cache.put, SEED, 0, 1, [item(2)])
+        assert writing.wait(2)
+
+        # readers do not wait for the file to be written
+        assert cache.get_many(SEED, 0, 1, [1, 2]) == {1: item(1), 2: item(2)}
+        release.set()
+        future.result()
+
+
+def test_partial_record(tmp_path: Path):
+    ScoutCache(tmp_path).put(SEED, 0, 1, [item(1), item(2)])
+
+    file = tmp_path / f"{SEED}_0_1{ScoutCache.SUFFIX}"
+    file.write_bytes(file.read_bytes()[:-1])
+
+    assert ScoutCache(tmp_path).get_many(SEED, 0, 1, [1, 2]) == {1: item(1)}
+
+
+def test_invalid_file(tmp_path: Path):
+    (tmp_path / f"{SEED}_0_1{ScoutCache.SUFFIX}").write_bytes(b"invalid")
+    assert ScoutCache(tmp_path).get(SEED, 0, 1, 1) is None
+
+
+def test_unsafe_seed_name(tmp_path: Path):
+    cache = ScoutCache(tmp_path)
+    cache.put("../seed", 0, 1, [item(1)])
+
+    assert cache.get("../seed", 0, 1, 1) == item(1)
+    assert not any(tmp_path.iterdir())
+
+
+async def connect(client: Client):
+    await client._process_packet(packets.RoomInfo.model_construct(seed_name=SEED))
+    await client._process_packet(packets.Connected.model_construct(team=0, slot=1))
+
+
+async def scout(client: Client, locations: list[int], response: tuple[structs.NetworkItem, ...] | None,
+                create_as_hint: int = 0) -> tuple[tuple[structs.NetworkItem, ...], list[dict]]:
+    task = asyncio.create_task(client.scout(locations, create_as_hint=create_as_hint))
+    await asyncio.sleep(0)
+
+    sent: list[dict] = []
+    if response is not None:
+        sent = json.loads(await client._next_frame())
+        await client._process_packet(packets.LocationInfo(locations=response))
+
+    return await task, sent
+
+
+@pytest.mark.asyncio
+async def test_scout_missing_locations():
+    cache = ScoutCache()
+    cache.put(SEED, 0, 1, [item(2)])
+    client = Client(0, scout_cache=cache)
+    await connect(client)
+
+    items, sent = await scout(client, [1, 2, 3], (item(1), item(3)))
+    assert sent == [{"cmd": "LocationScouts", "locations": [1, 3], "create_as_hint": 0}]
+    assert items == (item(1), item(2), item(3))
+
+    # everything is cached now
+    items, _ = await scout(client, [3, 1], None)
+    assert items == (item(3), item(1))
+
+
+@pytest.mark.asyncio
+async def test_scout_hint():
+    client = Client(0, scout_cache=ScoutCache())
+    await connect(client)
+    client.scout_cache.put(SEED, 0, 1, [item(1)])
+
+    items, sent = await scout(client, [1, 2], (item(1), item(2)), create_as_hint=2)
+    assert sent == [{"cmd": "LocationScouts", "locations": [1, 2], "create_as_hint": 2}]
+    assert items == (item(1), item(2))
+    assert client.scout_cache.get(SEED, 0, 1, 2) == item(2)
+
+
+@pytest.mark.asyncio
+async def test_scout_before_connected():
+    client = Client(0, scout_cache=ScoutCache())
+    await client._process_packet(packets.RoomInfo.model_construct(seed_name=SEED))
+
+    _, sent = await scout(client, [1], (item(1),))
+    assert sent[0]["locations"] == [1]
+    assert len(client.scout_cache) == 0
+
+    # a new room forgets the slot of the previous connection
+    await connect(client)
+    client.scout_cache.put(SEED, 0, 1, [item(1)])
+    await client._process_packet(packets.RoomInfo.model_construct(seed_name="other"))
+    _, sent = await scout(client, [1], (item(1),))
+    assert sent[0]["locations"] == [1]
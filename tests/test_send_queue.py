@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.send_queue import LaneConfig, OverflowPolicy, SendLane, SendQueue, get_packet_lane
+
+
+def test_priority():
+    queue: SendQueue[str] = SendQueue()
+    queue.put_nowait("bulk", SendLane.BULK)
+    queue.put_nowait("chat", SendLane.CHAT)
+    queue.put_nowait("gameplay 1", SendLane.GAMEPLAY)
+    queue.put_nowait("control", SendLane.CONTROL)
+    queue.put_nowait("gameplay 2", SendLane.GAMEPLAY)
+
+    assert queue.qsize() == 5
+    assert queue.depths() == {SendLane.CONTROL: 1, SendLane.GAMEPLAY: 2, SendLane.CHAT: 1, SendLane.BULK: 1}
+    assert [queue.get_nowait() for _ in range(5)] == ["control", "gameplay 1", "gameplay 2", "chat", "bulk"]
+
+    assert queue.empty()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_drop_oldest():
+    queue: SendQueue[int] = SendQueue({SendLane.CHAT: LaneConfig(2, OverflowPolicy.DROP_OLDEST)})
+    for i in range(5):
+        queue.put_nowait(i, SendLane.CHAT)
+
+    assert queue.depth(SendLane.CHAT) == 2
+    assert queue.dropped(SendLane.CHAT) == 3
+    assert [queue.get_nowait(), queue.get_nowait()] == [3, 4]
+
+
+def test_on_drop():
+    dropped: list[int] = []
+    queue: SendQueue[int] = SendQueue({SendLane.CHAT: LaneConfig(1, OverflowPolicy.DROP_OLDEST)}, dropped.append)
+    for i in range(3):
+        queue.put_nowait(i, SendLane.CHAT)
+
+    assert dropped == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_raise():
+    queue: SendQueue[int] = SendQueue({SendLane.BULK: LaneConfig(1, OverflowPolicy.RAISE)})
+    await queue.put(1, SendLane.BULK)
+
+    assert queue.full(SendLane.BULK)
+    with pytest.raises(asyncio.QueueFull):
+        await queue.put(2, SendLane.BULK)
+
+    # other lanes are not affected
+    await queue.put(3, SendLane.CHAT)
+
+
+@pytest.mark.asyncio
+async def test_block():
+    queue: SendQueue[int] = SendQueue({SendLane.GAMEPLAY: LaneConfig(1, OverflowPolicy.BLOCK)})
+    await queue.put(1, SendLane.GAMEPLAY)
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(2, SendLane.GAMEPLAY)
+
+    task = asyncio.create_task(queue.put(2, SendLane.GAMEPLAY))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(task, timeout=1)
+    assert queue.get_nowait() == 2
+
+
+@pytest.mark.asyncio
+async def test_block_cancelled():
+    queue: SendQueue[int] = SendQueue({SendLane.GAMEPLAY: LaneConfig(1, OverflowPolicy.BLOCK)})
+    await queue.put(1, SendLane.GAMEPLAY)
+
+    cancelled = asyncio.create_task(queue.put(2, SendLane.GAMEPLAY))
+    waiting = asyncio.create_task(queue.put(3, SendLane.GAMEPLAY))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(waiting, timeout=1)
+    assert queue.get_nowait() == 3
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_unbounded():
+    queue: SendQueue[int] = SendQueue({SendLane.BULK: LaneConfig(0, OverflowPolicy.RAISE)})
+    for i in range(5000):
+        await queue.put(i, SendLane.BULK)
+
+    assert queue.depth(SendLane.BULK) == 5000
+
+
+@pytest.mark.asyncio
+async def test_get_waits():
+    queue: SendQueue[int] = SendQueue()
+    task = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    queue.put_nowait(1, SendLane.BULK)
+    assert await asyncio.wait_for(task, timeout=1) == 1
+
+
+def test_packet_lanes():
+    assert get_packet_lane(packets.Sync()) == SendLane.CONTROL
+    assert get_packet_lane(packets.LocationChecks(locations=[1])) == SendLane.GAMEPLAY
+    assert get_packet_lane(packets.Say(text="Hello")) == SendLane.CHAT
+    assert get_packet_lane(packets.Bounce.model_construct()) == SendLane.BULK
+
+
+@pytest.mark.asyncio
+async def test_client_priority():
+    client = Client(0)
+    await client.send(packets.Say(text="Hello"))
+    await client.send(packets.LocationChecks(locations=[1]))
+    await client.send(packets.Say(text="World"), lane=SendLane.CONTROL)
+
+    assert client.send_queue.qsize() == 3
+    assert [p["cmd"] for p in json.loads(await client._next_frame())] == ["Say", "LocationChecks", "Say"]
+    assert client.send_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_client_overflow():
+    client = Client(0, send_lanes={SendLane.CHAT: LaneConfig(1, OverflowPolicy.RAISE)})
+    await client.send(packets.Say(text="Hello"))
+
+    with pytest.raises(asyncio.QueueFull):
+        await client.send(packets.Say(text="World"))
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+
+import pytest
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client, packets
+from archipelagopy import sharding
+from archipelagopy.sharding import ClientSpec, ShardEvent, ShardSupervisor
+
+fork_only = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="workers are forked to start quickly"
+)
+
+
+def get_slots(packet: packets.Bounced) -> tuple[int, ...]:
+    return packet.slots
+
+
+class FailingClient(Client):
+    async def send(self, packet: packets.ClientPacket, lane=None):
+        if isinstance(packet, packets.Say) and packet.text == "fail":
+            raise RuntimeError("failed")
+
+        await super().send(packet, lane)
+
+
+class StuckClient(Client):
+    async def stop(self):
+        await asyncio.Event().wait()
+
+
+def bounce_handler(received: asyncio.Queue[dict]):
+    async def server_task_handler(ws: ServerConnection):
+        await ws.send(json.dumps([{"cmd": "Bounced", "slots": [1]}]))
+
+        async for frame in ws:
+            for packet in json.loads(frame):
+                received.put_nowait(packet)
+
+    return server_task_handler
+
+
+async def next_event(supervisor: ShardSupervisor) -> ShardEvent:
+    return await asyncio.wait_for(anext(supervisor.events()), 2)
+
+
+def test_assignment():
+    specs: list[ClientSpec] = [ClientSpec(key=i, factory=Client, args=(i,)) for i in range(5)]
+    supervisor = ShardSupervisor(specs, workers=2)
+
+    assert [supervisor.get_shard(i) for i in range(5)] == [0, 1, 0, 1, 0]
+
+    with pytest.raises(ValueError):
+        ShardSupervisor([*specs, specs[0]], workers=2)
+
+
+def test_spec_picklable():
+    spec = ClientSpec("first", Client, (1,), {"secure": False}, (packets.Bounced,), get_slots)
+    assert pickle.loads(pickle.dumps(spec)) == spec
+
+    # specs are sent to spawned workers, so the factory and the forward function have to be importable
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(spec._replace(forward=lambda packet: packet.slots))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("platform", [sys.platform, "win32"])
+async def test_recv(monkeypatch: pytest.MonkeyPatch, platform: str):
+    monkeypatch.setattr(sharding.sys, "platform", platform)
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+
+    task: asyncio.Task = asyncio.create_task(sharding._recv(receiver))
+    await asyncio.sleep(0.01)
+    sender.send(("stop",))
+    assert await asyncio.wait_for(task, 1) == ("stop",)
+
+    # a pending receive can be cancelled
+    task = asyncio.create_task(sharding._recv(receiver))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    sender.close()
+    with pytest.raises(EOFError):
+        await asyncio.wait_for(sharding._recv(receiver), 1)
+
+
+@fork_only
+@pytest.mark.asyncio
+@pytest.mark.timeout(10)
+async def test_failed_command():
+    received: asyncio.Queue[dict] = asyncio.Queue()
+
+    async with serve(bounce_handler(received), "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        spec = ClientSpec("first", FailingClient, (port,), {"host": "localhost", "secure": False}, (packets.Bounced,))
+
+        supervisor = ShardSupervisor([spec], workers=1, mp_context=multiprocessing.get_context("fork"))
+        async with supervisor:
+            await next_event(supervisor)
+            pid: int = supervisor.get_pid(0)
+
+            # the failed send is logged, the worker keeps running its clients
+            await supervisor.send("first", packets.Say(text="fail"))
+            await supervisor.send("first", packets.Say(text="hello"))
+            assert await asyncio.wait_for(received.get(), 2) == {"cmd": "Say", "text": "hello"}
+            assert supervisor.get_pid(0) == pid and supervisor.restarts(0) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_spawn():
+    received: asyncio.Queue[dict] = asyncio.Queue()
+
+    async with serve(bounce_handler(received), "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        spec = ClientSpec("first", Client, (port,), {"host": "localhost", "secure": False}, (packets.Bounced,), get_slots)
+
+        async with ShardSupervisor([spec], workers=1, mp_context=multiprocessing.get_context("spawn")) as supervisor:
+            event: ShardEvent = await asyncio.wait_for(anext(supervisor.events()), 20)
+            assert event == ShardEvent("first", (1,))
+
+            await supervisor.send("first", packets.Say(text="hello"))
+            assert await asyncio.wait_for(received.get(), 2) == {"cmd": "Say", "text": "hello"}
+
+
+@fork_only
+@pytest.mark.asyncio
+@pytest.mark.timeout(10)
+async def test_stop_timeout():
+    async with serve(bounce_handler(asyncio.Queue()), "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        spec = ClientSpec("stuck", StuckClient, (port,), {"host": "localhost", "secure": False}, (packets.Bounced,))
+
+        supervisor = ShardSupervisor([spec], workers=1, mp_context=multiprocessing.get_context("fork"))
+        supervisor.STOP_TIMEOUT = 0.2
+        async with supervisor:
+            await next_event(supervisor)
+
+        # the worker does not stop its client and is terminated
+        with pytest.raises(ProcessLookupError):
+            os.kill(supervisor.get_pid(0), 0)
+
+        with pytest.raises(ConnectionError):
+            await supervisor.send("stuck", packets.Say(text="hello"))
+
+
+@fork_only
+@pytest.mark.asyncio
+@pytest.mark.timeout(10)
+async def test_supervisor():
+    received: asyncio.Queue[dict] = asyncio.Queue()
+
+    async with serve(bounce_handler(received), "localhost", 0) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        client_kwargs: dict = {"host": "localhost", "secure": False}
+        specs: list[ClientSpec] = [
+            ClientSpec("first", Client, (port,), client_kwargs, (packets.Bounced,), get_slots),
+            ClientSpec("second", Client, (port,), client_kwargs, (packets.Bounced,)),
+        ]
+
+        supervisor = ShardSupervisor(specs, workers=2, restart_delay=0, mp_context=multiprocessing.get_context("fork"))
+        async with supervisor:
+            events: list[ShardEvent] = [await next_event(supervisor), await next_event(supervisor)]
+            payloads: dict = {event.key: event.payload for event in events}
+
+            # the first client forwards selected fields only
+            assert payloads["first"] == (1,)
+            assert isinstance(payloads["second"], packets.Bounced)
+
+            await supervisor.send("second", packets.Say(text="hello"))
+            assert await asyncio.wait_for(received.get(), 2) == {"cmd": "Say", "text": "hello"}
+
+            # a crashed worker is restarted and its client reconnects
+            pid: int = supervisor.get_pid(0)
+            os.kill(pid, signal.SIGKILL)
+
+            event: ShardEvent = await next_event(supervisor)
+            assert event.key == "first"
+            assert supervisor.restarts(0) == 1
+            assert supervisor.get_pid(0) != pid
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from archipelagopy import Client, packets
+from archipelagopy.columns import ReceivedItemsColumns
+from archipelagopy.send_queue import OverflowPolicy
+from archipelagopy.stream import PacketStream
+from tests.callbacks import ServerClient, test_data
+
+
+def bounced(slot: int) -> packets.Bounced:
+    return packets.Bounced.model_construct(slots=(slot,))
+
+
+@pytest.mark.asyncio
+async def test_iterate():
+    client = Client(0)
+    stream = client.stream(packets.Bounced)
+
+    for slot in range(3):
+        await client._process_packet(bounced(slot))
+    await client._process_packet(packets.PrintJSON.model_construct(data=()))
+    stream.close()
+
+    assert [packet.slots async for packet in stream] == [(0,), (1,), (2,)]
+    assert not client._is_packet_handled(packets.Bounced)
+
+
+@pytest.mark.asyncio
+async def test_multiple_subscribers():
+    client = Client(0)
+    first = client.stream(packets.Bounced)
+    second = client.stream(packets.Bounced, maxsize=1, overflow=OverflowPolicy.DROP_OLDEST)
+
+    for slot in range(3):
+        await client._process_packet(bounced(slot))
+
+    assert await first.get_batch(2) == [bounced(0), bounced(1)]
+    assert await first.get_batch() == [bounced(2)]
+    assert await second.get_batch() == [bounced(2)]
+    assert second.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_block():
+    client = Client(0)
+    stream = client.stream(packets.Bounced, maxsize=1)
+
+    await client._process_packet(bounced(0))
+    task = asyncio.create_task(client._process_packet(bounced(1)))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    assert await stream.get() == bounced(0)
+    await task
+    assert await stream.get() == bounced(1)
+
+
+@pytest.mark.asyncio
+async def test_block_closed():
+    client = Client(0)
+    stream = client.stream(packets.Bounced, maxsize=1)
+
+    await client._process_packet(bounced(0))
+    task = asyncio.create_task(client._process_packet(bounced(1)))
+    await asyncio.sleep(0)
+
+    # closing the stream releases the client
+    stream.close()
+    await asyncio.wait_for(task, 1)
+    assert await stream.get_batch() == [bounced(0)]
+
+
+@pytest.mark.asyncio
+async def test_raise():
+    client = Client(0)
+    stream = client.stream(packets.Bounced, maxsize=1, overflow=OverflowPolicy.RAISE)
+
+    await client._process_packet(bounced(0))
+    await client._process_packet(bounced(1))
+    assert stream.closed
+
+    assert await stream.get() == bounced(0)
+    with pytest.raises(asyncio.QueueFull):
+        await stream.get()
+
+
+def test_invalid_type():
+    with pytest.raises(ValueError):
+        Client(0).stream(packets.Say)
+
+
+@pytest.mark.asyncio
+async def test_client_stream(test_data):
+    server_client = ServerClient(lazy_decode=True)
+    stream: PacketStream = server_client.client.stream(ReceivedItemsColumns)
+
+    async with server_client:
+        await server_client.server_send(test_data["ReceivedItems"])
+        packet = await asyncio.wait_for(stream.get(), 1)
+
+    assert isinstance(packet, ReceivedItemsColumns)
+    assert len(packet.items)
+
+    # streams end when the client stops
+    assert await asyncio.wait_for(stream.get(), 1) is None
@@ -0,0 +1,75 @@
+import asyncio
+import pathlib
+import shutil
+import ssl
+import subprocess
+
+import pytest
+from websockets import ServerConnection, serve
+
+from archipelagopy import Client
+from archipelagopy.pool import ClientPool
+from archipelagopy.tls import (
+    SessionCachingSSLContext,
+    create_session_caching_context,
+    get_default_ssl_context,
+)
+
+
+@pytest.fixture
+def certificate(tmp_path: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required to create a certificate")
+
+    cert: pathlib.Path = tmp_path / "cert.pem"
+    key: pathlib.Path = tmp_path / "key.pem"
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+        "-keyout", str(key), "-out", str(cert), "-days", "1", "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost",
+    ], check=True, capture_output=True)
+
+    return cert, key
+
+
+def test_default_context():
+    context: ssl.SSLContext = get_default_ssl_context()
+
+    assert isinstance(context, SessionCachingSSLContext)
+    assert context.verify_mode == ssl.CERT_REQUIRED and context.check_hostname
+    assert Client(1).ssl_context is Client(2).ssl_context is ClientPool().ssl_context is context
+    assert Client(1, secure=False).ssl_context is None
+
+
+@pytest.mark.asyncio
+async def test_session_resumption(certificate: tuple[pathlib.Path, pathlib.Path]):
+    cert, key = certificate
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert, key)
+
+    async def server_task_handler(ws: ServerConnection):
+        await ws.send('[{"cmd":"Bounced","slots":[1]}]')
+        await ws.wait_closed()
+
+    async with serve(server_task_handler, "localhost", 0, ssl=server_context) as server:
+        port: int = next(iter(server.sockets)).getsockname()[1]
+        context: SessionCachingSSLContext = create_session_caching_context(cafile=str(cert))
+        assert context.get_session("localhost") is None
+
+        for _ in range(3):
+            bounced = asyncio.Event()
+            client = Client(port, host="localhost", ssl_context=context)
+
+            async def on_bounced(_packet, bounced: asyncio.Event = bounced):
+                bounced.set()
+
+            client.on_bounced = on_bounced
+
+            async with client:
+                await asyncio.wait_for(bounced.wait(), 2)
+
+        # the first connection does a full handshake, reconnects resume its session
+        assert (context.handshakes, context.resumed) == (3, 2)
+
+        context.clear_sessions()
+        assert context.get_session("localhost") is None